@@ -0,0 +1,18 @@
+#!/usr/bin/env bash
+# Pre-parse the feature manifests and the metric-hub outcomes and segments, so
+# web and worker processes load them from pickles instead of parsing YAML and
+# TOML on startup. The commands only read files, so settings without a default
+# get placeholder values when they are unset, as they are in a docker build.
+set -euo pipefail
+
+for name in SECRET_KEY HOSTNAME DB_NAME DB_USER DB_PASS DB_HOST OPENIDC_HEADER \
+    EMAIL_SENDER EMAIL_HOST EMAIL_PORT EMAIL_HOST_USER EMAIL_HOST_PASSWORD \
+    EMAIL_REVIEW EMAIL_SHIP EMAIL_RELEASE_DRIVERS BUGZILLA_HOST BUGZILLA_API_KEY \
+    REDIS_HOST REDIS_PORT REDIS_DB STATSD_HOST STATSD_PORT STATSD_PREFIX \
+    NORMANDY_API_HOST NORMANDY_DEVTOOLS_HOST KINTO_HOST KINTO_USER KINTO_PASS; do
+    export "$name=${!name-}"
+done
+export KINTO_REVIEW_TIMEOUT="${KINTO_REVIEW_TIMEOUT-0}"
+
+python manage.py build_features_cache
+python manage.py build_metric_hub_cache
@@ -0,0 +1,8 @@
+class Tags:
+    # Checks that load outcomes, segments, and feature manifests from disk.
+    #
+    # These are registered as deployment checks so that they do not slow down
+    # every management command. Run them with:
+    #
+    #   python manage.py check --deploy --tag external_data
+    external_data = "external_data"
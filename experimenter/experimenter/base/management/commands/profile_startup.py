@@ -0,0 +1,123 @@
+import logging
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+from django.core import checks
+from django.core.management.base import BaseCommand
+
+logger = logging.getLogger()
+
+IMPORT_TIME_RE = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|"
+    r"(?P<indent> +)(?P<module>\S+)$"
+)
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    """Parse the output of ``python -X importtime``."""
+    import_times = []
+
+    for line in output.splitlines():
+        if match := IMPORT_TIME_RE.match(line):
+            import_times.append(
+                ImportTime(
+                    module=match["module"],
+                    self_us=int(match["self"]),
+                    cumulative_us=int(match["cumulative"]),
+                    depth=(len(match["indent"]) - 1) // 2,
+                )
+            )
+
+    return import_times
+
+
+class Command(BaseCommand):
+    help = "Report where time is spent importing modules and running system checks"
+
+    # This command times the system checks itself.
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--module",
+            default="experimenter.celery",
+            help="The module to import after setting up Django",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="The number of slowest imports to report",
+        )
+        parser.add_argument(
+            "--checks",
+            action="store_true",
+            help="Also time each registered system check, including deploy checks",
+        )
+
+    def handle(self, *args, **options):
+        module = options["module"]
+
+        # Modules are only imported once per process, so imports have to be
+        # profiled in a fresh interpreter.
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                f"import django; django.setup(); import {module}",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        import_times = parse_import_times(result.stderr)
+
+        total_us = sum(i.cumulative_us for i in import_times if i.depth == 0)
+        logger.info(
+            f"Imported {len(import_times)} modules for {module} in "
+            f"{total_us / 1_000_000:.2f}s"
+        )
+
+        limit = options["limit"]
+        by_cumulative = sorted(import_times, key=lambda i: i.cumulative_us, reverse=True)
+        by_self = sorted(import_times, key=lambda i: i.self_us, reverse=True)
+
+        logger.info("Slowest imports (cumulative):")
+        for import_time in by_cumulative[:limit]:
+            logger.info(
+                f"{import_time.cumulative_us / 1000:10.1f}ms  {import_time.module}"
+            )
+
+        logger.info("Slowest imports (self):")
+        for import_time in by_self[:limit]:
+            logger.info(f"{import_time.self_us / 1000:10.1f}ms  {import_time.module}")
+
+        if options["checks"]:
+            self.profile_checks()
+
+    def profile_checks(self):
+        logger.info("System checks:")
+
+        for check in checks.registry.get_checks(include_deployment_checks=True):
+            start = time.monotonic()
+            check(app_configs=None, databases=None)
+            duration = time.monotonic() - start
+
+            deploy = " (deploy)" if check in checks.registry.deployment_checks else ""
+            logger.info(
+                f"{duration * 1000:10.1f}ms  "
+                f"{check.__module__}.{check.__qualname__}{deploy}"
+            )
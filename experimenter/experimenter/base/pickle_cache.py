@@ -0,0 +1,54 @@
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+# Raised when a cache file is missing, truncated or corrupt, or was pickled by
+# code that has since moved or changed.
+LOAD_ERRORS = (OSError, EOFError, AttributeError, ImportError, pickle.PickleError)
+
+
+def load(path: Path) -> Optional[Any]:
+    """Unpickle the cache file at path, or return None if it cannot be read."""
+    try:
+        with path.open("rb") as cache_file:
+            return pickle.load(cache_file)
+    except LOAD_ERRORS:
+        return None
+
+
+def loads(data: bytes) -> Optional[Any]:
+    """Unpickle a value from a cache file, or return None if it cannot be read."""
+    try:
+        return pickle.loads(data)
+    except LOAD_ERRORS:
+        return None
+
+
+def dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def dump(path: Path, value: Any):
+    """Pickle value to path. The file is replaced atomically, so a process that
+    loads it at the same time never sees a partial write."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as cache_file:
+        pickle.dump(value, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(path)
+
+
+def load_hashed(path: Path, value_hash: str) -> Optional[Any]:
+    """Load a value written by dump_hashed, or return None if it cannot be read
+    or was built from inputs with a different hash."""
+    cached = load(path)
+    if not isinstance(cached, tuple) or len(cached) != 2 or cached[0] != value_hash:
+        return None
+
+    return cached[1]
+
+
+def dump_hashed(path: Path, value_hash: str, value: Any):
+    """Pickle value to path together with the hash of the inputs it was built
+    from."""
+    dump(path, (value_hash, value))
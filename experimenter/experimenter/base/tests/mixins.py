@@ -1,5 +1,9 @@
+import tempfile
+from pathlib import Path
 from unittest import mock
 
+from django.test import override_settings
+
 from experimenter.openidc.tests.factories import UserFactory
 
 
@@ -10,3 +14,18 @@ class MockRequestMixin:
         self.user = UserFactory()
         self.request = mock.Mock()
         self.request.user = self.user
+
+
+class TemporaryPathSettingsMixin:
+    def override_temporary_path(self, setting, filename=""):
+        """Point a path setting at a new temporary directory, or at filename in
+        that directory, until the test finishes."""
+        temporary_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_dir.cleanup)
+        path = Path(temporary_dir.name) / filename
+
+        settings_override = override_settings(**{setting: path})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        return path
@@ -0,0 +1,44 @@
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase
+
+from experimenter.base import pickle_cache
+
+
+class TestPickleCache(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_dir = Path(cache_dir.name)
+        self.cache_path = self.cache_dir / "cache.pickle"
+
+    def test_dump_and_load(self):
+        pickle_cache.dump(self.cache_path, {"key": [1, 2, 3]})
+
+        self.assertEqual(pickle_cache.load(self.cache_path), {"key": [1, 2, 3]})
+        self.assertEqual(list(self.cache_dir.iterdir()), [self.cache_path])
+
+    def test_load_returns_none_without_file(self):
+        self.assertIsNone(pickle_cache.load(self.cache_path))
+
+    def test_load_returns_none_for_invalid_file(self):
+        self.cache_path.write_bytes(b"not a pickle")
+
+        self.assertIsNone(pickle_cache.load(self.cache_path))
+
+    def test_loads_returns_none_for_invalid_data(self):
+        self.assertEqual(pickle_cache.loads(pickle_cache.dumps([1])), [1])
+        self.assertIsNone(pickle_cache.loads(b"not a pickle"))
+
+    def test_load_hashed_checks_hash(self):
+        pickle_cache.dump_hashed(self.cache_path, "hash", [1])
+
+        self.assertEqual(pickle_cache.load_hashed(self.cache_path, "hash"), [1])
+        self.assertIsNone(pickle_cache.load_hashed(self.cache_path, "other"))
+
+    def test_load_hashed_ignores_other_formats(self):
+        pickle_cache.dump(self.cache_path, {"hash": "hash", "value": [1]})
+
+        self.assertIsNone(pickle_cache.load_hashed(self.cache_path, "hash"))
@@ -0,0 +1,116 @@
+import subprocess
+import sys
+from unittest import mock
+
+from django.core import checks
+from django.core.management import call_command
+from django.test import TestCase
+
+from experimenter.base.checks import Tags
+from experimenter.base.management.commands.profile_startup import (
+    ImportTime,
+    parse_import_times,
+)
+from experimenter.features import check_features
+from experimenter.outcomes import check_outcome_tomls
+from experimenter.segments import check_segment_tomls
+
+IMPORT_TIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       210 |        210 |   _io
+import time:       439 |        649 | _frozen_importlib_external
+import time:        51 |         51 |     _json
+import time:      1500 |       1551 |   json.decoder
+import time:       300 |       2000 | json
+"""
+
+
+class TestProfileStartup(TestCase):
+    def test_parse_import_times(self):
+        self.assertEqual(
+            parse_import_times(IMPORT_TIME_OUTPUT),
+            [
+                ImportTime("_io", 210, 210, 1),
+                ImportTime("_frozen_importlib_external", 439, 649, 0),
+                ImportTime("_json", 51, 51, 2),
+                ImportTime("json.decoder", 1500, 1551, 1),
+                ImportTime("json", 300, 2000, 0),
+            ],
+        )
+
+    @mock.patch(
+        "experimenter.base.management.commands.profile_startup.subprocess.run",
+        return_value=subprocess.CompletedProcess([], 0, "", IMPORT_TIME_OUTPUT),
+    )
+    def test_profile_startup(self, mock_run):
+        with self.assertLogs() as logs:
+            call_command("profile_startup", "--module", "json", "--limit", "2")
+
+        mock_run.assert_called_once_with(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                "import django; django.setup(); import json",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(
+            [record.getMessage() for record in logs.records],
+            [
+                "Imported 5 modules for json in 0.00s",
+                "Slowest imports (cumulative):",
+                "       2.0ms  json",
+                "       1.6ms  json.decoder",
+                "Slowest imports (self):",
+                "       1.5ms  json.decoder",
+                "       0.4ms  _frozen_importlib_external",
+            ],
+        )
+
+    @mock.patch(
+        "experimenter.base.management.commands.profile_startup.subprocess.run",
+        return_value=subprocess.CompletedProcess([], 0, "", ""),
+    )
+    def test_profile_startup_checks(self, mock_run):
+        def check_fast(app_configs, **kwargs):
+            return []
+
+        def check_deploy(app_configs, **kwargs):
+            return []
+
+        with (
+            mock.patch.object(
+                checks.registry,
+                "get_checks",
+                return_value=[check_fast, check_deploy],
+            ),
+            mock.patch.object(checks.registry, "deployment_checks", {check_deploy}),
+            self.assertLogs() as logs,
+        ):
+            call_command("profile_startup", "--checks")
+
+        messages = [record.getMessage() for record in logs.records]
+        self.assertIn("System checks:", messages)
+        self.assertTrue(
+            any(
+                m.endswith("test_profile_startup_checks.<locals>.check_fast")
+                for m in messages
+            )
+        )
+        self.assertTrue(
+            any(
+                m.endswith("test_profile_startup_checks.<locals>.check_deploy (deploy)")
+                for m in messages
+            )
+        )
+
+    def test_external_data_checks_are_deploy_checks(self):
+        for check in (check_features, check_outcome_tomls, check_segment_tomls):
+            self.assertEqual(check.tags, (Tags.external_data,))
+            self.assertIn(check, checks.registry.deployment_checks)
+            self.assertNotIn(check, checks.registry.get_checks())
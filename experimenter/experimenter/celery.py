@@ -1,6 +1,7 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_init
 
 # set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "experimenter.settings")
@@ -15,3 +16,12 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
+
+
+@worker_init.connect
+def preload_fml_clients(**kwargs):
+    # worker_init runs in the main worker process before the pool forks, so the
+    # pool processes start with the clients already loaded.
+    from experimenter.features.manifests.nimbus_fml_loader import NimbusFmlLoader
+
+    NimbusFmlLoader.preload_clients()
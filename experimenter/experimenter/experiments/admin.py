@@ -34,7 +34,7 @@ from experimenter.settings import DEV_USER_EMAIL
 @admin.action(description="Force jetstream data fetch.")
 def force_fetch_jetstream_data(modeladmin, request, queryset):
     for experiment in queryset:
-        tasks.fetch_experiment_data.delay(experiment.id)
+        tasks.fetch_experiment_data.delay(experiment.id, force=True)
 
 
 # Monkeypatch DecimalWidget render fn to work around a bug exporting Decimal to YAML
@@ -391,6 +391,11 @@ class NimbusVersionedSchemaInlineAdmin(
     ReadOnlyAdminMixin, admin.TabularInline[NimbusVersionedSchema]
 ):
     model = NimbusVersionedSchema
+    fields = ("version", "schema", "set_pref_vars", "is_early_startup")
+    readonly_fields = ("schema",)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("version", "schema_content")
 
 
 class NimbusFeatureConfigAdmin(ReadOnlyAdminMixin, admin.ModelAdmin[NimbusFeatureConfig]):
@@ -6,6 +6,10 @@ from experimenter.experiments.api.v5.types import (
     NimbusExperimentType,
 )
 from experimenter.experiments.models import NimbusExperiment
+from experimenter.jetstream.client import (
+    get_population_sizing_index,
+    lookup_population_sizing_targets,
+)
 
 
 class Query(graphene.ObjectType):
@@ -28,6 +32,15 @@ class Query(graphene.ObjectType):
         NimbusConfigurationType,
         description="Nimbus Configuration Data for front-end usage.",
     )
+    population_sizing_targets = graphene.NonNull(
+        graphene.String,
+        description="Population sizing targets matching an audience, as a JSON list.",
+        app_id=graphene.String(required=True),
+        channel=graphene.String(),
+        country=graphene.String(),
+        locale=graphene.String(description="Locale or language of the target."),
+        new_or_existing=graphene.String(),
+    )
 
     def resolve_experiments(self, info):
         return NimbusExperiment.objects.with_owner_features()
@@ -43,3 +56,8 @@ class Query(graphene.ObjectType):
 
     def resolve_nimbus_config(self, info):
         return NimbusConfigurationType()
+
+    def resolve_population_sizing_targets(self, info, app_id, **filters):
+        return lookup_population_sizing_targets(
+            get_population_sizing_index(), app_id, **filters
+        )
@@ -6,6 +6,7 @@ import logging
 import re
 import typing
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, NotRequired, Optional, Self, TypedDict
 
@@ -35,6 +36,7 @@ from experimenter.experiments.models import (
     NimbusExperimentBranchThroughExcluded,
     NimbusExperimentBranchThroughRequired,
     NimbusFeatureConfig,
+    NimbusFeatureSchema,
     NimbusFeatureVersion,
     NimbusVersionedSchema,
 )
@@ -135,6 +137,56 @@ class NestedRefResolver(jsonschema.RefResolver):
                     self.store[dfn["$id"]] = dfn
 
 
+class SchemaValidatorCache:
+    """A process-wide cache of compiled JSON schema validators.
+
+    Validators are keyed by the hash of the schema text, so each distinct schema
+    is parsed and checked against its metaschema only once per process, no matter
+    how many feature versions, branches, or locales share it.
+    """
+
+    _validators: dict[str, jsonschema.protocols.Validator] = {}
+
+    @staticmethod
+    def schema_hash(schema: str) -> str:
+        return NimbusFeatureSchema.hash_schema(schema)
+
+    @staticmethod
+    def _build_validator(schema: str) -> jsonschema.protocols.Validator:
+        json_schema = json.loads(schema)
+        validator_cls = jsonschema.validators.validator_for(json_schema)
+        validator_cls.check_schema(json_schema)
+        return validator_cls(json_schema, resolver=NestedRefResolver(json_schema))
+
+    @classmethod
+    def get(cls, schema: str) -> jsonschema.protocols.Validator:
+        key = cls.schema_hash(schema)
+
+        if (validator := cls._validators.get(key)) is None:
+            validator = cls._validators[key] = cls._build_validator(schema)
+
+        return validator
+
+    @classmethod
+    def get_for_versioned_schema(
+        cls, versioned_schema: NimbusVersionedSchema
+    ) -> jsonschema.protocols.Validator:
+        # Versioned schemas reference their schema text by hash, so the text is
+        # only loaded from the database the first time a schema is seen.
+        key = versioned_schema.schema_hash
+
+        if (validator := cls._validators.get(key)) is None:
+            validator = cls._validators[key] = cls._build_validator(
+                versioned_schema.schema
+            )
+
+        return validator
+
+    @classmethod
+    def clear_cache(cls):
+        cls._validators = {}
+
+
 _SerializerT = typing.TypeVar("_SerializerT", bound=serializers.ModelSerializer)
 
 
@@ -1233,9 +1285,18 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
             str, NimbusFeatureConfig.VersionedSchemaRange
         ] = {}
 
-        self.desktop_setpref_schemas: Optional[
-            dict[NimbusFeatureConfig, NimbusVersionedSchema]
-        ] = None
+        # A cache of FML errors, keyed by (feature slug, version, feature value),
+        # so identical feature values across branches are only checked once.
+        self.fml_errors: dict[
+            tuple[str, Optional[NimbusFeatureVersion], str], list[Any]
+        ] = {}
+
+        # A cache of NimbusVersionedSchema.desktop_set_pref_index() results,
+        # keyed by version range.
+        self.desktop_setpref_index: dict[
+            tuple[packaging.version.Version, Optional[packaging.version.Version]],
+            dict[str, dict[str, list[packaging.version.Version]]],
+        ] = {}
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
@@ -1506,16 +1567,16 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
         json_value = json.loads(value)
         schema_versions = defaultdict(list)
         for schema in schemas_in_range.schemas:
-            schema_versions[schema.schema].append(schema)
+            schema_versions[schema.schema_hash].append(schema)
 
-        for schema_str, schemas in schema_versions.items():
-            if schema_str is None:
+        for schema_hash, schemas in schema_versions.items():
+            if schema_hash is None:
                 continue
-            json_schema = json.loads(schema_str)
+            validator = SchemaValidatorCache.get_for_versioned_schema(schemas[0])
             versions = [s.version for s in schemas]
             if not localizations:
                 result.extend(
-                    self._validate_schema(json_value, json_schema, versions),
+                    self._validate_schema(json_value, validator, versions),
                     suppress_errors,
                 )
             else:
@@ -1529,7 +1590,7 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
                         continue
 
                     if schema_errors := self._validate_schema(
-                        substituted_value, json_schema, versions
+                        substituted_value, validator, versions
                     ):
                         for schema_error, version in zip(schema_errors, versions):
                             err_msg = (
@@ -1585,50 +1646,29 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
     ) -> ValidateFeatureResult:
         result = self.ValidateFeatureResult()
 
-        if not self.desktop_setpref_schemas:
-            schemas = (
-                NimbusVersionedSchema.objects.filter(
-                    NimbusFeatureVersion.objects.between_versions_q(
-                        min_version,
-                        max_version,
-                        prefix="version",
-                    ),
-                    feature_config__application=NimbusExperiment.Application.DESKTOP,
-                )
-                .exclude(set_pref_vars={})
-                .prefetch_related("feature_config", "version")
+        range_key = (min_version, max_version)
+        if (setpref_index := self.desktop_setpref_index.get(range_key)) is None:
+            setpref_index = self.desktop_setpref_index[range_key] = (
+                NimbusVersionedSchema.desktop_set_pref_index(min_version, max_version)
             )
 
-            self.desktop_setpref_schemas = {}
-            for schema in schemas:
-                self.desktop_setpref_schemas.setdefault(schema.feature_config, []).append(
-                    schema
-                )
-
         for pref in value.get("prefs", {}):
-            for feature_config, schemas in self.desktop_setpref_schemas.items():
-                conflicting_versions = []
-
-                for schema in schemas:
-                    if pref in schema.set_pref_vars.values():
-                        conflicting_versions.append(schema.version.as_packaging_version())
-
-                if conflicting_versions:
-                    if len(conflicting_versions) == 1:
-                        versions = str(conflicting_versions[0])
-                    else:
-                        versions = (
-                            f"{min(conflicting_versions)}-{max(conflicting_versions)}"
-                        )
+            for feature_config_slug, conflicting_versions in setpref_index.get(
+                pref, {}
+            ).items():
+                if len(conflicting_versions) == 1:
+                    versions = str(conflicting_versions[0])
+                else:
+                    versions = f"{min(conflicting_versions)}-{max(conflicting_versions)}"
 
-                    msg = NimbusConstants.WARNING_FEATURE_VALUE_IN_VERSIONS.format(
-                        versions=versions,
-                        warning=NimbusConstants.WARNING_PREF_FLIPS_PREF_CONTROLLED_BY_FEATURE.format(
-                            pref=pref, feature_config_slug=feature_config.slug
-                        ),
-                    )
+                msg = NimbusConstants.WARNING_FEATURE_VALUE_IN_VERSIONS.format(
+                    versions=versions,
+                    warning=NimbusConstants.WARNING_PREF_FLIPS_PREF_CONTROLLED_BY_FEATURE.format(
+                        pref=pref, feature_config_slug=feature_config_slug
+                    ),
+                )
 
-                    result.append(msg, warning=True)
+                result.append(msg, warning=True)
 
         return result
 
@@ -1686,9 +1726,58 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
 
         return result
 
-    @classmethod
+    def _get_fml_errors(
+        self,
+        loader: NimbusFmlLoader,
+        feature_slug: str,
+        version: Optional[NimbusFeatureVersion],
+        blob: str,
+    ):
+        key = (feature_slug, version, blob)
+        if (fml_errors := self.fml_errors.get(key)) is None:
+            fml_errors = self.fml_errors[key] = loader.get_fml_errors(
+                blob, feature_slug, version
+            )
+        return fml_errors
+
+    def _prefetch_fml_errors(self, loader: NimbusFmlLoader, branches: list[dict]):
+        """Check every distinct feature value against each FML manifest in range
+        concurrently, one thread per version, so that each version's FmlClient
+        is only loaded by a single thread.
+        """
+        checks_by_version = defaultdict(set)
+        for branch in branches:
+            for feature_value_data in branch.get("feature_values", []):
+                feature_slug = feature_value_data["feature_config"].slug
+                if (
+                    schemas_in_range := self.schemas_by_feature_id.get(feature_slug)
+                ) is None:
+                    continue
+
+                for schema in schemas_in_range.schemas:
+                    checks_by_version[schema.version].add(
+                        (feature_slug, feature_value_data["value"])
+                    )
+
+        def check_version(version, checks):
+            return [
+                (
+                    (feature_slug, version, blob),
+                    loader.get_fml_errors(blob, feature_slug, version),
+                )
+                for feature_slug, blob in checks
+            ]
+
+        with ThreadPoolExecutor(
+            max_workers=settings.FML_VALIDATION_MAX_WORKERS
+        ) as executor:
+            for results in executor.map(
+                lambda item: check_version(*item), checks_by_version.items()
+            ):
+                self.fml_errors.update(results)
+
     def _validate_feature_value_with_fml(
-        cls,
+        self,
         schemas_in_range: NimbusFeatureConfig.VersionedSchemaRange,
         loader: NimbusFmlLoader,
         feature_config: NimbusFeatureConfig,
@@ -1697,8 +1786,8 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
         errors = []
         schema_errors_versions = defaultdict(set)
         for schema in schemas_in_range.schemas:
-            for fml_error in loader.get_fml_errors(
-                blob, feature_config.slug, schema.version
+            for fml_error in self._get_fml_errors(
+                loader, feature_config.slug, schema.version, blob
             ):
                 schema_errors_versions[fml_error.message].add(schema.version)
 
@@ -1718,13 +1807,11 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
     def _validate_schema(
         cls,
         obj: Any,
-        schema: dict[str, Any],
+        validator: jsonschema.protocols.Validator,
         versions: list[Optional[NimbusFeatureVersion]],
     ) -> list[str]:
-        try:
-            jsonschema.validate(obj, schema, resolver=NestedRefResolver(schema))
-        except jsonschema.ValidationError as e:
-            err_msg = e.message
+        if error := jsonschema.exceptions.best_match(validator.iter_errors(obj)):
+            err_msg = error.message
             return [
                 f"{err_msg} at version {version}" if version is not None else err_msg
                 for version in versions
@@ -1770,20 +1857,31 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
 
         # Cache the versioned schema range for each feature so we can re-use
         # them in the validation for each branch.
+        branch_feature_configs = [
+            feature_value_data["feature_config"]
+            for feature_value_data in reference_branch.get("feature_values", [])
+        ]
+        schema_ranges = NimbusFeatureConfig.get_versioned_schema_ranges(
+            branch_feature_configs,
+            min_version,
+            max_version,
+        )
         self.schemas_by_feature_id = {
-            feature_config.slug: feature_config.get_versioned_schema_range(
-                min_version,
-                max_version,
-            )
-            for feature_config in (
-                feature_value_data["feature_config"]
-                for feature_value_data in reference_branch.get(
-                    "feature_values",
-                    [],
-                )
-            )
+            feature_config.slug: schema_ranges[feature_config.id]
+            for feature_config in branch_feature_configs
         }
 
+        if (
+            self.instance.application != NimbusExperiment.Application.DESKTOP
+            and settings.FML_VALIDATION_MAX_WORKERS > 1
+        ):
+            self._prefetch_fml_errors(
+                NimbusFmlLoader.create_loader(
+                    self.instance.application, data.get("channel")
+                ),
+                [reference_branch, *data.get("treatment_branches", [])],
+            )
+
         result = self._validate_branches(data=data)
 
         if any(result.warnings):
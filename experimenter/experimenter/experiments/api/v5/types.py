@@ -276,6 +276,12 @@ class NimbusChangeLogType(DjangoObjectType):
         )
 
 
+class NimbusResultsSummaryType(graphene.ObjectType):
+    has_displayable_results = graphene.NonNull(graphene.Boolean)
+    error_count = graphene.NonNull(graphene.Int)
+    primary_metric_significance = graphene.JSONString()
+
+
 class NimbusSignoffRecommendationsType(graphene.ObjectType):
     qa_signoff = graphene.Boolean()
     vp_signoff = graphene.Boolean()
@@ -384,7 +390,9 @@ class NimbusConfigurationType(graphene.ObjectType):
 
     def resolve_all_feature_configs(self, info):
         return (
-            NimbusFeatureConfig.objects.all().prefetch_related("schemas").order_by("name")
+            NimbusFeatureConfig.objects.all()
+            .prefetch_related("schemas__schema_content")
+            .order_by("name")
         )
 
     def resolve_firefox_versions(self, info):
@@ -397,7 +405,7 @@ class NimbusConfigurationType(graphene.ObjectType):
 
     def resolve_population_sizing_data(self, info):
         sizing_data = cache.get(SIZING_DATA_KEY)
-        return sizing_data.json() if sizing_data else "{}"
+        return sizing_data if isinstance(sizing_data, str) else "{}"
 
     @staticmethod
     def sort_version_choices(choices):
@@ -564,6 +572,7 @@ class NimbusExperimentType(DjangoObjectType):
     )
     results_expected_date = graphene.DateTime()
     results_ready = graphene.Boolean()
+    results_summary = graphene.Field(NimbusResultsSummaryType)
     review_request = graphene.Field(NimbusChangeLogType)
     review_url = graphene.String()
     risk_mitigation_link = graphene.String()
@@ -646,6 +655,7 @@ class NimbusExperimentType(DjangoObjectType):
             "rejection",
             "results_expected_date",
             "results_ready",
+            "results_summary",
             "review_request",
             "review_url",
             "risk_brand",
@@ -755,6 +765,9 @@ class NimbusExperimentType(DjangoObjectType):
     def resolve_review_request(self, info):
         return self.changes.latest_review_request()
 
+    def resolve_results_summary(self, info):
+        return getattr(self, "analysis_summary", None)
+
     def resolve_rejection(self, info):
         return self.changes.latest_rejection()
 
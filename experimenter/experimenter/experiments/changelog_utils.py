@@ -61,7 +61,7 @@ class NimbusExperimentChangeLogSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = NimbusExperiment
-        exclude = ("id",)
+        exclude = ("id", "results_data")
 
 
 def generate_nimbus_changelog(experiment, changed_by, message, changed_on=None):
@@ -0,0 +1,58 @@
+# Generated by Django 5.1 on 2026-10-19 12:00
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("experiments", "0273_nimbusexperiment_segments"),
+    ]
+
+    operations = [
+        # The column is generated and stored by Postgres, so existing rows are
+        # backfilled when the column is added.
+        migrations.AddField(
+            model_name="nimbusfeatureversion",
+            name="packed",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    django.db.models.expressions.CombinedExpression(
+                        django.db.models.expressions.CombinedExpression(
+                            models.F("major"),
+                            "*",
+                            django.db.models.expressions.Value(1000000),
+                        ),
+                        "+",
+                        django.db.models.expressions.CombinedExpression(
+                            models.F("minor"),
+                            "*",
+                            django.db.models.expressions.Value(1000),
+                        ),
+                    ),
+                    "+",
+                    models.F("patch"),
+                ),
+                output_field=models.BigIntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="nimbusfeatureversion",
+            index=models.Index(fields=["packed"], name="experiments_packed_993f15_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="nimbusfeatureversion",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("minor__gte", 0), ("minor__lt", 1000)),
+                name="nimbusfeatureversion_minor_packable",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="nimbusfeatureversion",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("patch__gte", 0), ("patch__lt", 1000)),
+                name="nimbusfeatureversion_patch_packable",
+            ),
+        ),
+    ]
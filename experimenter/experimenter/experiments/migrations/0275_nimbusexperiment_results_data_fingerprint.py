@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-19 12:30
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("experiments", "0274_nimbusfeatureversion_packed"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="nimbusexperiment",
+            name="results_data_fingerprint",
+            field=models.JSONField(
+                blank=True,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                null=True,
+                verbose_name="Results Data Fingerprint",
+            ),
+        ),
+    ]
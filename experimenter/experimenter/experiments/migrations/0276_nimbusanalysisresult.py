@@ -0,0 +1,136 @@
+# Generated by Django 5.1 on 2026-10-19 14:05
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+WINDOWS = ("daily", "weekly", "overall")
+
+
+def move_results_data(apps, schema_editor):
+    NimbusExperiment = apps.get_model("experiments", "NimbusExperiment")
+    NimbusAnalysisResult = apps.get_model("experiments", "NimbusAnalysisResult")
+
+    experiments = (
+        NimbusExperiment.objects.exclude(results_data=None)
+        .only("id", "results_data")
+        .iterator(chunk_size=100)
+    )
+    for experiment in experiments:
+        results_data = experiment.results_data.get("v3")
+        if results_data is None:
+            continue
+
+        experiment_data = {}
+        results = [
+            NimbusAnalysisResult(
+                experiment=experiment,
+                window="",
+                analysis_basis="",
+                segment="",
+                data=experiment_data,
+            )
+        ]
+        for key, value in results_data.items():
+            if key in WINDOWS and value is not None:
+                experiment_data[key] = {analysis_basis: {} for analysis_basis in value}
+                for analysis_basis, segments in value.items():
+                    for segment, data in segments.items():
+                        results.append(
+                            NimbusAnalysisResult(
+                                experiment=experiment,
+                                window=key,
+                                analysis_basis=analysis_basis,
+                                segment=segment,
+                                data=data,
+                            )
+                        )
+            else:
+                experiment_data[key] = value
+
+        NimbusAnalysisResult.objects.bulk_create(results)
+
+
+def restore_results_data(apps, schema_editor):
+    NimbusExperiment = apps.get_model("experiments", "NimbusExperiment")
+    NimbusAnalysisResult = apps.get_model("experiments", "NimbusAnalysisResult")
+
+    def save(experiment_id, data):
+        NimbusExperiment.objects.filter(id=experiment_id).update(
+            results_data={"v3": data}
+        )
+
+    experiment_id = None
+    results_data = None
+    results = NimbusAnalysisResult.objects.order_by(
+        "experiment_id", "window", "id"
+    ).iterator(chunk_size=100)
+    for result in results:
+        if result.experiment_id != experiment_id:
+            if experiment_id is not None:
+                save(experiment_id, results_data)
+            experiment_id = result.experiment_id
+
+        if not result.window:
+            results_data = result.data
+        else:
+            results_data[result.window].setdefault(result.analysis_basis, {})[
+                result.segment
+            ] = result.data
+
+    if experiment_id is not None:
+        save(experiment_id, results_data)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("experiments", "0275_nimbusexperiment_results_data_fingerprint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NimbusAnalysisResult",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("window", models.CharField(blank=True, max_length=255)),
+                ("analysis_basis", models.CharField(blank=True, max_length=255)),
+                ("segment", models.CharField(blank=True, max_length=255)),
+                (
+                    "data",
+                    models.JSONField(
+                        blank=True,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        null=True,
+                    ),
+                ),
+                (
+                    "experiment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="analysis_results",
+                        to="experiments.nimbusexperiment",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Nimbus Analysis Result",
+                "verbose_name_plural": "Nimbus Analysis Results",
+                "ordering": ("id",),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("experiment", "window", "analysis_basis", "segment"),
+                        name="unique_analysis_result",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(move_results_data, restore_results_data),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.1 on 2026-10-19 16:20
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("experiments", "0276_nimbusanalysisresult"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NimbusAnalysisSummary",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("has_displayable_results", models.BooleanField(default=False)),
+                ("error_count", models.PositiveIntegerField(default=0)),
+                (
+                    "primary_metric_significance",
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                (
+                    "experiment",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="analysis_summary",
+                        to="experiments.nimbusexperiment",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Nimbus Analysis Summary",
+                "verbose_name_plural": "Nimbus Analysis Summaries",
+            },
+        ),
+    ]
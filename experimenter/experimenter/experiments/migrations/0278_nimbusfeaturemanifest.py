@@ -0,0 +1,72 @@
+# Generated by Django 5.1 on 2026-10-19 17:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("experiments", "0277_nimbusanalysissummary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NimbusFeatureManifest",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "application",
+                    models.CharField(
+                        choices=[
+                            ("firefox-desktop", "Firefox Desktop"),
+                            ("fenix", "Firefox for Android (Fenix)"),
+                            ("ios", "Firefox for iOS"),
+                            ("focus-android", "Focus for Android"),
+                            ("klar-android", "Klar for Android"),
+                            ("focus-ios", "Focus for iOS"),
+                            ("klar-ios", "Klar for iOS"),
+                            ("monitor-web", "Monitor Web"),
+                            ("vpn-web", "VPN Web"),
+                            ("fxa-web", "Firefox Accounts Web"),
+                            ("demo-app", "Demo App"),
+                        ],
+                        max_length=255,
+                    ),
+                ),
+                ("content_hash", models.CharField(max_length=64)),
+                (
+                    "version",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="manifests",
+                        to="experiments.nimbusfeatureversion",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Nimbus Feature Manifest",
+                "verbose_name_plural": "Nimbus Feature Manifests",
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("version__isnull", False)),
+                        fields=("application", "version"),
+                        name="unique_versioned_feature_manifest",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("version__isnull", True)),
+                        fields=("application",),
+                        name="unique_unversioned_feature_manifest",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.1 on 2026-10-19 17:40
+
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def deduplicate_schemas(apps, schema_editor):
+    NimbusFeatureSchema = apps.get_model("experiments", "NimbusFeatureSchema")
+    NimbusVersionedSchema = apps.get_model("experiments", "NimbusVersionedSchema")
+
+    schema_ids = {}
+    schemas = {}
+    for schema_id, schema in (
+        NimbusVersionedSchema.objects.exclude(schema=None)
+        .values_list("id", "schema")
+        .iterator()
+    ):
+        schema_hash = hashlib.sha256(schema.encode()).hexdigest()
+        schemas.setdefault(schema_hash, schema)
+        schema_ids.setdefault(schema_hash, []).append(schema_id)
+
+    NimbusFeatureSchema.objects.bulk_create(
+        NimbusFeatureSchema(hash=schema_hash, schema=schema)
+        for schema_hash, schema in schemas.items()
+    )
+    for schema_hash, ids in schema_ids.items():
+        NimbusVersionedSchema.objects.filter(id__in=ids).update(
+            schema_content_id=schema_hash
+        )
+
+
+def duplicate_schemas(apps, schema_editor):
+    NimbusFeatureSchema = apps.get_model("experiments", "NimbusFeatureSchema")
+    NimbusVersionedSchema = apps.get_model("experiments", "NimbusVersionedSchema")
+
+    for feature_schema in NimbusFeatureSchema.objects.iterator():
+        NimbusVersionedSchema.objects.filter(
+            schema_content_id=feature_schema.hash
+        ).update(schema=feature_schema.schema)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("experiments", "0278_nimbusfeaturemanifest"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NimbusFeatureSchema",
+            fields=[
+                (
+                    "hash",
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ("schema", models.TextField()),
+            ],
+            options={
+                "verbose_name": "Nimbus Feature Schema",
+                "verbose_name_plural": "Nimbus Feature Schemas",
+            },
+        ),
+        migrations.AddField(
+            model_name="nimbusversionedschema",
+            name="schema_content",
+            field=models.ForeignKey(
+                blank=True,
+                db_column="schema_hash",
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="versioned_schemas",
+                to="experiments.nimbusfeatureschema",
+            ),
+        ),
+        migrations.RunPython(deduplicate_schemas, duplicate_schemas),
+        # Keep the old column under a new field name, since processes still
+        # running the previous release read it. Neither operation changes the
+        # database.
+        migrations.AlterField(
+            model_name="nimbusversionedschema",
+            name="schema",
+            field=models.TextField(blank=True, db_column="schema", null=True),
+        ),
+        migrations.RenameField(
+            model_name="nimbusversionedschema",
+            old_name="schema",
+            new_name="legacy_schema",
+        ),
+    ]
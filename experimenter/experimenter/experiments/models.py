@@ -1,5 +1,6 @@
 import copy
 import datetime
+import hashlib
 import json
 from collections import defaultdict
 from dataclasses import dataclass
@@ -17,7 +18,7 @@ from django.contrib.postgres.fields import ArrayField
 from django.core.files.base import ContentFile
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Count, F, Q, QuerySet
 from django.db.models.constraints import UniqueConstraint
 from django.urls import reverse
@@ -65,8 +66,13 @@ class NimbusExperimentManager(models.Manager["NimbusExperiment"]):
     def with_owner_features(self):
         return (
             self.get_queryset()
+            .select_related("analysis_summary")
             .prefetch_related(
-                "owner", "feature_configs", "feature_configs__schemas", "projects"
+                "owner",
+                "feature_configs",
+                "feature_configs__schemas",
+                "feature_configs__schemas__schema_content",
+                "projects",
             )
             .order_by("-_updated_date_time")
         )
@@ -288,9 +294,16 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
     published_dto = models.JSONField[Dict[str, Any]](
         "Published DTO", encoder=DjangoJSONEncoder, blank=True, null=True
     )
+    # Deprecated: analysis results are stored in NimbusAnalysisResult. The
+    # column is kept, unread and unwritten, so that processes still running
+    # the previous release keep working during a deploy, and is dropped in a
+    # later release.
     results_data = models.JSONField[Dict[str, Any]](
         "Results Data", encoder=DjangoJSONEncoder, blank=True, null=True
     )
+    results_data_fingerprint = models.JSONField[Dict[str, Any]](
+        "Results Data Fingerprint", encoder=DjangoJSONEncoder, blank=True, null=True
+    )
     risk_partner_related = models.BooleanField(
         "Is a Partner Related Risk Flag", default=None, blank=True, null=True
     )
@@ -1082,16 +1095,11 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
 
     @property
     def has_displayable_results(self):
-        # True if self.results_data has weekly or overall results
-        if self.results_data and "v3" in self.results_data:
-            results_data = self.results_data["v3"]
-            for window in ["overall", "weekly"]:
-                if window in results_data:
-                    enrollments = results_data[window].get("enrollments", {}).get("all")
-                    if enrollments is not None:
-                        return True
-
-        return False
+        # True if there are weekly or overall results for all enrollments
+        return (
+            hasattr(self, "analysis_summary")
+            and self.analysis_summary.has_displayable_results
+        )
 
     @property
     def show_results_url(self):
@@ -1147,6 +1155,7 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
         cloned.published_dto = None
         cloned.published_date = None
         cloned.results_data = None
+        cloned.results_data_fingerprint = None
         cloned.takeaways_summary = None
         cloned.conclusion_recommendations = []
         cloned.takeaways_metric_gain = False
@@ -1473,6 +1482,194 @@ class NimbusDocumentationLink(models.Model):
         return f"{self.title} ({self.link})"
 
 
+class NimbusAnalysisResultManager(models.Manager["NimbusAnalysisResult"]):
+    def store(self, experiment, results_data, primary_metrics=()):
+        """Replace the stored analysis results for an experiment.
+
+        results_data is the v3 results dict from Jetstream. The data for each
+        window, analysis basis and segment is upserted into its own row, and
+        everything else is stored in a single row with blank keys. The
+        experiment's NimbusAnalysisSummary is updated to match.
+        """
+        experiment_data = {}
+        rows = {("", "", ""): experiment_data}
+        for key, value in results_data.items():
+            if key in NimbusAnalysisResult.WINDOWS and value is not None:
+                experiment_data[key] = {analysis_basis: {} for analysis_basis in value}
+                for analysis_basis, segments in value.items():
+                    for segment, data in segments.items():
+                        rows[(key, analysis_basis, segment)] = data
+            else:
+                experiment_data[key] = value
+
+        with transaction.atomic():
+            stale_ids = [
+                result_id
+                for result_id, *key in self.filter(experiment=experiment).values_list(
+                    "id", "window", "analysis_basis", "segment"
+                )
+                if tuple(key) not in rows
+            ]
+            self.filter(id__in=stale_ids).delete()
+            self.bulk_create(
+                [
+                    NimbusAnalysisResult(
+                        experiment=experiment,
+                        window=window,
+                        analysis_basis=analysis_basis,
+                        segment=segment,
+                        data=data,
+                    )
+                    for (window, analysis_basis, segment), data in rows.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["experiment", "window", "analysis_basis", "segment"],
+                update_fields=["data"],
+            )
+            NimbusAnalysisSummary.objects.summarize(
+                experiment, results_data, primary_metrics
+            )
+
+    def get_results_data(self, experiment, window=None, segment=None):
+        """Reassemble the v3 results dict for an experiment, optionally
+        limited to a single window and/or segment."""
+        results = self.filter(experiment=experiment)
+        if window is not None:
+            results = results.filter(window__in=["", window])
+        if segment is not None:
+            results = results.filter(segment__in=["", segment])
+
+        results_data = None
+        rows = []
+        for result in results:
+            if result.window:
+                rows.append(result)
+            else:
+                results_data = result.data
+
+        if results_data is None:
+            return None
+
+        if window is not None:
+            results_data = {
+                key: value
+                for key, value in results_data.items()
+                if key not in NimbusAnalysisResult.WINDOWS or key == window
+            }
+
+        for result in rows:
+            results_data[result.window].setdefault(result.analysis_basis, {})[
+                result.segment
+            ] = result.data
+
+        return results_data
+
+
+class NimbusAnalysisResult(models.Model):
+    WINDOWS = ("daily", "weekly", "overall")
+
+    experiment = models.ForeignKey(
+        NimbusExperiment,
+        related_name="analysis_results",
+        on_delete=models.CASCADE,
+    )
+    window = models.CharField(max_length=255, blank=True)
+    analysis_basis = models.CharField(max_length=255, blank=True)
+    segment = models.CharField(max_length=255, blank=True)
+    data = models.JSONField[Any](encoder=DjangoJSONEncoder, blank=True, null=True)
+
+    objects = NimbusAnalysisResultManager()
+
+    class Meta:
+        verbose_name = "Nimbus Analysis Result"
+        verbose_name_plural = "Nimbus Analysis Results"
+        ordering = ("id",)
+        constraints = [
+            UniqueConstraint(
+                fields=["experiment", "window", "analysis_basis", "segment"],
+                name="unique_analysis_result",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.experiment}: {self.window} {self.analysis_basis} {self.segment}"
+
+
+class NimbusAnalysisSummaryManager(models.Manager["NimbusAnalysisSummary"]):
+    def summarize(self, experiment, results_data, primary_metrics=()):
+        """Store the facts about an experiment's results that experiment lists
+        show, so that they never need to load the results themselves."""
+
+        def all_enrollments(window):
+            return ((results_data.get(window) or {}).get("enrollments") or {}).get("all")
+
+        overall = all_enrollments("overall") or {}
+        control = next(
+            (
+                branch
+                for branch, branch_results in overall.items()
+                if branch_results["is_control"]
+            ),
+            None,
+        )
+
+        primary_metric_significance = {}
+        for metric in sorted(primary_metrics):
+            for branch, branch_results in overall.items():
+                if branch == control:
+                    continue
+
+                for group_data in branch_results["branch_data"].values():
+                    if metric not in group_data:
+                        continue
+
+                    windows = group_data[metric]["significance"].get(control, {})
+                    # There is only one overall window
+                    significance = next(iter(windows.get("overall", {}).values()), None)
+                    if significance is not None:
+                        primary_metric_significance.setdefault(metric, {})[branch] = (
+                            significance
+                        )
+
+        summary, _ = self.update_or_create(
+            experiment=experiment,
+            defaults={
+                "has_displayable_results": (
+                    all_enrollments("overall") is not None
+                    or all_enrollments("weekly") is not None
+                ),
+                "error_count": sum(
+                    len(errors) for errors in (results_data.get("errors") or {}).values()
+                ),
+                "primary_metric_significance": primary_metric_significance,
+            },
+        )
+        return summary
+
+
+class NimbusAnalysisSummary(models.Model):
+    experiment = models.OneToOneField(
+        NimbusExperiment,
+        related_name="analysis_summary",
+        on_delete=models.CASCADE,
+    )
+    has_displayable_results = models.BooleanField(default=False)
+    error_count = models.PositiveIntegerField(default=0)
+    # metric slug -> treatment branch slug -> overall significance vs control
+    primary_metric_significance = models.JSONField[Dict[str, Any]](
+        encoder=DjangoJSONEncoder, default=dict
+    )
+
+    objects = NimbusAnalysisSummaryManager()
+
+    class Meta:
+        verbose_name = "Nimbus Analysis Summary"
+        verbose_name_plural = "Nimbus Analysis Summaries"
+
+    def __str__(self):
+        return f"{self.experiment}: analysis summary"
+
+
 class NimbusIsolationGroup(models.Model):
     application = models.CharField(
         max_length=255, choices=NimbusExperiment.Application.choices
@@ -1597,7 +1794,7 @@ class NimbusFeatureConfig(models.Model):
                     min_version, max_version, prefix="version"
                 )
             )
-            .order_by("-version__major", "-version__minor", "-version__patch")
+            .order_by("-version__packed")
             .select_related("version")
         )
 
@@ -1619,16 +1816,19 @@ class NimbusFeatureConfig(models.Model):
         # Any versions in the requested range that do not support the schema.
         unsupported_versions: list["NimbusFeatureVersion"]
 
-    def get_versioned_schema_range(
-        self,
+    @staticmethod
+    def _resolve_versioned_range(
+        application: str,
         min_version: packaging.version.Version,
         max_version: Optional[packaging.version.Version],
-    ) -> VersionedSchemaRange:
-        unsupported_versions: list[NimbusFeatureVersion] = []
+    ) -> tuple[packaging.version.Version, bool]:
+        """Clamp the requested range to the versions we have manifests for.
 
-        assume_unversioned = False
+        Returns the (possibly adjusted) minimum version and whether or not the
+        unversioned schemas must be used instead.
+        """
         if min_supported_version := NimbusConstants.MIN_VERSIONED_FEATURE_VERSION.get(
-            self.application
+            application
         ):
             min_supported_version = NimbusExperiment.Version.parse(min_supported_version)
 
@@ -1640,7 +1840,7 @@ class NimbusFeatureConfig(models.Model):
                     #
                     # TODO(#9869): warn the user that we don't have information
                     # about this interval.
-                    assume_unversioned = True
+                    return min_version, True
                 elif max_version is None or min_supported_version < max_version:
                     # If you're targeting a minimum version before we have
                     # versioned manifests without an upper bound, we'll use the
@@ -1652,54 +1852,159 @@ class NimbusFeatureConfig(models.Model):
                     #
                     # TODO(#9869): warn the user that we don't have information
                     # about this interval.
-                    min_version = min_supported_version
-        else:
-            # This application does not support versioned feature configurations.
-            assume_unversioned = True
+                    return min_supported_version, False
 
-        if assume_unversioned:
-            schemas = [self.schemas.get(version=None)]
-        else:
-            schemas = list(self.schemas_between_versions(min_version, max_version))
-
-            if schemas:
-                # Find all NimbusFeatureVersion objects between the min and max
-                # version that are supported by *any* feature in the
-                # application.
-                #
-                # If there is a version in this queryse that isn't present in
-                # `schemas`, then we know that the feature is not supported in
-                # that version.
-                supported_versions = (
-                    NimbusFeatureVersion.objects.filter(
+            return min_version, False
+
+        # This application does not support versioned feature configurations.
+        return min_version, True
+
+    def get_versioned_schema_range(
+        self,
+        min_version: packaging.version.Version,
+        max_version: Optional[packaging.version.Version],
+    ) -> VersionedSchemaRange:
+        return NimbusFeatureConfig.get_versioned_schema_ranges(
+            [self], min_version, max_version
+        )[self.id]
+
+    @classmethod
+    def get_versioned_schema_ranges(
+        cls,
+        feature_configs: list["NimbusFeatureConfig"],
+        min_version: packaging.version.Version,
+        max_version: Optional[packaging.version.Version],
+    ) -> dict[int, VersionedSchemaRange]:
+        """Compute the versioned schema range for many feature configs at once.
+
+        This issues a fixed number of queries per application, regardless of
+        how many feature configs are requested.
+
+        Returns a dict mapping feature config IDs to their schema ranges.
+        """
+        ranges: dict[int, NimbusFeatureConfig.VersionedSchemaRange] = {}
+
+        feature_configs_by_application = defaultdict(list)
+        for feature_config in feature_configs:
+            feature_configs_by_application[feature_config.application].append(
+                feature_config
+            )
+
+        for application, app_feature_configs in feature_configs_by_application.items():
+            app_min_version, assume_unversioned = cls._resolve_versioned_range(
+                application, min_version, max_version
+            )
+
+            feature_config_ids = [fc.id for fc in app_feature_configs]
+            versioned_schemas = defaultdict(list)
+            has_versioned_schemas = set()
+            supported_versions = []
+
+            if not assume_unversioned:
+                for schema in (
+                    NimbusVersionedSchema.objects.filter(
                         NimbusFeatureVersion.objects.between_versions_q(
-                            min_version, max_version
+                            app_min_version, max_version, prefix="version"
                         ),
-                        schemas__feature_config__application=self.application,
+                        feature_config_id__in=feature_config_ids,
+                    )
+                    .order_by("-version__packed")
+                    .select_related("version")
+                ):
+                    versioned_schemas[schema.feature_config_id].append(schema)
+
+                if versioned_schemas:
+                    # Find all NimbusFeatureVersion objects between the min and
+                    # max version that are supported by *any* feature in the
+                    # application.
+                    #
+                    # If there is a version in this queryset that isn't present
+                    # in a feature's schemas, then we know that the feature is
+                    # not supported in that version.
+                    supported_versions = list(
+                        NimbusFeatureVersion.objects.filter(
+                            NimbusFeatureVersion.objects.between_versions_q(
+                                app_min_version, max_version
+                            ),
+                            schemas__feature_config__application=application,
+                        )
+                        .order_by("-packed")
+                        .distinct()
                     )
-                    .order_by("-major", "-minor", "-patch")
-                    .distinct()
+
+                if len(versioned_schemas) < len(feature_config_ids):
+                    has_versioned_schemas = set(
+                        NimbusVersionedSchema.objects.filter(
+                            feature_config_id__in=feature_config_ids,
+                            version__isnull=False,
+                        )
+                        .values_list("feature_config_id", flat=True)
+                        .distinct()
+                    )
+
+            unversioned_schemas = {}
+            if len(versioned_schemas) < len(feature_config_ids):
+                unversioned_schemas = {
+                    schema.feature_config_id: schema
+                    for schema in NimbusVersionedSchema.objects.filter(
+                        feature_config_id__in=feature_config_ids,
+                        version=None,
+                    )
+                }
+
+            for feature_config in app_feature_configs:
+                ranges[feature_config.id] = cls._build_versioned_schema_range(
+                    app_min_version,
+                    max_version,
+                    versioned_schemas=versioned_schemas.get(feature_config.id, []),
+                    unversioned_schema=unversioned_schemas.get(feature_config.id),
+                    supported_versions=supported_versions,
+                    assume_unversioned=assume_unversioned,
+                    has_versioned_schemas=feature_config.id in has_versioned_schemas,
                 )
 
-                schemas_by_version = {schema.version: schema for schema in schemas}
-
-                for application_version in supported_versions:
-                    if application_version not in schemas_by_version:
-                        unsupported_versions.append(application_version)
-            elif self.schemas.filter(version__isnull=False).exists():
-                # There are versioned schemas outside this range. This feature
-                # is unsupported in this range.
-                return NimbusFeatureConfig.VersionedSchemaRange(
-                    min_version=min_version,
-                    max_version=max_version,
-                    schemas=[],
-                    unsupported_in_range=True,
-                    unsupported_versions=[],
+        return ranges
+
+    @classmethod
+    def _build_versioned_schema_range(
+        cls,
+        min_version: packaging.version.Version,
+        max_version: Optional[packaging.version.Version],
+        *,
+        versioned_schemas: list["NimbusVersionedSchema"],
+        unversioned_schema: Optional["NimbusVersionedSchema"],
+        supported_versions: list["NimbusFeatureVersion"],
+        assume_unversioned: bool,
+        has_versioned_schemas: bool,
+    ) -> VersionedSchemaRange:
+        unsupported_versions: list[NimbusFeatureVersion] = []
+
+        if versioned_schemas and not assume_unversioned:
+            schemas = versioned_schemas
+            schema_versions = {schema.version_id for schema in schemas}
+
+            for application_version in supported_versions:
+                if application_version.id not in schema_versions:
+                    unsupported_versions.append(application_version)
+        elif has_versioned_schemas and not assume_unversioned:
+            # There are versioned schemas outside this range. This feature
+            # is unsupported in this range.
+            return NimbusFeatureConfig.VersionedSchemaRange(
+                min_version=min_version,
+                max_version=max_version,
+                schemas=[],
+                unsupported_in_range=True,
+                unsupported_versions=[],
+            )
+        else:
+            # There are no versioned schemas for this feature or the application
+            # does not support versioned schemas in this range. Fall back to
+            # using the unversioned schema.
+            if unversioned_schema is None:
+                raise NimbusVersionedSchema.DoesNotExist(
+                    "NimbusVersionedSchema matching query does not exist."
                 )
-            else:
-                # There are no verioned schemas for this feature. Fall back to
-                # using unversioned schema.
-                schemas = [self.schemas.get(version=None)]
+            schemas = [unversioned_schema]
 
         return NimbusFeatureConfig.VersionedSchemaRange(
             min_version=min_version,
@@ -1728,37 +2033,43 @@ class NimbusFeatureVersionManager(models.Manager["NimbusFeatureVersion"]):
             def prefixed(**kwargs: dict[str, Any]):
                 return kwargs
 
-        # (a, b, c) >= (d, e, f)
-        # := (a > b) | (a = b & d > e) | (a = b & d = e & c >= f)
-        # == (a > b) | (a = b & (d > e | (d = e & c >= f)))
-
         # packaging.version.Version uses major.minor.micro, but
         # NimbusFeatureVersion uses major.minor.patch (semver).
-        q = Q(**prefixed(major__gt=min_version.major)) | Q(
-            **prefixed(major=min_version.major)
-        ) & (
-            Q(**prefixed(minor__gt=min_version.minor))
-            | Q(**prefixed(minor=min_version.minor, patch__gte=min_version.micro))
+        q = Q(
+            **prefixed(
+                packed__gte=NimbusFeatureVersion.pack(
+                    min_version.major, min_version.minor, min_version.micro
+                )
+            )
         )
 
         if max_version is not None:
-            # (a, b, c) < (d, e, f)
-            # := (a < d) | (a == d & b < e) | (a == d & b == e & c < f)
-            # == (a < d) | (a == d & (b < e | (b == e & c < f)))
-            q &= Q(**prefixed(major__lt=max_version.major)) | Q(
-                **prefixed(major=max_version.major)
-            ) & (
-                Q(**prefixed(minor__lt=max_version.minor))
-                | Q(**prefixed(minor=max_version.minor, patch__lt=max_version.micro))
+            q &= Q(
+                **prefixed(
+                    packed__lt=NimbusFeatureVersion.pack(
+                        max_version.major, max_version.minor, max_version.micro
+                    )
+                )
             )
 
         return q
 
 
 class NimbusFeatureVersion(models.Model):
+    # Multipliers used to pack (major, minor, patch) into a single sortable
+    # integer. Minor and patch versions must be less than 1000, which is
+    # enforced by a database constraint so that packed versions never collide.
+    PACKED_MAJOR = 1_000_000
+    PACKED_MINOR = 1_000
+
     major = models.IntegerField(null=False)
     minor = models.IntegerField(null=False)
     patch = models.IntegerField(null=False)
+    packed = models.GeneratedField(
+        expression=F("major") * PACKED_MAJOR + F("minor") * PACKED_MINOR + F("patch"),
+        output_field=models.BigIntegerField(),
+        db_persist=True,
+    )
 
     objects = NimbusFeatureVersionManager()
 
@@ -1766,6 +2077,21 @@ class NimbusFeatureVersion(models.Model):
         verbose_name = "Nimbus Feature Version"
         verbose_name_plural = "Nimbus Feature Versions"
         unique_together = ("major", "minor", "patch")
+        indexes = [models.Index(fields=["packed"])]
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(minor__gte=0, minor__lt=1000),
+                name="nimbusfeatureversion_minor_packable",
+            ),
+            models.CheckConstraint(
+                condition=Q(patch__gte=0, patch__lt=1000),
+                name="nimbusfeatureversion_patch_packable",
+            ),
+        ]
+
+    @classmethod
+    def pack(cls, major: int, minor: int, patch: int) -> int:
+        return major * cls.PACKED_MAJOR + minor * cls.PACKED_MINOR + patch
 
     def __repr__(self):  # pragma: no cover
         return f"<NimbusFeatureVersion({self.major}, {self.minor}, {self.patch})>"
@@ -1777,6 +2103,76 @@ class NimbusFeatureVersion(models.Model):
         return packaging.version.parse(str(self))
 
 
+class NimbusFeatureSchemaManager(models.Manager["NimbusFeatureSchema"]):
+    def store(self, feature_schemas):
+        """Insert any of the given schemas that are not already stored."""
+        unique_schemas = {
+            feature_schema.hash: feature_schema for feature_schema in feature_schemas
+        }
+        self.bulk_create(unique_schemas.values(), ignore_conflicts=True)
+
+    def prune(self):
+        """Delete the schemas that are no longer referenced by any versioned
+        schema."""
+        return self.filter(versioned_schemas__isnull=True).delete()
+
+
+class NimbusFeatureSchema(models.Model):
+    """A JSON schema's text, stored once and addressed by its sha256 hash.
+
+    Most features have the same schema across many versions, so versioned
+    schemas reference these rows instead of each storing a copy.
+    """
+
+    hash = models.CharField(max_length=64, primary_key=True)
+    schema = models.TextField()
+
+    objects = NimbusFeatureSchemaManager()
+
+    class Meta:
+        verbose_name = "Nimbus Feature Schema"
+        verbose_name_plural = "Nimbus Feature Schemas"
+
+    @staticmethod
+    def hash_schema(schema: str) -> str:
+        return hashlib.sha256(schema.encode()).hexdigest()
+
+    @classmethod
+    def for_schema(cls, schema: str) -> "NimbusFeatureSchema":
+        return cls(hash=cls.hash_schema(schema), schema=schema)
+
+    def __str__(self):  # pragma: no cover
+        return self.hash
+
+
+class NimbusVersionedSchemaManager(models.Manager["NimbusVersionedSchema"]):
+    def get_queryset(self):
+        return super().get_queryset().defer("legacy_schema")
+
+    # Assigning NimbusVersionedSchema.schema creates an unsaved
+    # NimbusFeatureSchema, which must be stored before the rows that reference it.
+    @staticmethod
+    def _store_feature_schemas(versioned_schemas):
+        NimbusFeatureSchema.objects.store(
+            versioned_schema.schema_content
+            for versioned_schema in versioned_schemas
+            if versioned_schema.schema_content_id is not None
+            and NimbusVersionedSchema.schema_content.is_cached(versioned_schema)
+        )
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        self._store_feature_schemas(objs)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if "schema_content" in fields:
+            self._store_feature_schemas(objs)
+            fields = [*fields, "legacy_schema"]
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+
 class NimbusVersionedSchema(models.Model):
     feature_config = models.ForeignKey(
         NimbusFeatureConfig,
@@ -1789,17 +2185,102 @@ class NimbusVersionedSchema(models.Model):
         on_delete=models.CASCADE,
         null=True,
     )
-    schema = models.TextField(blank=True, null=True)
+    schema_content = models.ForeignKey(
+        NimbusFeatureSchema,
+        related_name="versioned_schemas",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        db_column="schema_hash",
+    )
+    # Deprecated: a copy of the schema text in the old column, which processes
+    # still running the previous release read during a deploy. It is written
+    # but never read, and is dropped in a later release.
+    legacy_schema = models.TextField(blank=True, null=True, db_column="schema")
 
     # Desktop-only
     set_pref_vars = models.JSONField[Dict[str, str]](null=False, default=dict)
     is_early_startup = models.BooleanField(null=False, default=False)
 
+    objects = NimbusVersionedSchemaManager()
+
     class Meta:
         verbose_name = "Nimbus Versioned Schema"
         verbose_name_plural = "Nimbus Versioned Schemas"
         unique_together = ("feature_config", "version")
 
+    @property
+    def schema(self) -> Optional[str]:
+        if self.schema_content_id is None:
+            return None
+        return self.schema_content.schema
+
+    @schema.setter
+    def schema(self, schema: Optional[str]):
+        self.schema_content = (
+            None if schema is None else NimbusFeatureSchema.for_schema(schema)
+        )
+        self.legacy_schema = schema
+
+    @property
+    def schema_hash(self) -> Optional[str]:
+        return self.schema_content_id
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "schema_content" in update_fields:
+            NimbusVersionedSchema.objects._store_feature_schemas([self])
+        if update_fields is not None and "schema_content" in update_fields:
+            kwargs["update_fields"] = [*update_fields, "legacy_schema"]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def desktop_set_pref_index(
+        cls,
+        min_version: packaging.version.Version,
+        max_version: Optional[packaging.version.Version],
+    ) -> dict[str, dict[str, list[packaging.version.Version]]]:
+        """Build an index of prefs set by Desktop features in a version range.
+
+        Returns a mapping of pref names to a mapping of feature slugs to the
+        versions of that feature that set the pref. Feature slugs are ordered by
+        their first appearance in the range.
+        """
+        rows = (
+            cls.objects.filter(
+                NimbusFeatureVersion.objects.between_versions_q(
+                    min_version, max_version, prefix="version"
+                ),
+                feature_config__application=NimbusConstants.Application.DESKTOP,
+            )
+            .exclude(set_pref_vars={})
+            .values_list(
+                "feature_config__slug",
+                "set_pref_vars",
+                "version__major",
+                "version__minor",
+                "version__patch",
+            )
+        )
+
+        feature_order: dict[str, int] = {}
+        index: dict[str, dict[str, list[packaging.version.Version]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for feature_slug, set_pref_vars, major, minor, patch in rows:
+            feature_order.setdefault(feature_slug, len(feature_order))
+            version = packaging.version.Version(f"{major}.{minor}.{patch}")
+
+            for pref in set(set_pref_vars.values()):
+                index[pref][feature_slug].append(version)
+
+        return {
+            pref: dict(
+                sorted(versions_by_feature.items(), key=lambda i: feature_order[i[0]])
+            )
+            for pref, versions_by_feature in index.items()
+        }
+
     def __repr__(self):  # pragma: no cover
         return (
             f"<NimbusVersionedSchema(feature_config_id={self.feature_config_id}, "
@@ -1817,6 +2298,46 @@ class NimbusVersionedSchema(models.Model):
         return as_str
 
 
+class NimbusFeatureManifest(models.Model):
+    """The content hash of a feature manifest, and of the JSON schemas it
+    references, as of the last time load_feature_configs loaded it."""
+
+    application = models.CharField(
+        max_length=255, choices=NimbusConstants.Application.choices
+    )
+    version = models.ForeignKey(
+        NimbusFeatureVersion,
+        related_name="manifests",
+        on_delete=models.CASCADE,
+        null=True,
+    )
+    content_hash = models.CharField(max_length=64)
+
+    class Meta:
+        verbose_name = "Nimbus Feature Manifest"
+        verbose_name_plural = "Nimbus Feature Manifests"
+        # Postgres treats NULLs as distinct, and Postgres 14 does not support
+        # NULLS NOT DISTINCT, so the unversioned manifest needs its own
+        # constraint.
+        constraints = [
+            UniqueConstraint(
+                fields=["application", "version"],
+                condition=Q(version__isnull=False),
+                name="unique_versioned_feature_manifest",
+            ),
+            UniqueConstraint(
+                fields=["application"],
+                condition=Q(version__isnull=True),
+                name="unique_unversioned_feature_manifest",
+            ),
+        ]
+
+    def __str__(self):  # pragma: no cover
+        if self.version is not None:
+            return f"{self.application} (version {self.version})"
+        return f"{self.application} (unversioned)"
+
+
 class NimbusChangeLogManager(models.Manager["NimbusChangeLog"]):
     def latest_change(self):
         return self.all().order_by("-changed_on").first()
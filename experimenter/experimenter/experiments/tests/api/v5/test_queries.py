@@ -3,8 +3,10 @@ import json
 
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.urls import reverse
 from graphene_django.utils.testing import GraphQLTestCase
+from mozilla_nimbus_schemas.jetstream import SampleSizesFactory
 from parameterized import parameterized
 
 from experimenter.base.models import Country, Language, Locale
@@ -18,7 +20,11 @@ from experimenter.experiments.api.v5.serializers import (
     TransitionConstants,
 )
 from experimenter.experiments.api.v6.serializers import NimbusExperimentSerializer
-from experimenter.experiments.models import NimbusBranchFeatureValue, NimbusExperiment
+from experimenter.experiments.models import (
+    NimbusAnalysisSummary,
+    NimbusBranchFeatureValue,
+    NimbusExperiment,
+)
 from experimenter.experiments.tests.factories import (
     NimbusBranchFactory,
     NimbusDocumentationLinkFactory,
@@ -26,11 +32,13 @@ from experimenter.experiments.tests.factories import (
     NimbusFeatureConfigFactory,
     NimbusVersionedSchemaFactory,
 )
+from experimenter.jetstream.client import cache_population_sizing_data
 from experimenter.jetstream.tests.mixins import MockSizingDataMixin
 from experimenter.openidc.tests.factories import UserFactory
 from experimenter.outcomes import Outcomes
 from experimenter.projects.models import Project
 from experimenter.projects.tests.factories import ProjectFactory
+from experimenter.settings import SIZING_DATA_INDEX_KEY, SIZING_DATA_KEY
 
 
 def camelize(snake_str):
@@ -1721,6 +1729,54 @@ class TestNimbusExperimentBySlugQuery(GraphQLTestCase):
         self.assertEqual(experiment_data["signoffRecommendations"]["vpSignoff"], True)
         self.assertEqual(experiment_data["signoffRecommendations"]["legalSignoff"], True)
 
+    def test_results_summary(self):
+        user_email = "user@example.com"
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
+        )
+        NimbusAnalysisSummary.objects.create(
+            experiment=experiment,
+            has_displayable_results=True,
+            error_count=2,
+            primary_metric_significance={"retained": {"treatment": "positive"}},
+        )
+        NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.CREATED,
+        )
+
+        response = self.query(
+            """
+            query {
+                experiments {
+                    slug
+                    resultsSummary {
+                        hasDisplayableResults
+                        errorCount
+                        primaryMetricSignificance
+                    }
+                }
+            }
+            """,
+            headers={settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        content = json.loads(response.content)
+        results_summaries = {
+            experiment_data["slug"]: experiment_data["resultsSummary"]
+            for experiment_data in content["data"]["experiments"]
+        }
+        self.assertEqual(
+            results_summaries.pop(experiment.slug),
+            {
+                "hasDisplayableResults": True,
+                "errorCount": 2,
+                "primaryMetricSignificance": json.dumps(
+                    {"retained": {"treatment": "positive"}}
+                ),
+            },
+        )
+        self.assertEqual(list(results_summaries.values()), [None])
+
     def test_targeting_config_slug_for_valid_targeting_config_returns_name(self):
         user_email = "user@example.com"
         experiment = NimbusExperimentFactory.create_with_lifecycle(
@@ -2723,3 +2779,112 @@ class TestNimbusConfigQuery(MockSizingDataMixin, GraphQLTestCase):
                 {"id": str(project.id), "name": project.name}, config["projects"]
             )
         self.assertEqual(config["user"], user_email)
+
+    def test_nimbus_config_ignores_non_json_sizing_data(self):
+        cache.set(SIZING_DATA_KEY, SampleSizesFactory.build())
+
+        response = self.query(
+            """
+            query {
+                nimbusConfig {
+                    populationSizingData
+                }
+            }
+            """,
+            headers={settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        content = json.loads(response.content)
+
+        self.assertEqual(content["data"]["nimbusConfig"]["populationSizingData"], "{}")
+
+
+class TestPopulationSizingTargetsQuery(MockSizingDataMixin, GraphQLTestCase):
+    GRAPHQL_URL = reverse("nimbus-api-graphql")
+
+    QUERY = """
+        query getPopulationSizingTargets(
+            $appId: String!
+            $channel: String
+            $country: String
+            $locale: String
+            $newOrExisting: String
+        ) {
+            populationSizingTargets(
+                appId: $appId
+                channel: $channel
+                country: $country
+                locale: $locale
+                newOrExisting: $newOrExisting
+            )
+        }
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.setup_cached_sizing_data()
+        self.sizing_data = json.loads(self.get_cached_sizing_data().json())
+
+    def query_targets(self, **variables):
+        response = self.query(
+            self.QUERY,
+            variables=variables,
+            headers={settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        content = json.loads(response.content)
+        return json.loads(content["data"]["populationSizingTargets"])
+
+    def test_returns_only_matching_targets(self):
+        sizing_key, by_user_type = next(iter(self.sizing_data.items()))
+        target = next(iter(by_user_type.values()))
+        recipe = target["target_recipe"]
+
+        targets = self.query_targets(
+            appId=recipe["app_id"],
+            channel=recipe["channel"],
+            country=recipe["country"],
+            locale=recipe["locale"] or recipe["language"],
+            newOrExisting=recipe["new_or_existing"],
+        )
+
+        self.assertIn({"key": sizing_key, **target}, targets)
+        for matched in targets:
+            self.assertEqual(matched["target_recipe"], recipe)
+
+    def test_returns_all_targets_for_app(self):
+        by_user_type = next(iter(self.sizing_data.values()))
+        app_id = next(iter(by_user_type.values()))["target_recipe"]["app_id"]
+
+        targets = self.query_targets(appId=app_id)
+
+        self.assertEqual(
+            sorted(
+                (target["key"], target["target_recipe"]["new_or_existing"])
+                for target in targets
+            ),
+            sorted(
+                (key, target["target_recipe"]["new_or_existing"])
+                for key, user_types in self.sizing_data.items()
+                for target in user_types.values()
+                if target["target_recipe"]["app_id"] == app_id
+            ),
+        )
+
+    def test_index_is_memoized_until_a_new_version_is_stored(self):
+        by_user_type = next(iter(self.sizing_data.values()))
+        app_id = next(iter(by_user_type.values()))["target_recipe"]["app_id"]
+        targets = self.query_targets(appId=app_id)
+        self.assertTrue(targets)
+
+        # Replacing the index without storing a new version is not noticed.
+        cache.set(SIZING_DATA_INDEX_KEY, {})
+        self.assertEqual(self.query_targets(appId=app_id), targets)
+
+        cache_population_sizing_data("{}", {})
+        self.assertEqual(self.query_targets(appId=app_id), [])
+
+    def test_returns_empty_list_without_sizing_data(self):
+        cache.clear()
+
+        self.assertEqual(self.query_targets(appId="firefox_desktop"), [])
@@ -4,7 +4,7 @@ from itertools import chain, product
 from typing import Literal, Optional, Union
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from parameterized import parameterized
 
 import experimenter.experiments.constants
@@ -13,9 +13,16 @@ from experimenter.base.tests.factories import (
     LanguageFactory,
     LocaleFactory,
 )
-from experimenter.experiments.api.v5.serializers import NimbusReviewSerializer
+from experimenter.experiments.api.v5.serializers import (
+    NimbusReviewSerializer,
+    SchemaValidatorCache,
+)
 from experimenter.experiments.constants import NimbusConstants
-from experimenter.experiments.models import NimbusExperiment, NimbusFeatureVersion
+from experimenter.experiments.models import (
+    NimbusExperiment,
+    NimbusFeatureVersion,
+    NimbusVersionedSchema,
+)
 from experimenter.experiments.tests.api.v5.test_serializers.mixins import (
     MockFmlErrorMixin,
 )
@@ -1518,6 +1525,44 @@ class TestNimbusReviewSerializerSingleFeature(MockFmlErrorMixin, TestCase):
         )
         self.mock_fml_errors.assert_called()
 
+    @parameterized.expand([(1,), (4,)])
+    def test_serializer_fml_validation_deduplicates_branch_values(self, max_workers):
+        self.setup_fml_no_errors()
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.CREATED,
+            status=NimbusExperiment.Status.DRAFT,
+            application=NimbusExperiment.Application.FENIX,
+            channel=NimbusExperiment.Channel.RELEASE,
+            feature_configs=[
+                NimbusFeatureConfigFactory.create(
+                    application=NimbusExperiment.Application.FENIX,
+                    schemas=[
+                        NimbusVersionedSchemaFactory.build(
+                            version=None,
+                            schema=None,
+                        )
+                    ],
+                )
+            ],
+            is_sticky=True,
+            firefox_min_version=NimbusExperiment.Version.FIREFOX_100,
+        )
+        for branch in experiment.branches.all():
+            branch.feature_values.update(value=json.dumps({"enabled": True}))
+
+        with override_settings(FML_VALIDATION_MAX_WORKERS=max_workers):
+            serializer = NimbusReviewSerializer(
+                experiment,
+                data=NimbusReviewSerializer(
+                    experiment,
+                    context={"user": self.user},
+                ).data,
+                context={"user": self.user},
+            )
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        self.mock_fml_errors.assert_called_once()
+
     def test_serializer_fml_does_not_validate_desktop(self):
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.CREATED,
@@ -4876,3 +4921,45 @@ class TestNimbusReviewSerializerMultiFeature(MockFmlErrorMixin, TestCase):
                     ]
                 },
             )
+
+
+class TestSchemaValidatorCache(TestCase):
+    def setUp(self):
+        super().setUp()
+        SchemaValidatorCache.clear_cache()
+
+    def tearDown(self):
+        super().tearDown()
+        SchemaValidatorCache.clear_cache()
+
+    def test_get_returns_same_validator_for_same_schema_text(self):
+        validator = SchemaValidatorCache.get(BASIC_JSON_SCHEMA)
+
+        self.assertIs(SchemaValidatorCache.get(BASIC_JSON_SCHEMA), validator)
+        self.assertIsNot(SchemaValidatorCache.get(REF_JSON_SCHEMA), validator)
+
+    def test_get_checks_schema_once(self):
+        with patch("jsonschema.validators.Draft7Validator.check_schema") as check_schema:
+            for _ in range(3):
+                SchemaValidatorCache.get(BASIC_JSON_SCHEMA)
+
+        check_schema.assert_called_once()
+
+    def test_get_for_versioned_schema_only_loads_schema_once(self):
+        versioned_schema = NimbusVersionedSchemaFactory.create(
+            version=None, schema=BASIC_JSON_SCHEMA
+        )
+        validator = SchemaValidatorCache.get(BASIC_JSON_SCHEMA)
+
+        versioned_schema = NimbusVersionedSchema.objects.get(id=versioned_schema.id)
+        with self.assertNumQueries(0):
+            self.assertIs(
+                SchemaValidatorCache.get_for_versioned_schema(versioned_schema),
+                validator,
+            )
+
+    def test_validator_resolves_bundled_refs(self):
+        validator = SchemaValidatorCache.get(REF_JSON_SCHEMA)
+
+        self.assertTrue(validator.is_valid({"bar": {"baz": "baz", "qux": 123}}))
+        self.assertFalse(validator.is_valid({"bar": {"qux": "123"}}))
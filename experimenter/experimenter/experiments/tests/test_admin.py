@@ -24,6 +24,8 @@ from experimenter.experiments.tests.factories import (
     NimbusBranchFactory,
     NimbusChangeLogFactory,
     NimbusExperimentFactory,
+    NimbusFeatureConfigFactory,
+    NimbusVersionedSchemaFactory,
 )
 from experimenter.openidc.tests.factories import UserFactory
 from experimenter.settings import DEV_USER_EMAIL
@@ -170,7 +172,7 @@ class TestNimbusExperimentAdmin(TestCase):
             **{settings.OPENIDC_EMAIL_HEADER: user.email},
         )
         self.assertEqual(response.status_code, 200)
-        mock_fetch_experiment_data.delay.assert_called_with(experiment.id)
+        mock_fetch_experiment_data.delay.assert_called_with(experiment.id, force=True)
 
 
 class TestNimbusExperimentExport(TestCase):
@@ -323,3 +325,26 @@ class NimbusVersionedSchemaAdminTests(TestCase):
                 )
             ),
         )
+
+
+class NimbusFeatureConfigAdminTests(TestCase):
+    def test_change_page_shows_schemas(self):
+        user = UserFactory.create(is_staff=True, is_superuser=True)
+        feature_config = NimbusFeatureConfigFactory.create(
+            schemas=[
+                NimbusVersionedSchemaFactory.build(
+                    version=None, schema='{"admin-schema": true}'
+                )
+            ]
+        )
+
+        response = self.client.get(
+            reverse(
+                "admin:experiments_nimbusfeatureconfig_change",
+                args=(feature_config.pk,),
+            ),
+            **{settings.OPENIDC_EMAIL_HEADER: user.email},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "admin-schema")
@@ -383,11 +383,11 @@ class TestChangeFormattingMethod(TestCase):
         timestamp_2 = self._create_timestamp(2)
 
         old_value = {}
-        new_value = {"v2": {"overall": {"enrollments": {"all": {}}}}}
+        new_value = {"files": {"statistics/statistics_experiment_1_overall.json": None}}
 
         generate_nimbus_changelog(experiment, self.user, "created", self.first_timestamp)
 
-        experiment.results_data = new_value
+        experiment.results_data_fingerprint = new_value
         experiment.save()
 
         generate_nimbus_changelog(
@@ -399,7 +399,7 @@ class TestChangeFormattingMethod(TestCase):
         )
 
         comparison_log = changelogs[0]
-        field_name = "results_data"
+        field_name = "results_data_fingerprint"
         field_diff = {"old_value": old_value, "new_value": new_value}
         change_timestamp = self._create_formatted_timestamp(comparison_log.changed_on)
         field_instance = NimbusExperiment._meta.get_field(field_name)
@@ -90,7 +90,7 @@ class TestNimbusExperimentChangeLogSerializer(TestCase):
                 "qa_status": NimbusExperiment.QAStatus.NOT_SET,
                 "reference_branch": None,
                 "required_experiments": [],
-                "results_data": None,
+                "results_data_fingerprint": None,
                 "risk_brand": None,
                 "risk_message": None,
                 "risk_mitigation_link": "",
@@ -194,7 +194,7 @@ class TestNimbusExperimentChangeLogSerializer(TestCase):
                 "qa_signoff": False,
                 "qa_status": experiment.qa_status,
                 "required_experiments": [],
-                "results_data": None,
+                "results_data_fingerprint": None,
                 "risk_brand": experiment.risk_brand,
                 "risk_message": experiment.risk_message,
                 "risk_mitigation_link": experiment.risk_mitigation_link,
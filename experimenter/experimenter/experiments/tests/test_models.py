@@ -9,6 +9,7 @@ import packaging
 from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from django.test import TestCase, override_settings
 from django.utils import timezone
@@ -31,6 +32,8 @@ from experimenter.experiments.constants import (
     TargetingMultipleKintoCollectionsError,
 )
 from experimenter.experiments.models import (
+    NimbusAnalysisResult,
+    NimbusAnalysisSummary,
     NimbusBranch,
     NimbusBranchScreenshot,
     NimbusBucketRange,
@@ -38,6 +41,8 @@ from experimenter.experiments.models import (
     NimbusExperimentBranchThroughExcluded,
     NimbusExperimentBranchThroughRequired,
     NimbusFeatureConfig,
+    NimbusFeatureManifest,
+    NimbusFeatureSchema,
     NimbusFeatureVersion,
     NimbusIsolationGroup,
     NimbusVersionedSchema,
@@ -76,6 +81,22 @@ class TestNimbusExperimentManager(TestCase):
             [newer_experiment, older_experiment],
         )
 
+    def test_with_owner_features_prefetches_feature_schemas(self):
+        NimbusExperimentFactory.create_batch(3)
+
+        experiments = list(NimbusExperiment.objects.with_owner_features())
+
+        with self.assertNumQueries(0):
+            schemas = [
+                schema.schema
+                for experiment in experiments
+                for feature_config in experiment.feature_configs.all()
+                for schema in feature_config.schemas.all()
+            ]
+
+        self.assertEqual(len(schemas), 3)
+        self.assertTrue(all(schemas))
+
     def test_launch_queue_returns_queued_experiments_with_correct_application(self):
         experiment1 = NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.LAUNCH_APPROVE,
@@ -2224,33 +2245,34 @@ class TestNimbusExperiment(TestCase):
 
     @parameterized.expand(
         [
-            ({"v3": {"overall": {"enrollments": {"all": {}}}}},),
-            ({"v3": {"weekly": {"enrollments": {"all": {}}}}},),
+            ({"overall": {"enrollments": {"all": {}}}},),
+            ({"weekly": {"enrollments": {"all": {}}}},),
         ]
     )
     def test_has_displayable_results_true(self, results_data):
         experiment = NimbusExperimentFactory.create()
-        experiment.results_data = results_data
-        experiment.save()
+        NimbusAnalysisResult.objects.store(experiment, results_data)
 
         self.assertTrue(experiment.has_displayable_results)
 
     @parameterized.expand(
         [
+            (None,),
             ({},),
-            ({"v3": {}},),
-            ({"v3": {"overall": {}}},),
-            ({"v3": {"weekly": {}}},),
-            ({"v3": {"overall": {"enrollments": {}}}},),
-            ({"v3": {"weekly": {"enrollments": {}}}},),
-            ({"v3": {"overall": {"enrollments": {"all": None}}}},),
-            ({"v3": {"weekly": {"enrollments": {"all": None}}}},),
+            ({"overall": {}},),
+            ({"weekly": {}},),
+            ({"overall": {"enrollments": {}}},),
+            ({"weekly": {"enrollments": {}}},),
+            ({"overall": {"enrollments": {"all": None}}},),
+            ({"weekly": {"enrollments": {"all": None}}},),
+            ({"daily": {"enrollments": {"all": {}}}},),
+            ({"overall": {"exposures": {"all": {}}}},),
         ]
     )
     def test_has_displayable_results_false(self, results_data):
         experiment = NimbusExperimentFactory.create()
-        experiment.results_data = results_data
-        experiment.save()
+        if results_data is not None:
+            NimbusAnalysisResult.objects.store(experiment, results_data)
 
         self.assertFalse(experiment.has_displayable_results)
 
@@ -2259,7 +2281,9 @@ class TestNimbusExperiment(TestCase):
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             lifecycle, start_date=datetime.date(2020, 1, 1), proposed_enrollment=2
         )
-        experiment.results_data = {"v3": {"overall": {"enrollments": {"all": {}}}}}
+        NimbusAnalysisResult.objects.store(
+            experiment, {"overall": {"enrollments": {"all": {}}}}
+        )
         experiment.is_rollout = False
         experiment.save()
 
@@ -2269,12 +2293,12 @@ class TestNimbusExperiment(TestCase):
         [
             ({}, datetime.date(2020, 1, 1), False),
             (
-                {"v3": {"overall": {"enrollments": {"all": {}}}}},
+                {"overall": {"enrollments": {"all": {}}}},
                 datetime.date.today(),
                 False,
             ),
             (
-                {"v3": {"overall": {"enrollments": {"all": {}}}}},
+                {"overall": {"enrollments": {"all": {}}}},
                 datetime.date(2020, 1, 1),
                 True,
             ),
@@ -2285,7 +2309,7 @@ class TestNimbusExperiment(TestCase):
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             lifecycle, start_date=start_date, proposed_enrollment=2
         )
-        experiment.results_data = results_data
+        NimbusAnalysisResult.objects.store(experiment, results_data)
         experiment.is_rollout = is_rollout
         experiment.save()
 
@@ -2711,6 +2735,7 @@ class TestNimbusExperiment(TestCase):
         self.assertEqual(child.enrollment_start_date, None)
         self.assertEqual(child.published_dto, None)
         self.assertEqual(child.published_date, None)
+        self.assertFalse(child.analysis_results.exists())
         self.assertEqual(child.results_data, None)
         self.assertEqual(child.takeaways_gain_amount, None)
         self.assertEqual(child.takeaways_metric_gain, False)
@@ -3328,6 +3353,236 @@ class TestNimbusDocumentLink(TestCase):
         self.assertEqual(str(doco_link), "doc (www.example.com)")
 
 
+class TestNimbusAnalysisResultManager(TestCase):
+    RESULTS_DATA = {
+        "metadata": {"metrics": {}},
+        "show_analysis": True,
+        "errors": {"experiment": []},
+        "daily": None,
+        "weekly": {
+            "enrollments": {
+                "all": {"control": {"is_control": True}},
+                "mobile": {"control": {"is_control": True}},
+            },
+        },
+        "overall": {
+            "enrollments": {
+                "all": {"control": {"is_control": True}},
+                "mobile": {"control": {"is_control": True}},
+            },
+            "exposures": {
+                "all": {"control": {"is_control": True}},
+            },
+        },
+    }
+
+    def setUp(self):
+        super().setUp()
+        self.experiment = NimbusExperimentFactory.create(name="experiment")
+
+    def test_get_results_data_returns_none_without_results(self):
+        self.assertIsNone(NimbusAnalysisResult.objects.get_results_data(self.experiment))
+
+    def test_store_round_trips_results_data(self):
+        NimbusAnalysisResult.objects.store(self.experiment, self.RESULTS_DATA)
+
+        self.assertEqual(self.experiment.analysis_results.count(), 6)
+        self.assertEqual(
+            NimbusAnalysisResult.objects.get_results_data(self.experiment),
+            self.RESULTS_DATA,
+        )
+
+    def test_store_updates_and_removes_stale_rows(self):
+        NimbusAnalysisResult.objects.store(self.experiment, self.RESULTS_DATA)
+        result_ids = set(self.experiment.analysis_results.values_list("id", flat=True))
+
+        results_data = {
+            **self.RESULTS_DATA,
+            "overall": {
+                "enrollments": {
+                    "all": {"control": {"is_control": False}},
+                },
+            },
+        }
+        NimbusAnalysisResult.objects.store(self.experiment, results_data)
+
+        self.assertEqual(
+            NimbusAnalysisResult.objects.get_results_data(self.experiment),
+            results_data,
+        )
+        self.assertEqual(self.experiment.analysis_results.count(), 4)
+        self.assertTrue(
+            set(self.experiment.analysis_results.values_list("id", flat=True))
+            <= result_ids
+        )
+
+    def test_store_does_not_touch_other_experiments(self):
+        other_experiment = NimbusExperimentFactory.create()
+        NimbusAnalysisResult.objects.store(other_experiment, self.RESULTS_DATA)
+
+        NimbusAnalysisResult.objects.store(self.experiment, {})
+
+        self.assertEqual(
+            NimbusAnalysisResult.objects.get_results_data(other_experiment),
+            self.RESULTS_DATA,
+        )
+        self.assertEqual(
+            NimbusAnalysisResult.objects.get_results_data(self.experiment), {}
+        )
+
+    def test_get_results_data_for_window(self):
+        NimbusAnalysisResult.objects.store(self.experiment, self.RESULTS_DATA)
+
+        self.assertEqual(
+            NimbusAnalysisResult.objects.get_results_data(
+                self.experiment, window="weekly"
+            ),
+            {
+                "metadata": {"metrics": {}},
+                "show_analysis": True,
+                "errors": {"experiment": []},
+                "weekly": self.RESULTS_DATA["weekly"],
+            },
+        )
+
+    def test_get_results_data_for_segment(self):
+        NimbusAnalysisResult.objects.store(self.experiment, self.RESULTS_DATA)
+
+        self.assertEqual(
+            NimbusAnalysisResult.objects.get_results_data(
+                self.experiment, segment="mobile"
+            ),
+            {
+                "metadata": {"metrics": {}},
+                "show_analysis": True,
+                "errors": {"experiment": []},
+                "daily": None,
+                "weekly": {
+                    "enrollments": {"mobile": {"control": {"is_control": True}}},
+                },
+                "overall": {
+                    "enrollments": {"mobile": {"control": {"is_control": True}}},
+                    "exposures": {},
+                },
+            },
+        )
+
+    def test_get_results_data_for_window_and_segment(self):
+        NimbusAnalysisResult.objects.store(self.experiment, self.RESULTS_DATA)
+
+        self.assertEqual(
+            NimbusAnalysisResult.objects.get_results_data(
+                self.experiment, window="overall", segment="all"
+            ),
+            {
+                "metadata": {"metrics": {}},
+                "show_analysis": True,
+                "errors": {"experiment": []},
+                "overall": {
+                    "enrollments": {"all": {"control": {"is_control": True}}},
+                    "exposures": {"all": {"control": {"is_control": True}}},
+                },
+            },
+        )
+
+    def test_str(self):
+        NimbusAnalysisResult.objects.store(self.experiment, self.RESULTS_DATA)
+        result = self.experiment.analysis_results.get(
+            window="overall", analysis_basis="exposures", segment="all"
+        )
+        self.assertEqual(str(result), "experiment: overall exposures all")
+
+
+class TestNimbusAnalysisSummaryManager(TestCase):
+    @staticmethod
+    def branch_results(is_control, significance):
+        return {
+            "is_control": is_control,
+            "branch_data": {
+                "other_metrics": {
+                    "retained": {"significance": significance},
+                },
+                "usage_metrics": {},
+            },
+        }
+
+    def setUp(self):
+        super().setUp()
+        self.experiment = NimbusExperimentFactory.create(name="experiment")
+        self.results_data = {
+            "metadata": None,
+            "errors": {
+                "experiment": [{"message": "error 1"}, {"message": "error 2"}],
+                "retained": [{"message": "error 3"}],
+            },
+            "overall": {
+                "enrollments": {
+                    "all": {
+                        "control": self.branch_results(
+                            True,
+                            {
+                                "control": {"overall": {}, "weekly": {}},
+                                "treatment-a": {"overall": {}, "weekly": {}},
+                                "treatment-b": {"overall": {}, "weekly": {}},
+                            },
+                        ),
+                        "treatment-a": self.branch_results(
+                            False,
+                            {
+                                "control": {"overall": {"1": "positive"}, "weekly": {}},
+                                "treatment-b": {"overall": {"1": "neutral"}},
+                            },
+                        ),
+                        "treatment-b": self.branch_results(
+                            False,
+                            {"control": {"overall": {1: "negative"}, "weekly": {}}},
+                        ),
+                    },
+                },
+            },
+        }
+
+    def test_summarize(self):
+        summary = NimbusAnalysisSummary.objects.summarize(
+            self.experiment, self.results_data, ["retained", "missing"]
+        )
+
+        self.assertEqual(summary.experiment, self.experiment)
+        self.assertTrue(summary.has_displayable_results)
+        self.assertEqual(summary.error_count, 3)
+        self.assertEqual(
+            summary.primary_metric_significance,
+            {"retained": {"treatment-a": "positive", "treatment-b": "negative"}},
+        )
+        self.assertEqual(str(summary), "experiment: analysis summary")
+
+    def test_summarize_updates_existing_summary(self):
+        NimbusAnalysisSummary.objects.summarize(
+            self.experiment, self.results_data, ["retained"]
+        )
+        NimbusAnalysisSummary.objects.summarize(self.experiment, {"overall": None})
+
+        summary = NimbusAnalysisSummary.objects.get(experiment=self.experiment)
+        self.assertFalse(summary.has_displayable_results)
+        self.assertEqual(summary.error_count, 0)
+        self.assertEqual(summary.primary_metric_significance, {})
+
+    def test_store_results_summarizes_results(self):
+        self.assertFalse(self.experiment.has_displayable_results)
+
+        NimbusAnalysisResult.objects.store(
+            self.experiment, self.results_data, ["retained"]
+        )
+
+        experiment = NimbusExperiment.objects.get(id=self.experiment.id)
+        self.assertTrue(experiment.has_displayable_results)
+        self.assertEqual(experiment.analysis_summary.error_count, 3)
+        self.assertEqual(
+            experiment.analysis_summary.primary_metric_significance,
+            {"retained": {"treatment-a": "positive", "treatment-b": "negative"}},
+        )
+
+
 @parameterized_class(("application",), [list(NimbusExperiment.Application)])
 class TestNimbusIsolationGroup(TestCase):
     def test_empty_isolation_group_creates_isolation_group_and_bucket_range(self):
@@ -3977,6 +4232,367 @@ class NimbusFeatureConfigTests(TestCase):
             ),
         )
 
+    def test_get_versioned_schema_ranges(self):
+        versions = {
+            (v.major, v.minor, v.patch): v
+            for v in NimbusFeatureVersion.objects.bulk_create(
+                NimbusFeatureVersion(major=major, minor=0, patch=0)
+                for major in (121, 122, 123)
+            )
+        }
+        supported_feature = NimbusFeatureConfigFactory.create(
+            application=NimbusConstants.Application.DESKTOP
+        )
+        supported_schemas = {
+            schema.version: schema
+            for schema in NimbusVersionedSchema.objects.bulk_create(
+                NimbusVersionedSchemaFactory.build(
+                    feature_config=supported_feature,
+                    version=version,
+                )
+                for version in versions.values()
+            )
+        }
+        partial_feature = NimbusFeatureConfigFactory.create(
+            application=NimbusConstants.Application.DESKTOP
+        )
+        partial_schema = NimbusVersionedSchemaFactory.create(
+            feature_config=partial_feature, version=versions[(122, 0, 0)]
+        )
+        unsupported_feature = NimbusFeatureConfigFactory.create(
+            application=NimbusConstants.Application.DESKTOP
+        )
+        NimbusVersionedSchemaFactory.create(
+            feature_config=unsupported_feature,
+            version=NimbusFeatureVersion.objects.create(major=130, minor=0, patch=0),
+        )
+        unversioned_feature = NimbusFeatureConfigFactory.create(
+            application=NimbusConstants.Application.DESKTOP
+        )
+        unversioned_schema = unversioned_feature.schemas.get(version=None)
+
+        min_version = packaging.version.Version("121.0.0")
+        max_version = packaging.version.Version("124.0.0")
+
+        with self.assertNumQueries(4):
+            ranges = NimbusFeatureConfig.get_versioned_schema_ranges(
+                [
+                    supported_feature,
+                    partial_feature,
+                    unsupported_feature,
+                    unversioned_feature,
+                ],
+                min_version,
+                max_version,
+            )
+
+        self.assertEqual(
+            ranges,
+            {
+                supported_feature.id: NimbusFeatureConfig.VersionedSchemaRange(
+                    min_version=min_version,
+                    max_version=max_version,
+                    schemas=[
+                        supported_schemas[versions[v]]
+                        for v in ((123, 0, 0), (122, 0, 0), (121, 0, 0))
+                    ],
+                    unsupported_in_range=False,
+                    unsupported_versions=[],
+                ),
+                partial_feature.id: NimbusFeatureConfig.VersionedSchemaRange(
+                    min_version=min_version,
+                    max_version=max_version,
+                    schemas=[partial_schema],
+                    unsupported_in_range=False,
+                    unsupported_versions=[versions[(123, 0, 0)], versions[(121, 0, 0)]],
+                ),
+                unsupported_feature.id: NimbusFeatureConfig.VersionedSchemaRange(
+                    min_version=min_version,
+                    max_version=max_version,
+                    schemas=[],
+                    unsupported_in_range=True,
+                    unsupported_versions=[],
+                ),
+                unversioned_feature.id: NimbusFeatureConfig.VersionedSchemaRange(
+                    min_version=min_version,
+                    max_version=max_version,
+                    schemas=[unversioned_schema],
+                    unsupported_in_range=False,
+                    unsupported_versions=[],
+                ),
+            },
+        )
+
+    def test_get_versioned_schema_ranges_matches_single_feature_range(self):
+        version = NimbusFeatureVersion.objects.create(major=121, minor=0, patch=0)
+        features = [
+            NimbusFeatureConfigFactory.create(
+                application=NimbusConstants.Application.DESKTOP
+            )
+            for _ in range(3)
+        ]
+        NimbusVersionedSchema.objects.bulk_create(
+            NimbusVersionedSchemaFactory.build(feature_config=feature, version=version)
+            for feature in features[:2]
+        )
+        min_version = packaging.version.Version("120.0.0")
+
+        ranges = NimbusFeatureConfig.get_versioned_schema_ranges(
+            features, min_version, None
+        )
+
+        self.assertEqual(
+            ranges,
+            {
+                feature.id: feature.get_versioned_schema_range(min_version, None)
+                for feature in features
+            },
+        )
+
+
+class NimbusFeatureManifestTests(TestCase):
+    def test_application_has_one_unversioned_manifest(self):
+        NimbusFeatureManifest.objects.create(
+            application=NimbusExperiment.Application.FENIX, content_hash="hash"
+        )
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            NimbusFeatureManifest.objects.create(
+                application=NimbusExperiment.Application.FENIX, content_hash="hash"
+            )
+
+        NimbusFeatureManifest.objects.create(
+            application=NimbusExperiment.Application.IOS, content_hash="hash"
+        )
+
+    def test_application_has_one_manifest_per_version(self):
+        version = NimbusFeatureVersion.objects.create(major=121, minor=0, patch=0)
+        NimbusFeatureManifest.objects.create(
+            application=NimbusExperiment.Application.FENIX,
+            version=version,
+            content_hash="hash",
+        )
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            NimbusFeatureManifest.objects.create(
+                application=NimbusExperiment.Application.FENIX,
+                version=version,
+                content_hash="hash",
+            )
+
+        NimbusFeatureManifest.objects.create(
+            application=NimbusExperiment.Application.FENIX, content_hash="hash"
+        )
+
+
+class NimbusFeatureVersionTests(TestCase):
+    def test_packed_version_is_generated(self):
+        version = NimbusFeatureVersion.objects.create(major=121, minor=2, patch=3)
+        version.refresh_from_db()
+
+        self.assertEqual(version.packed, 121_002_003)
+        self.assertEqual(version.packed, NimbusFeatureVersion.pack(121, 2, 3))
+
+    @parameterized.expand(
+        [
+            (121, 1000, 0),
+            (121, 0, 1000),
+            (121, -1, 0),
+            (121, 0, -1),
+        ]
+    )
+    def test_versions_that_cannot_be_packed_are_rejected(self, major, minor, patch):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            NimbusFeatureVersion.objects.create(major=major, minor=minor, patch=patch)
+
+        self.assertFalse(NimbusFeatureVersion.objects.exists())
+
+    def test_between_versions_q(self):
+        versions = {
+            (v.major, v.minor, v.patch): v
+            for v in NimbusFeatureVersion.objects.bulk_create(
+                NimbusFeatureVersion(major=major, minor=minor, patch=patch)
+                for major in (120, 121, 122)
+                for minor in (0, 10)
+                for patch in (0, 5)
+            )
+        }
+
+        results = NimbusFeatureVersion.objects.filter(
+            NimbusFeatureVersion.objects.between_versions_q(
+                packaging.version.Version("120.10.5"),
+                packaging.version.Version("122.0.5"),
+            )
+        ).order_by("packed")
+
+        self.assertEqual(
+            list(results),
+            [
+                versions[v]
+                for v in (
+                    (120, 10, 5),
+                    (121, 0, 0),
+                    (121, 0, 5),
+                    (121, 10, 0),
+                    (121, 10, 5),
+                    (122, 0, 0),
+                )
+            ],
+        )
+
+    def test_between_versions_q_without_max_version(self):
+        NimbusFeatureVersion.objects.bulk_create(
+            NimbusFeatureVersion(major=major, minor=0, patch=0)
+            for major in (120, 121, 122)
+        )
+
+        results = NimbusFeatureVersion.objects.filter(
+            NimbusFeatureVersion.objects.between_versions_q(
+                packaging.version.Version("121"), None
+            )
+        )
+
+        self.assertEqual({v.major for v in results}, {121, 122})
+
+
+class NimbusVersionedSchemaTests(TestCase):
+    def test_desktop_set_pref_index(self):
+        versions = {
+            v.major: v
+            for v in NimbusFeatureVersion.objects.bulk_create(
+                NimbusFeatureVersion(major=major, minor=0, patch=0)
+                for major in (120, 121, 122, 123)
+            )
+        }
+        feature_1 = NimbusFeatureConfigFactory.create(
+            slug="feature-1", application=NimbusConstants.Application.DESKTOP
+        )
+        feature_2 = NimbusFeatureConfigFactory.create(
+            slug="feature-2", application=NimbusConstants.Application.DESKTOP
+        )
+        mobile_feature = NimbusFeatureConfigFactory.create(
+            application=NimbusConstants.Application.FENIX
+        )
+        NimbusVersionedSchema.objects.bulk_create(
+            [
+                *(
+                    NimbusVersionedSchemaFactory.build(
+                        feature_config=feature_1,
+                        version=versions[major],
+                        set_pref_vars={"foo": "foo.pref", "bar": "bar.pref"},
+                    )
+                    for major in (120, 121, 122, 123)
+                ),
+                NimbusVersionedSchemaFactory.build(
+                    feature_config=feature_2,
+                    version=versions[121],
+                    set_pref_vars={"baz": "foo.pref"},
+                ),
+                NimbusVersionedSchemaFactory.build(
+                    feature_config=feature_2,
+                    version=versions[122],
+                    set_pref_vars={},
+                ),
+                NimbusVersionedSchemaFactory.build(
+                    feature_config=mobile_feature,
+                    version=versions[121],
+                    set_pref_vars={"foo": "mobile.pref"},
+                ),
+            ]
+        )
+
+        index = NimbusVersionedSchema.desktop_set_pref_index(
+            packaging.version.Version("121.0.0"), packaging.version.Version("123.0.0")
+        )
+
+        self.assertEqual(
+            {
+                pref: {slug: sorted(versions) for slug, versions in features.items()}
+                for pref, features in index.items()
+            },
+            {
+                "foo.pref": {
+                    "feature-1": [
+                        packaging.version.Version("121.0.0"),
+                        packaging.version.Version("122.0.0"),
+                    ],
+                    "feature-2": [packaging.version.Version("121.0.0")],
+                },
+                "bar.pref": {
+                    "feature-1": [
+                        packaging.version.Version("121.0.0"),
+                        packaging.version.Version("122.0.0"),
+                    ],
+                },
+            },
+        )
+
+    def test_schemas_with_the_same_text_share_a_feature_schema(self):
+        versions = NimbusFeatureVersion.objects.bulk_create(
+            NimbusFeatureVersion(major=major, minor=0, patch=0) for major in (120, 121)
+        )
+        feature_config = NimbusFeatureConfigFactory.create(schemas=[])
+        schema = json.dumps({"type": "object"})
+
+        NimbusVersionedSchema.objects.bulk_create(
+            NimbusVersionedSchemaFactory.build(
+                feature_config=feature_config, version=version, schema=schema
+            )
+            for version in versions
+        )
+        NimbusVersionedSchemaFactory.create(
+            feature_config=feature_config, version=None, schema=schema
+        )
+
+        self.assertEqual(
+            NimbusFeatureSchema.objects.filter(
+                hash=NimbusFeatureSchema.hash_schema(schema)
+            ).count(),
+            1,
+        )
+        for versioned_schema in feature_config.schemas.all():
+            self.assertEqual(
+                versioned_schema.schema_hash, NimbusFeatureSchema.hash_schema(schema)
+            )
+            self.assertEqual(versioned_schema.schema, schema)
+
+    def test_updating_schema_stores_new_feature_schema(self):
+        versioned_schema = NimbusVersionedSchemaFactory.create(version=None)
+        schema = json.dumps({"type": "string"})
+
+        versioned_schema.schema = schema
+        NimbusVersionedSchema.objects.bulk_update([versioned_schema], ["schema_content"])
+
+        versioned_schema = NimbusVersionedSchema.objects.get(id=versioned_schema.id)
+        self.assertEqual(versioned_schema.schema, schema)
+
+    def test_schema_is_copied_to_legacy_column(self):
+        versioned_schema = NimbusVersionedSchemaFactory.create(version=None)
+        schema = json.dumps({"type": "string"})
+
+        versioned_schema.schema = schema
+        NimbusVersionedSchema.objects.bulk_update([versioned_schema], ["schema_content"])
+
+        self.assertEqual(
+            NimbusVersionedSchema.objects.filter(id=versioned_schema.id)
+            .values_list("legacy_schema", flat=True)
+            .get(),
+            schema,
+        )
+        self.assertEqual(
+            NimbusVersionedSchema.objects.get(
+                id=versioned_schema.id
+            ).get_deferred_fields(),
+            {"legacy_schema"},
+        )
+
+    def test_schema_can_be_none(self):
+        versioned_schema = NimbusVersionedSchemaFactory.create(version=None, schema=None)
+
+        versioned_schema = NimbusVersionedSchema.objects.get(id=versioned_schema.id)
+        self.assertIsNone(versioned_schema.schema)
+        self.assertIsNone(versioned_schema.schema_hash)
+
 
 class ApplicationConfigTests(TestCase):
     application_config = experimenter.experiments.constants.APPLICATION_CONFIG_DESKTOP
@@ -1,6 +1,8 @@
+import hashlib
 import json
 import re
 from dataclasses import dataclass
+from importlib.metadata import version as package_version
 from pathlib import Path
 from typing import Iterable, Optional, Union
 
@@ -14,6 +16,8 @@ from mozilla_nimbus_schemas.experiments.feature_manifests import (
     FeatureWithoutExposure,
 )
 
+from experimenter.base import pickle_cache
+from experimenter.base.checks import Tags
 from experimenter.experiments.constants import ApplicationConfig, NimbusConstants
 from manifesttool.version import Version
 
@@ -29,6 +33,12 @@ FEATURE_PYTHON_TYPES = {
     FeatureVariableType.BOOLEAN: bool,
 }
 
+# Part of every manifest's hash. Bump this whenever a change to Feature,
+# Features._read_manifest, Feature.generate_jsonschema or load_feature_configs
+# changes what is cached or stored for an unchanged manifest, so that stale
+# pickles are ignored and the next load does not skip it.
+FEATURE_LOADER_VERSION = 1
+
 
 @dataclass
 class Feature:
@@ -46,11 +56,7 @@ class Feature:
                 / self.model.json_schema.path
             )
 
-            with schema_path.open() as f:
-                try:
-                    return json.dumps(json.load(f), indent=2)
-                except json.JSONDecodeError:
-                    return None
+            return Features.read_jsonschema(schema_path)
 
     def generate_jsonschema(self):
         schema = {
@@ -81,8 +87,20 @@ class Feature:
         return self.generate_jsonschema()
 
 
+ManifestKey = tuple[str, Optional[Version]]
+
+
 class Features:
-    _features: Optional[list[Feature]] = None
+    # Features are loaded lazily, one manifest at a time, and indexed by
+    # (application slug, version). The unversioned manifest has a version of
+    # None and an application's versioned manifests are only discovered once
+    # they are asked for.
+    _unversioned_manifest_paths: dict[str, Optional[Path]] = {}
+    _versioned_manifest_paths: dict[str, dict[Version, Path]] = {}
+    _features: dict[ManifestKey, list[Feature]] = {}
+    _cached_manifests: Optional[dict[ManifestKey, tuple[str, bytes]]] = None
+    _schema_hashes: dict[Path, str] = {}
+    _jsonschemas: dict[Path, Optional[str]] = {}
 
     @classmethod
     def _read_manifest(
@@ -104,59 +122,225 @@ class Features:
                 )
 
     @classmethod
-    def _load_features(cls):
-        features = []
-        version_re = re.compile(r"^v(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)")
+    def _unversioned_manifest(cls, application_slug: str) -> Optional[Path]:
+        if application_slug not in cls._unversioned_manifest_paths:
+            manifest_path = (
+                settings.FEATURE_MANIFESTS_PATH / application_slug / "experimenter.yaml"
+            )
+            cls._unversioned_manifest_paths[application_slug] = (
+                manifest_path if manifest_path.exists() else None
+            )
 
-        for application in NimbusConstants.APPLICATION_CONFIGS.values():
-            application_dir: Path = settings.FEATURE_MANIFESTS_PATH / application.slug
-            application_yaml_path = application_dir / "experimenter.yaml"
+        return cls._unversioned_manifest_paths[application_slug]
 
-            if application_yaml_path.exists():
-                features.extend(cls._read_manifest(application, application_yaml_path))
+    @classmethod
+    def _versioned_manifests(cls, application_slug: str) -> dict[Version, Path]:
+        if application_slug not in cls._versioned_manifest_paths:
+            version_re = re.compile(r"^v(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)")
+            manifest_paths = {}
 
+            if cls._unversioned_manifest(application_slug) is not None:
+                application_dir = settings.FEATURE_MANIFESTS_PATH / application_slug
                 for child in application_dir.iterdir():
                     if not child.is_dir():
                         continue
 
                     if m := version_re.match(child.name):
-                        version = Version.from_match(m.groupdict())
+                        manifest_path = child / "experimenter.yaml"
+                        if manifest_path.exists():
+                            version = Version.from_match(m.groupdict())
+                            manifest_paths[version] = manifest_path
+
+            cls._versioned_manifest_paths[application_slug] = manifest_paths
+
+        return cls._versioned_manifest_paths[application_slug]
+
+    @classmethod
+    def _manifest_paths(
+        cls,
+        application_slug: Optional[str] = None,
+        unversioned: bool = True,
+        versioned: bool = True,
+    ) -> Iterable[tuple[ApplicationConfig, Path, Optional[Version]]]:
+        for application in NimbusConstants.APPLICATION_CONFIGS.values():
+            if application_slug is not None and application.slug != application_slug:
+                continue
+
+            manifest_path = cls._unversioned_manifest(application.slug)
+            if manifest_path is None:
+                continue
+
+            if unversioned:
+                yield application, manifest_path, None
+
+            if versioned:
+                for version, manifest_path in cls._versioned_manifests(
+                    application.slug
+                ).items():
+                    yield application, manifest_path, version
+
+    @classmethod
+    def _manifest_hash(cls, manifest_path: Path) -> str:
+        # The cache holds pickled schema models, so each entry is only valid
+        # for the manifest, schema package and loader versions it was built from.
+        digest = hashlib.sha256(package_version("mozilla-nimbus-schemas").encode())
+        digest.update(f"loader {FEATURE_LOADER_VERSION}".encode())
+        digest.update(manifest_path.read_bytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def _parse_manifests(cls, manifest_paths) -> list[Feature]:
+        features = []
+        for application, manifest_path, version in manifest_paths:
+            features.extend(cls._read_manifest(application, manifest_path, version))
+        return features
+
+    @classmethod
+    def _load_cached_features(
+        cls, key: ManifestKey, manifest_path: Path
+    ) -> Optional[list[Feature]]:
+        if cls._cached_manifests is None:
+            # The cache file is read once; each manifest's features are only
+            # unpickled when that manifest is first used.
+            cached_manifests = pickle_cache.load(settings.FEATURE_MANIFESTS_CACHE_PATH)
+            cls._cached_manifests = (
+                cached_manifests if isinstance(cached_manifests, dict) else {}
+            )
+
+        if (cached := cls._cached_manifests.get(key)) is None:
+            return None
+
+        manifest_hash, pickled_features = cached
+        if manifest_hash != cls._manifest_hash(manifest_path):
+            return None
+
+        return pickle_cache.loads(pickled_features)
 
-                        application_yaml_path = child / "experimenter.yaml"
-                        if application_yaml_path.exists():
-                            features.extend(
-                                cls._read_manifest(
-                                    application, application_yaml_path, version
-                                )
-                            )
+    @classmethod
+    def _load_features(cls, manifest_paths) -> list[Feature]:
+        features = []
+
+        for application, manifest_path, version in manifest_paths:
+            key = (application.slug, version)
+            if key not in cls._features:
+                manifest_features = cls._load_cached_features(key, manifest_path)
+                if manifest_features is None:
+                    manifest_features = list(
+                        cls._read_manifest(application, manifest_path, version)
+                    )
+                cls._features[key] = manifest_features
+
+            features.extend(cls._features[key])
+
+        return features
+
+    @classmethod
+    def build_cache(cls) -> list[Feature]:
+        """Parse every manifest and write the pre-validated features to
+        FEATURE_MANIFESTS_CACHE_PATH so later processes can skip the YAML."""
+        features = []
+        cached_manifests = {}
+
+        for application, manifest_path, version in cls._manifest_paths():
+            manifest_features = list(
+                cls._read_manifest(application, manifest_path, version)
+            )
+            cached_manifests[(application.slug, version)] = (
+                cls._manifest_hash(manifest_path),
+                pickle_cache.dumps(manifest_features),
+            )
+            features.extend(manifest_features)
+
+        pickle_cache.dump(settings.FEATURE_MANIFESTS_CACHE_PATH, cached_manifests)
 
         return features
 
     @classmethod
     def clear_cache(cls):
-        cls._features = None
+        cls._unversioned_manifest_paths = {}
+        cls._versioned_manifest_paths = {}
+        cls._features = {}
+        cls._cached_manifests = None
+        cls._schema_hashes = {}
+        cls._jsonschemas = {}
 
     @classmethod
-    def all(cls) -> list[Feature]:
-        if cls._features is None:
-            cls._features = cls._load_features()
+    def read_jsonschema(cls, schema_path: Path) -> Optional[str]:
+        # Remote schemas are shared by every version of a feature, so each file
+        # is only read and re-serialized once.
+        if schema_path not in cls._jsonschemas:
+            with schema_path.open() as f:
+                try:
+                    cls._jsonschemas[schema_path] = json.dumps(json.load(f), indent=2)
+                except json.JSONDecodeError:
+                    cls._jsonschemas[schema_path] = None
+
+        return cls._jsonschemas[schema_path]
+
+    @classmethod
+    def manifests(cls) -> Iterable[ManifestKey]:
+        for application, _manifest_path, version in cls._manifest_paths():
+            yield application.slug, version
+
+    @classmethod
+    def content_hash(cls, application_slug: str, version: Optional[Version]) -> str:
+        """Hash a manifest together with every JSON schema file that its
+        features reference, which are shared between versions, and the
+        version of the code that loads them."""
+        if version is None:
+            manifest_path = cls._unversioned_manifest(application_slug)
+        else:
+            manifest_path = cls._versioned_manifests(application_slug)[version]
+
+        digest = hashlib.sha256(cls._manifest_hash(manifest_path).encode())
+
+        schema_paths = sorted(
+            {
+                f.model.json_schema.path
+                for f in cls.by_version(application_slug, version)
+                if f.model.json_schema is not None
+            }
+        )
+        for schema_path in schema_paths:
+            path = (
+                settings.FEATURE_MANIFESTS_PATH
+                / application_slug
+                / "schemas"
+                / schema_path
+            )
+            if path not in cls._schema_hashes:
+                cls._schema_hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+
+            digest.update(schema_path.encode())
+            digest.update(cls._schema_hashes[path].encode())
+
+        return digest.hexdigest()
 
-        return cls._features
+    @classmethod
+    def all(cls) -> list[Feature]:
+        return cls._load_features(cls._manifest_paths())
 
     @classmethod
     def by_application(cls, application) -> list[Feature]:
-        return [f for f in cls.all() if f.application_slug == application]
+        return cls._load_features(cls._manifest_paths(application))
+
+    @classmethod
+    def by_version(cls, application, version: Optional[Version]) -> list[Feature]:
+        manifest_paths = cls._manifest_paths(
+            application, unversioned=version is None, versioned=version is not None
+        )
+        return cls._load_features(m for m in manifest_paths if m[2] == version)
 
     @classmethod
     def unversioned(cls) -> Iterable[Feature]:
-        return (f for f in cls.all() if f.version is None)
+        return cls._load_features(cls._manifest_paths(versioned=False))
 
     @classmethod
     def versioned(cls) -> Iterable[Feature]:
-        return (f for f in cls.all() if f.version is not None)
+        return cls._load_features(cls._manifest_paths(unversioned=False))
 
 
-@register()
+@register(Tags.external_data, deploy=True)
 def check_features(app_configs, **kwargs):
     errors = []
 
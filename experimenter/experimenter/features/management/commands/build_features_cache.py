@@ -0,0 +1,49 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from experimenter.features import Features
+
+logger = logging.getLogger()
+
+
+class Command(BaseCommand):
+    help = "Compile all feature manifests into a single pre-parsed cache file"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--benchmark",
+            action="store_true",
+            help="Compare loading features from the manifests and from the cache",
+        )
+
+    def handle(self, *args, **options):
+        logger.info("Building features cache")
+
+        start = time.monotonic()
+        features = Features.build_cache()
+
+        logger.info(
+            f"Cached {len(features)} features to "
+            f"{settings.FEATURE_MANIFESTS_CACHE_PATH} in "
+            f"{time.monotonic() - start:.2f}s"
+        )
+
+        if options["benchmark"]:
+            manifest_paths = list(Features._manifest_paths())
+
+            start = time.monotonic()
+            Features._parse_manifests(manifest_paths)
+            yaml_duration = time.monotonic() - start
+
+            Features.clear_cache()
+            start = time.monotonic()
+            Features.all()
+            cache_duration = time.monotonic() - start
+
+            logger.info(
+                f"Loaded features from manifests in {yaml_duration:.2f}s and "
+                f"from the cache in {cache_duration:.2f}s"
+            )
@@ -9,6 +9,8 @@ from mozilla_nimbus_schemas.experiments.feature_manifests import SetPref
 from experimenter.experiments.constants import NO_FEATURE_SLUG, Application
 from experimenter.experiments.models import (
     NimbusFeatureConfig,
+    NimbusFeatureManifest,
+    NimbusFeatureSchema,
     NimbusFeatureVersion,
     NimbusVersionedSchema,
 )
@@ -21,6 +23,13 @@ logger = logging.getLogger()
 class Command(BaseCommand):
     help = "Load Feature Configs from remote sources"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Reload every manifest, even those that have not changed",
+        )
+
     @transaction.atomic
     def handle(self, *args, **options):
         logger.info("Loading Features")
@@ -37,6 +46,10 @@ class Command(BaseCommand):
 
         features_to_disable = set(feature_configs.keys())
 
+        # Feature configs created during this run have no schemas yet, so any
+        # manifest that contains them must be loaded even if it is unchanged.
+        created_features: set[tuple[str, str]] = set()
+
         # Iterate through the unversioned features first for the initial
         #
         # Then we can iterate over the versioned feature and create any that
@@ -74,6 +87,7 @@ class Command(BaseCommand):
                 # into a bulk_create, as it does not noticably impact
                 # performance.
                 feature_config.save()
+                created_features.add(key)
             else:
                 # Django doesn't keep track of whether or not fields were updated
                 # when you call save(). By default, it will update every field in
@@ -134,6 +148,13 @@ class Command(BaseCommand):
 
         NimbusFeatureVersion.objects.bulk_create(versions_to_create)
 
+        # A mapping of (application, version.id) to the manifest hashes recorded
+        # the last time each manifest was loaded.
+        manifests: dict[tuple[str, Optional[int]], NimbusFeatureManifest] = {
+            (manifest.application, manifest.version_id): manifest
+            for manifest in NimbusFeatureManifest.objects.all()
+        }
+
         # A mapping of (feature_config.id, version.id) to NimbusVersionedSchemas.
         schemas: dict[tuple[int, Optional[int]], NimbusVersionedSchema] = {
             (schema.feature_config_id, schema.version_id): schema
@@ -142,65 +163,112 @@ class Command(BaseCommand):
 
         # If we call .save() on a newly created model, Django will not properly
         # aggregate all the model creations into a single operation. It is
-        # faster to call save() only for updates and use bulk_create() for
-        # inserts.
+        # faster to bulk_create() inserts and bulk_update() the changed rows.
         schemas_to_create = []
-        for feature in Features.all():
-            feature_config = feature_configs[(feature.application_slug, feature.slug)]
-
+        schemas_to_update = []
+        schema_fields_to_update: set[str] = set()
+        manifests_to_create = []
+        manifests_to_update = []
+        for application_slug, manifest_version in Features.manifests():
             feature_version: Optional[NimbusFeatureVersion] = None
             feature_version_id: Optional[int] = None
-            if feature.version:
-                feature_version = versions[feature.version]
+            if manifest_version:
+                feature_version = versions[manifest_version]
                 feature_version_id = feature_version.id
 
-            dirty_fields = []
-            created = False
-
-            schema = schemas.get((feature_config.id, feature_version_id))
-            if schema is None:
-                created = True
-                schema = NimbusVersionedSchema(
-                    feature_config=feature_config,
-                    version=feature_version,
-                    is_early_startup=feature.model.is_early_startup or False,
-                    set_pref_vars={},
+            manifest_features = Features.by_version(application_slug, manifest_version)
+            content_hash = Features.content_hash(application_slug, manifest_version)
+            manifest = manifests.get((application_slug, feature_version_id))
+
+            if (
+                not options["force"]
+                and manifest is not None
+                and manifest.content_hash == content_hash
+                and not any(
+                    (feature.application_slug, feature.slug) in created_features
+                    for feature in manifest_features
+                )
+            ):
+                logger.info(
+                    f"Manifest Unchanged: {application_slug} "
+                    f"(version {manifest_version})"
                 )
+                continue
 
-            if (jsonschema := feature.get_jsonschema()) is not None:
-                if schema.schema != jsonschema:
-                    schema.schema = jsonschema
-                    dirty_fields.append("schema")
-
-            if feature_config.application == Application.DESKTOP:
-                set_pref_vars = {
-                    var_name: _set_pref_name(var.set_pref)
-                    for var_name, var in feature.model.variables.items()
-                    if var.set_pref is not None
-                }
-
-                if schema.set_pref_vars != set_pref_vars:
-                    schema.set_pref_vars = set_pref_vars
-                    dirty_fields.append("set_pref_vars")
-
-                if (
-                    feature.model.is_early_startup is not None
-                    and schema.is_early_startup != feature.model.is_early_startup
-                ):
-                    schema.is_early_startup = feature.model.is_early_startup
-                    dirty_fields.append("is_early_startup")
-
-            if created:
-                schemas_to_create.append(schema)
-            elif dirty_fields:
-                schema.save(update_fields=dirty_fields)
-
-            logger.info(
-                f"Feature Loaded: {feature.application_slug}/{feature.slug} "
-                f"(version {feature.version})"
-            )
+            for feature in manifest_features:
+                feature_config = feature_configs[(feature.application_slug, feature.slug)]
+
+                dirty_fields = []
+                created = False
+
+                schema = schemas.get((feature_config.id, feature_version_id))
+                if schema is None:
+                    created = True
+                    schema = NimbusVersionedSchema(
+                        feature_config=feature_config,
+                        version=feature_version,
+                        is_early_startup=feature.model.is_early_startup or False,
+                        set_pref_vars={},
+                    )
+
+                if (jsonschema := feature.get_jsonschema()) is not None:
+                    # Compare hashes so the stored schema text is never loaded.
+                    if schema.schema_hash != NimbusFeatureSchema.hash_schema(jsonschema):
+                        schema.schema = jsonschema
+                        dirty_fields.append("schema_content")
+
+                if feature_config.application == Application.DESKTOP:
+                    set_pref_vars = {
+                        var_name: _set_pref_name(var.set_pref)
+                        for var_name, var in feature.model.variables.items()
+                        if var.set_pref is not None
+                    }
+
+                    if schema.set_pref_vars != set_pref_vars:
+                        schema.set_pref_vars = set_pref_vars
+                        dirty_fields.append("set_pref_vars")
+
+                    if (
+                        feature.model.is_early_startup is not None
+                        and schema.is_early_startup != feature.model.is_early_startup
+                    ):
+                        schema.is_early_startup = feature.model.is_early_startup
+                        dirty_fields.append("is_early_startup")
+
+                if created:
+                    schemas_to_create.append(schema)
+                elif dirty_fields:
+                    schemas_to_update.append(schema)
+                    schema_fields_to_update.update(dirty_fields)
+
+                logger.info(
+                    f"Feature Loaded: {feature.application_slug}/{feature.slug} "
+                    f"(version {feature.version})"
+                )
+
+            if manifest is None:
+                manifests_to_create.append(
+                    NimbusFeatureManifest(
+                        application=application_slug,
+                        version=feature_version,
+                        content_hash=content_hash,
+                    )
+                )
+            elif manifest.content_hash != content_hash:
+                manifest.content_hash = content_hash
+                manifests_to_update.append(manifest)
 
         NimbusVersionedSchema.objects.bulk_create(schemas_to_create)
+        if schemas_to_update:
+            NimbusVersionedSchema.objects.bulk_update(
+                schemas_to_update, sorted(schema_fields_to_update)
+            )
+        NimbusFeatureManifest.objects.bulk_create(manifests_to_create)
+        NimbusFeatureManifest.objects.bulk_update(manifests_to_update, ["content_hash"])
+
+        # Schemas are shared between versions, so a schema is only unused once
+        # every versioned schema that referenced it has changed.
+        NimbusFeatureSchema.objects.prune()
 
         logger.info("Features Updated")
 
@@ -0,0 +1,59 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from experimenter.experiments.constants import NimbusConstants
+from experimenter.features.manifests.nimbus_fml_loader import NimbusFmlLoader
+
+logger = logging.getLogger()
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-load FML clients for the most recent versions of every mobile "
+        "application and channel"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--application",
+            action="append",
+            dest="applications",
+            choices=[
+                application
+                for application in NimbusConstants.Application
+                if NimbusConstants.Application.is_mobile(application)
+            ],
+            help="Only load clients for this application (may be repeated)",
+        )
+        parser.add_argument(
+            "--recent-versions",
+            type=int,
+            default=settings.FML_PRELOAD_RECENT_VERSIONS,
+            help=(
+                "Only load clients for this many of the most recent versions, or "
+                f"0 for every version (default {settings.FML_PRELOAD_RECENT_VERSIONS})"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        logger.info("Loading FML clients")
+
+        start = time.monotonic()
+        loaded = NimbusFmlLoader.warm_clients(
+            options["applications"], options["recent_versions"]
+        )
+
+        logger.info(f"Loaded {loaded} FML clients in {time.monotonic() - start:.2f}s")
+
+        load_times = sorted(
+            NimbusFmlLoader.client_load_times().items(),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        for (application, channel, version), load_time in load_times[:10]:
+            logger.info(
+                f"{application}/{channel} (version {version}) took {load_time:.2f}s"
+            )
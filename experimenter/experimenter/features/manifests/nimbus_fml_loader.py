@@ -1,18 +1,33 @@
 import logging
+import threading
+import time
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import markus
 from django.conf import settings
+from django.db import connections
 from nimbus_megazord.fml import FmlClient
 
 from experimenter.experiments.constants import NimbusConstants
 from experimenter.experiments.models import NimbusFeatureVersion
 
 logger = logging.getLogger()
+metrics = markus.get_metrics("features.nimbus_fml_loader")
+
+FmlClientKey = tuple[str, str, Optional[str]]
 
 
 class NimbusFmlLoader:
+    # FmlClients are shared by every loader in the process and keyed by
+    # (application, channel, version). Once there are more than
+    # FML_CLIENT_CACHE_SIZE clients the least recently used one is evicted.
+    _clients: OrderedDict[FmlClientKey, Optional[FmlClient]] = OrderedDict()
+    _client_load_times: dict[FmlClientKey, float] = {}
+    _clients_lock = threading.Lock()
+
     def __init__(self, application: str, channel: str):
         self.application: str = (
             application if application in NimbusConstants.Application else None
@@ -26,14 +41,112 @@ class NimbusFmlLoader:
         # FML loader.
         return cls(application, channel)
 
+    @classmethod
+    def warm_clients(
+        cls,
+        applications: Optional[list[str]] = None,
+        recent_versions: Optional[int] = None,
+    ) -> int:
+        """Instantiate the FmlClient for every channel and version of each mobile
+        application so that the first review after a deploy does not pay for
+        parsing the manifests.
+
+        If recent_versions is non-zero, only the unversioned manifest and that
+        many of the most recent versions of each application are loaded. At most
+        FML_CLIENT_CACHE_SIZE clients are loaded, preferring the newest versions.
+
+        Returns the number of clients that were loaded.
+        """
+        if applications is None:
+            applications = [
+                application
+                for application in NimbusConstants.Application
+                if NimbusConstants.Application.is_mobile(application)
+            ]
+
+        candidates = []
+        for application in applications:
+            application_versions = (
+                NimbusFeatureVersion.objects.filter(
+                    schemas__feature_config__application=application
+                )
+                .distinct()
+                .order_by("-packed")
+            )
+            if recent_versions:
+                application_versions = application_versions[:recent_versions]
+
+            versions = [None, *application_versions]
+            channels = NimbusConstants.APPLICATION_CONFIGS[application].channel_app_id
+
+            for channel in channels:
+                loader = cls.create_loader(application, channel)
+
+                for rank, version in enumerate(versions):
+                    if loader._manifest_path(version).exists():
+                        candidates.append((rank, loader, version))
+
+        # Anything past the cache size would only evict clients loaded earlier,
+        # so keep the newest versions and load them last so they are the most
+        # recently used.
+        candidates.sort(key=lambda candidate: candidate[0])
+        candidates = candidates[: settings.FML_CLIENT_CACHE_SIZE]
+
+        loaded = 0
+        for _rank, loader, version in reversed(candidates):
+            if loader.fml_client(version) is not None:
+                loaded += 1
+
+        return loaded
+
+    @classmethod
+    def preload_clients(cls):
+        """Warm the FmlClients for recent versions when a web or worker process
+        boots, if FML_PRELOAD_CLIENTS is enabled.
+
+        When this runs before the server forks, the children share the loaded
+        clients, so the database connections used to find the versions are
+        closed rather than inherited.
+        """
+        if not settings.FML_PRELOAD_CLIENTS:
+            return
+
+        start = time.monotonic()
+        try:
+            loaded = cls.warm_clients(
+                recent_versions=settings.FML_PRELOAD_RECENT_VERSIONS
+            )
+        finally:
+            connections.close_all()
+
+        logger.info(
+            f"Nimbus FML Loader: Preloaded {loaded} clients in "
+            f"{time.monotonic() - start:.2f}s"
+        )
+
+    @classmethod
+    def client_load_times(cls) -> dict[FmlClientKey, float]:
+        """The time in seconds it took to load each FmlClient in the cache."""
+        with cls._clients_lock:
+            return {key: cls._client_load_times[key] for key in cls._clients}
+
+    @classmethod
+    def clear_clients(cls):
+        with cls._clients_lock:
+            cls._clients = OrderedDict()
+            cls._client_load_times = {}
+
+    def _manifest_path(self, version: Optional[NimbusFeatureVersion] = None) -> Path:
+        path = settings.FEATURE_MANIFESTS_PATH / self.application
+        if version:
+            path /= f"v{version}"
+        return path / f"{self.channel}.fml.yaml"
+
     def file_path(self, version: NimbusFeatureVersion = None):
         """Get path to release feature manifest from experimenter (local)."""
 
         if self.application is not None:
-            path = settings.FEATURE_MANIFESTS_PATH / self.application
-            if version:
-                path /= f"v{version}"
-            path /= f"{self.channel}.fml.yaml"
+            path = self._manifest_path(version)
             if Path(path).exists():
                 return path
             else:
@@ -46,13 +159,45 @@ class NimbusFmlLoader:
             )
         return None
 
-    @lru_cache  # noqa: B019
     def fml_client(self, version: Optional[NimbusFeatureVersion] = None) -> FmlClient:
         """The FmlClient for the given version of the feature manifest.
 
         There is a single FmlClient for each combination of application, app version,
         and channel.
         """
+        key = (self.application, self.channel, str(version) if version else None)
+
+        with self._clients_lock:
+            if key in self._clients:
+                self._clients.move_to_end(key)
+                return self._clients[key]
+
+        # Clients can take seconds to load, so load them without holding the lock.
+        start = time.monotonic()
+        client = self._load_fml_client(version)
+        load_time = time.monotonic() - start
+
+        if client is not None:
+            metrics.timing("fml_client.load_time", load_time * 1000)
+            logger.info(
+                f"Nimbus FML Loader: Loaded {self.application}/{self.channel} "
+                f"(version {version}) in {load_time:.2f}s"
+            )
+
+        with self._clients_lock:
+            self._clients[key] = client
+            self._client_load_times[key] = load_time
+
+            while len(self._clients) > settings.FML_CLIENT_CACHE_SIZE:
+                evicted_key, _ = self._clients.popitem(last=False)
+                self._client_load_times.pop(evicted_key, None)
+                metrics.incr("fml_client.evicted")
+
+        return client
+
+    def _load_fml_client(
+        self, version: Optional[NimbusFeatureVersion] = None
+    ) -> Optional[FmlClient]:
         file_path = self.file_path(version)
         if file_path is not None:
             return FmlClient(
@@ -1,6 +1,8 @@
 import json
+from unittest.mock import patch
 
 from django.core.checks import Error
+from django.core.management import call_command
 from django.test import TestCase
 from mozilla_nimbus_schemas.experiments.feature_manifests import (
     FeatureVariable,
@@ -9,6 +11,8 @@ from mozilla_nimbus_schemas.experiments.feature_manifests import (
     FeatureWithoutExposure,
 )
 
+from experimenter.base import pickle_cache
+from experimenter.base.tests.mixins import TemporaryPathSettingsMixin
 from experimenter.experiments.models import NimbusExperiment
 from experimenter.features import (
     Feature,
@@ -20,7 +24,9 @@ from experimenter.features.tests import (
     mock_invalid_remote_schema_features,
     mock_remote_schema_features,
     mock_valid_features,
+    mock_versioned_features,
 )
+from manifesttool.version import Version
 
 
 @mock_valid_features
@@ -178,6 +184,121 @@ class TestRemoteSchemaFeatures(TestCase):
         self.assertIsNone(desktop_feature.get_jsonschema())
 
 
+@mock_valid_features
+class TestFeaturesCache(TemporaryPathSettingsMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        Features.clear_cache()
+        self.addCleanup(Features.clear_cache)
+
+        self.cache_path = self.override_temporary_path(
+            "FEATURE_MANIFESTS_CACHE_PATH", "features.pickle"
+        )
+
+    def test_build_cache_writes_features(self):
+        features = Features.build_cache()
+
+        self.assertTrue(self.cache_path.exists())
+        self.assertEqual(len(features), 5)
+
+        Features.clear_cache()
+        with patch.object(Features, "_read_manifest") as mock_read_manifest:
+            self.assertEqual(Features.all(), features)
+
+        mock_read_manifest.assert_not_called()
+
+    def test_falls_back_to_manifests_when_loader_version_changes(self):
+        Features.build_cache()
+        Features.clear_cache()
+
+        with patch("experimenter.features.FEATURE_LOADER_VERSION", 2), patch.object(
+            Features, "_read_manifest", wraps=Features._read_manifest
+        ) as mock_read_manifest:
+            self.assertEqual(len(Features.all()), 5)
+
+        mock_read_manifest.assert_called()
+
+    def test_falls_back_to_manifests_when_hash_does_not_match(self):
+        manifests = list(Features.manifests())
+        self.assertIn((NimbusExperiment.Application.DESKTOP, None), manifests)
+        pickle_cache.dump(
+            self.cache_path,
+            {key: ("stale", pickle_cache.dumps([])) for key in manifests},
+        )
+
+        with patch.object(
+            Features, "_read_manifest", wraps=Features._read_manifest
+        ) as mock_read_manifest:
+            self.assertEqual(len(Features.all()), 5)
+
+        self.assertEqual(mock_read_manifest.call_count, len(manifests))
+
+    def test_falls_back_to_manifests_when_cache_is_invalid(self):
+        self.cache_path.write_bytes(b"not a pickle")
+
+        self.assertEqual(len(Features.all()), 5)
+
+    def test_falls_back_to_manifests_without_cache(self):
+        self.assertEqual(len(Features.all()), 5)
+
+    def test_build_features_cache_command(self):
+        call_command("build_features_cache", "--benchmark")
+
+        self.assertTrue(self.cache_path.exists())
+        self.assertEqual(len(Features.all()), 5)
+
+
+@mock_versioned_features
+class TestLazyFeatures(TestCase):
+    def setUp(self):
+        super().setUp()
+        Features.clear_cache()
+        self.addCleanup(Features.clear_cache)
+
+    def test_unversioned_does_not_load_versioned_manifests(self):
+        with patch.object(
+            Features, "_read_manifest", wraps=Features._read_manifest
+        ) as mock_read_manifest:
+            features = Features.unversioned()
+
+        self.assertTrue(features)
+        self.assertTrue(all(f.version is None for f in features))
+        self.assertEqual(Features._versioned_manifest_paths, {})
+        self.assertEqual(mock_read_manifest.call_count, 1)
+
+    def test_by_version_loads_only_that_manifest(self):
+        version = Version(120, 1, 0)
+
+        with patch.object(
+            Features, "_read_manifest", wraps=Features._read_manifest
+        ) as mock_read_manifest:
+            features = Features.by_version(NimbusExperiment.Application.DESKTOP, version)
+
+        self.assertTrue(features)
+        self.assertTrue(all(f.version == version for f in features))
+        self.assertEqual(mock_read_manifest.call_count, 1)
+
+    def test_by_application_loads_only_that_application(self):
+        self.assertEqual(Features.by_application(NimbusExperiment.Application.FENIX), [])
+        self.assertEqual(Features._features, {})
+
+    def test_manifests_are_loaded_once(self):
+        features = Features.all()
+
+        with patch.object(Features, "_read_manifest") as mock_read_manifest:
+            self.assertEqual(Features.all(), features)
+            self.assertEqual(
+                Features.by_application(NimbusExperiment.Application.DESKTOP),
+                features,
+            )
+
+        mock_read_manifest.assert_not_called()
+        self.assertEqual(
+            {f.version for f in features},
+            {None, Version(120, 0, 0), Version(120, 1, 0)},
+        )
+
+
 class TestCheckFeatures(TestCase):
     maxDiff = None
 
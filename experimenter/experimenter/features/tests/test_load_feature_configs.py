@@ -1,4 +1,5 @@
 import json
+from unittest.mock import patch
 
 from django.core.management import call_command
 from django.test import TestCase
@@ -6,7 +7,10 @@ from django.test import TestCase
 from experimenter.experiments.models import (
     NimbusExperiment,
     NimbusFeatureConfig,
+    NimbusFeatureManifest,
+    NimbusFeatureSchema,
     NimbusFeatureVersion,
+    NimbusVersionedSchema,
 )
 from experimenter.experiments.tests.factories import (
     NimbusFeatureConfigFactory,
@@ -18,6 +22,7 @@ from experimenter.features.tests import (
     mock_valid_features,
     mock_versioned_features,
 )
+from manifesttool.version import Version
 
 
 @mock_valid_features
@@ -349,3 +354,124 @@ class TestLoadVersionedFeatureConfigs(TestCase):
         self.assertEqual(feature_2.name, "feature-2")
         self.assertEqual(feature_2.description, "Feature 2 for version 120.1.0")
         self.assertFalse(feature_2.enabled)
+
+
+@mock_versioned_features
+class TestLoadFeatureConfigsManifestHashes(TestCase):
+    def setUp(self):
+        super().setUp()
+        Features.clear_cache()
+
+        self.empty_schema = NimbusFeatureSchema.for_schema("{}")
+
+    def replace_schemas(self):
+        self.empty_schema.save()
+        NimbusVersionedSchema.objects.update(schema_content=self.empty_schema)
+
+    def test_records_manifest_content_hashes(self):
+        call_command("load_feature_configs")
+
+        self.assertEqual(
+            {
+                (
+                    manifest.application,
+                    manifest.version
+                    and Version(
+                        manifest.version.major,
+                        manifest.version.minor,
+                        manifest.version.patch,
+                    ),
+                ): manifest.content_hash
+                for manifest in NimbusFeatureManifest.objects.all()
+            },
+            {
+                (application_slug, version): Features.content_hash(
+                    application_slug, version
+                )
+                for application_slug, version in Features.manifests()
+            },
+        )
+
+    def test_skips_unchanged_manifests(self):
+        call_command("load_feature_configs")
+        self.replace_schemas()
+
+        call_command("load_feature_configs")
+
+        self.assertFalse(
+            NimbusVersionedSchema.objects.exclude(
+                schema_content=self.empty_schema
+            ).exists()
+        )
+
+    def test_force_reloads_unchanged_manifests(self):
+        call_command("load_feature_configs")
+        self.replace_schemas()
+
+        call_command("load_feature_configs", "--force")
+
+        self.assertFalse(
+            NimbusVersionedSchema.objects.filter(
+                schema_content=self.empty_schema
+            ).exists()
+        )
+
+    def test_prunes_unused_schemas(self):
+        call_command("load_feature_configs")
+        schema_hashes = set(NimbusFeatureSchema.objects.values_list("hash", flat=True))
+        self.replace_schemas()
+
+        call_command("load_feature_configs", "--force")
+
+        self.assertEqual(
+            set(NimbusFeatureSchema.objects.values_list("hash", flat=True)),
+            schema_hashes,
+        )
+        self.assertEqual(
+            set(NimbusFeatureSchema.objects.values_list("hash", flat=True)),
+            set(NimbusVersionedSchema.objects.values_list("schema_content", flat=True)),
+        )
+
+    def test_reloads_manifests_when_loader_version_changes(self):
+        call_command("load_feature_configs")
+        self.replace_schemas()
+
+        Features.clear_cache()
+        with patch("experimenter.features.FEATURE_LOADER_VERSION", 2):
+            call_command("load_feature_configs")
+
+        self.assertFalse(
+            NimbusVersionedSchema.objects.filter(
+                schema_content=self.empty_schema
+            ).exists()
+        )
+
+    def test_reloads_changed_manifests(self):
+        call_command("load_feature_configs")
+        self.replace_schemas()
+        NimbusFeatureManifest.objects.filter(version__minor=1).update(
+            content_hash="stale"
+        )
+
+        call_command("load_feature_configs")
+
+        self.assertEqual(
+            set(
+                NimbusVersionedSchema.objects.exclude(
+                    schema_content=self.empty_schema
+                ).values_list("version__minor", flat=True)
+            ),
+            {1},
+        )
+        self.assertFalse(
+            NimbusFeatureManifest.objects.filter(content_hash="stale").exists()
+        )
+
+    def test_reloads_manifests_with_new_feature_configs(self):
+        call_command("load_feature_configs")
+        NimbusFeatureConfig.objects.filter(slug="feature-2").delete()
+
+        call_command("load_feature_configs")
+
+        feature_2 = NimbusFeatureConfig.objects.get(slug="feature-2")
+        self.assertEqual(feature_2.schemas.count(), 2)
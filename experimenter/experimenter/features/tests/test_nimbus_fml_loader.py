@@ -1,10 +1,17 @@
 import json
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
 from nimbus_megazord.fml import FmlClient
 
 from experimenter.experiments.constants import NimbusConstants
+from experimenter.experiments.models import NimbusFeatureVersion
+from experimenter.experiments.tests.factories import (
+    NimbusFeatureConfigFactory,
+    NimbusVersionedSchemaFactory,
+)
 from experimenter.features.manifests.nimbus_fml_loader import NimbusFmlLoader
 from experimenter.features.tests import (
     FML_DIR,
@@ -18,7 +25,7 @@ class TestNimbusFmlLoader(TestCase):
 
     def setUp(self):
         NimbusFmlLoader.create_loader.cache_clear()
-        NimbusFmlLoader.fml_client.cache_clear()
+        NimbusFmlLoader.clear_clients()
 
     def create_loader(
         self,
@@ -210,3 +217,166 @@ class TestNimbusFmlLoader(TestCase):
             self.assertEqual(loader.application, None)
             self.assertEqual(result, [])
             self.assertIn("Nimbus FML Loader: Invalid application", log.output[0])
+
+    @patch("nimbus_megazord.fml.FmlClient.__init__", return_value=None)
+    @mock_fml_versioned_features
+    def test_warm_clients(self, new_client):
+        version = NimbusFeatureVersion.objects.create(major=119, minor=0, patch=0)
+        NimbusFeatureConfigFactory.create(
+            application=NimbusConstants.Application.FENIX,
+            schemas=[NimbusVersionedSchemaFactory.build(version=version)],
+        )
+
+        loaded = NimbusFmlLoader.warm_clients([NimbusConstants.Application.FENIX])
+
+        self.assertEqual(loaded, 1)
+        new_client.assert_called_once_with(
+            str(
+                FML_DIR / "versioned_features" / "fenix" / "v119.0.0" / "release.fml.yaml"
+            ),
+            NimbusConstants.Channel.RELEASE,
+        )
+
+        loader = NimbusFmlLoader.create_loader(
+            NimbusConstants.Application.FENIX, NimbusConstants.Channel.RELEASE
+        )
+        loader.fml_client(version)
+        new_client.assert_called_once()
+
+    @patch(
+        "experimenter.features.manifests.nimbus_fml_loader.NimbusFmlLoader.warm_clients",
+        return_value=0,
+    )
+    def test_warm_fml_clients_command(self, warm_clients):
+        call_command("warm_fml_clients", "--application", "fenix")
+
+        warm_clients.assert_called_once_with(
+            ["fenix"], settings.FML_PRELOAD_RECENT_VERSIONS
+        )
+
+    @patch(
+        "experimenter.features.manifests.nimbus_fml_loader.NimbusFmlLoader.warm_clients",
+        return_value=0,
+    )
+    def test_warm_fml_clients_command_all_versions(self, warm_clients):
+        call_command(
+            "warm_fml_clients", "--application", "fenix", "--recent-versions", "0"
+        )
+
+        warm_clients.assert_called_once_with(["fenix"], 0)
+
+    @patch("nimbus_megazord.fml.FmlClient.__init__", return_value=None)
+    @mock_fml_versioned_features
+    def test_warm_clients_recent_versions(self, new_client):
+        versions = [
+            NimbusFeatureVersion.objects.create(major=major, minor=0, patch=0)
+            for major in (119, 120)
+        ]
+        NimbusFeatureConfigFactory.create(
+            application=NimbusConstants.Application.FENIX,
+            schemas=[
+                NimbusVersionedSchemaFactory.build(version=version)
+                for version in versions
+            ],
+        )
+
+        loaded = NimbusFmlLoader.warm_clients(
+            [NimbusConstants.Application.FENIX], recent_versions=1
+        )
+
+        # Only v120.0.0 is recent enough, and it has no manifest.
+        self.assertEqual(loaded, 0)
+        new_client.assert_not_called()
+
+    @patch("nimbus_megazord.fml.FmlClient.__init__", return_value=None)
+    @mock_fml_versioned_features
+    def test_warm_clients_all_versions(self, new_client):
+        versions = [
+            NimbusFeatureVersion.objects.create(major=major, minor=0, patch=0)
+            for major in (119, 120)
+        ]
+        NimbusFeatureConfigFactory.create(
+            application=NimbusConstants.Application.FENIX,
+            schemas=[
+                NimbusVersionedSchemaFactory.build(version=version)
+                for version in versions
+            ],
+        )
+
+        loaded = NimbusFmlLoader.warm_clients(
+            [NimbusConstants.Application.FENIX], recent_versions=0
+        )
+
+        self.assertEqual(loaded, 1)
+        new_client.assert_called_once()
+        self.assertEqual(
+            list(NimbusFmlLoader.client_load_times()),
+            [("fenix", NimbusConstants.Channel.RELEASE, "119.0.0")],
+        )
+
+    @patch("nimbus_megazord.fml.FmlClient.__init__", return_value=None)
+    @mock_fml_features
+    @override_settings(FML_CLIENT_CACHE_SIZE=1)
+    def test_warm_clients_stops_when_cache_is_full(self, new_client):
+        loaded = NimbusFmlLoader.warm_clients([NimbusConstants.Application.FENIX])
+
+        self.assertEqual(loaded, 1)
+        new_client.assert_called_once()
+        self.assertEqual(
+            list(NimbusFmlLoader.client_load_times()),
+            [("fenix", NimbusConstants.Channel.NIGHTLY, None)],
+        )
+
+    @patch("nimbus_megazord.fml.FmlClient.__init__", return_value=None)
+    @mock_fml_features
+    @override_settings(FML_CLIENT_CACHE_SIZE=1)
+    def test_fml_client_cache_evicts_least_recently_used(self, new_client):
+        release_loader = self.create_loader(channel=NimbusConstants.Channel.RELEASE)
+        nightly_loader = self.create_loader(channel=NimbusConstants.Channel.NIGHTLY)
+
+        release_loader.fml_client()
+        release_loader.fml_client()
+        self.assertEqual(new_client.call_count, 1)
+
+        nightly_loader.fml_client()
+        release_loader.fml_client()
+        self.assertEqual(new_client.call_count, 3)
+        self.assertEqual(
+            list(NimbusFmlLoader.client_load_times()),
+            [("fenix", NimbusConstants.Channel.RELEASE, None)],
+        )
+
+    @patch("nimbus_megazord.fml.FmlClient.__init__", return_value=None)
+    @mock_fml_versioned_features
+    def test_fml_client_is_shared_between_version_instances_and_strings(self, new_client):
+        version = NimbusFeatureVersion.objects.create(major=119, minor=0, patch=0)
+        loader = self.create_loader()
+
+        client = loader.fml_client(version)
+
+        self.assertIs(loader.fml_client("119.0.0"), client)
+        new_client.assert_called_once()
+        self.assertIn(
+            ("fenix", NimbusConstants.Channel.RELEASE, "119.0.0"),
+            NimbusFmlLoader.client_load_times(),
+        )
+
+    @patch(
+        "experimenter.features.manifests.nimbus_fml_loader.NimbusFmlLoader.warm_clients",
+        return_value=0,
+    )
+    @override_settings(FML_PRELOAD_CLIENTS=False)
+    def test_preload_clients_disabled(self, warm_clients):
+        NimbusFmlLoader.preload_clients()
+
+        warm_clients.assert_not_called()
+
+    @patch(
+        "experimenter.features.manifests.nimbus_fml_loader.NimbusFmlLoader.warm_clients",
+        return_value=0,
+    )
+    @override_settings(FML_PRELOAD_CLIENTS=True, FML_PRELOAD_RECENT_VERSIONS=2)
+    def test_preload_clients_warms_recent_versions(self, warm_clients):
+        NimbusFmlLoader.preload_clients()
+
+        warm_clients.assert_called_once_with(recent_versions=2)
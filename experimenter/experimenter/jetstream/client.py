@@ -1,30 +1,38 @@
+import codecs
+import hashlib
 import json
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from itertools import chain
 from pathlib import Path
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.storage import storages
+from google.cloud.exceptions import NotFound
 from mozilla_nimbus_schemas.jetstream import (
     AnalysisBasis,
     AnalysisError,
     AnalysisErrors,
     Metadata,
     SampleSizes,
-    Statistics,
 )
 
+from experimenter.base import app_version
 from experimenter.experiments.models import NimbusExperiment
 from experimenter.jetstream.models import (
     METRIC_GROUP,
     AnalysisWindow,
     Group,
     JetstreamData,
+    JetstreamDataPoint,
     Metric,
     Segment,
     Statistic,
-    create_results_object_model,
+    append_conversion_count,
+    transform_results,
 )
 from experimenter.outcomes import Metric as OutcomeMetric
 from experimenter.outcomes import Outcomes
@@ -40,26 +48,163 @@ ALL_STATISTICS = {
     Statistic.PERCENT,
 }
 
+# Statistics files are read in chunks of this many bytes rather than all at once
+STATISTICS_CHUNK_SIZE = 1024 * 1024
+# The analysis bases that Experimenter displays results for
+ANALYSIS_BASES = {
+    AnalysisBasis.ENROLLMENTS.value: AnalysisBasis.ENROLLMENTS,
+    AnalysisBasis.EXPOSURES.value: AnalysisBasis.EXPOSURES,
+}
+
+# we don't use DAILY results in Experimenter, so only get WEEKLY/OVERALL
+RESULTS_WINDOWS = [AnalysisWindow.WEEKLY, AnalysisWindow.OVERALL]
+
 analysis_storage = storages["analysis"]
 
 
-def load_data_from_gcs(path):
-    if analysis_storage.exists(path):
-        return json.loads(analysis_storage.open(path).read())
-    else:
-        raise RuntimeError(f"Could not find data in analysis bucket at path {path}")
+class DownloadCountingFile:
+    """Wrap a file from the analysis bucket and record the size of every read
+    in download_sizes."""
 
+    def __init__(self, file, download_sizes):
+        self.file = file
+        self.download_sizes = download_sizes
 
-def validate_data(data_json):
-    if data_json:
-        Statistics.parse_obj(data_json)
-    return data_json
+    def read(self, *args):
+        data = self.file.read(*args)
+        self.download_sizes.append(len(data))
+        return data
 
+    def __enter__(self):
+        return self
 
-def get_data(slug, window):
-    filename = f"statistics_{slug}_{window}.json"
-    path = Path(STATISTICS_FOLDER, filename)
-    return validate_data(load_data_from_gcs(str(path)))
+    def __exit__(self, *args):
+        self.file.close()
+
+
+def open_from_gcs(path, download_sizes=None):
+    try:
+        file = analysis_storage.open(path)
+    except FileNotFoundError as e:
+        raise RuntimeError(
+            f"Could not find data in analysis bucket at path {path}"
+        ) from e
+
+    if download_sizes is not None:
+        return DownloadCountingFile(file, download_sizes)
+    return file
+
+
+def load_data_from_gcs(path, download_sizes=None):
+    return json.loads(open_from_gcs(path, download_sizes).read())
+
+
+def iter_json_array(file, chunk_size=STATISTICS_CHUNK_SIZE):
+    """Yield the items of the JSON array in file one at a time.
+
+    The file is read chunk_size at a time, so only the unparsed remainder of
+    the current chunk is held in memory rather than the whole document.
+    """
+    # Unlike json.loads, each raw_decode call starts with an empty memo, so
+    # intern the keys to share them between items as a single parse would.
+    decoder = json.JSONDecoder(
+        object_pairs_hook=lambda pairs: {sys.intern(key): value for key, value in pairs}
+    )
+    utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    eof = False
+    started = False
+
+    while True:
+        separators = " \t\n\r," if started else " \t\n\r"
+        while position < len(buffer) and buffer[position] in separators:
+            position += 1
+
+        if position < len(buffer):
+            if not started:
+                if buffer[position] != "[":
+                    raise json.JSONDecodeError("Expecting '['", buffer, position)
+                started = True
+                position += 1
+                continue
+
+            if buffer[position] == "]":
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A number may continue in the next chunk, so only accept an item
+                # once the separator that follows it has been read
+                if eof or (end < len(buffer) and buffer[end] in " \t\n\r,]"):
+                    position = end
+                    yield item
+                    continue
+
+        if eof:
+            raise json.JSONDecodeError(
+                "Expecting ']'" if started else "Expecting '['", buffer, position
+            )
+
+        chunk = file.read(chunk_size)
+        eof = not chunk
+        if isinstance(chunk, bytes):
+            chunk = utf8_decoder.decode(chunk, final=eof)
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def get_modified_time(path):
+    try:
+        return analysis_storage.get_modified_time(path).isoformat()
+    except (FileNotFoundError, NotFound):
+        return None
+
+
+def get_data_path(slug, window):
+    return str(Path(STATISTICS_FOLDER, f"statistics_{slug}_{window}.json"))
+
+
+def load_data_stream_from_gcs(path, download_sizes=None):
+    with open_from_gcs(path, download_sizes) as file:
+        yield from iter_json_array(file)
+
+
+def get_data(slug, window, download_sizes=None):
+    """Validate the statistics for a window and group them by analysis basis
+    and segment as they are streamed from the analysis bucket.
+
+    Each statistic is only validated here, as a JetstreamDataPoint, and the
+    parsed points are used as they are from then on.
+    """
+    data = defaultdict(lambda: defaultdict(list))
+    seen = set()
+    for point in load_data_stream_from_gcs(get_data_path(slug, window), download_sizes):
+        stat = JetstreamDataPoint.parse_obj(point)
+        # The same check as Statistics.check_for_duplicates, one point at a time
+        key = (
+            stat.metric,
+            stat.statistic,
+            stat.branch,
+            stat.parameter,
+            stat.comparison,
+            stat.comparison_to_branch,
+            stat.ci_width,
+            stat.segment,
+            stat.analysis_basis,
+            stat.window_index,
+        )
+        if key in seen:
+            raise ValueError("List of Statistic objects has duplicate(s).")
+        seen.add(key)
+
+        if analysis_basis := ANALYSIS_BASES.get(stat.analysis_basis):
+            data[analysis_basis][stat.segment].append(stat)
+    return data
 
 
 def validate_metadata(metadata_json):
@@ -68,10 +213,12 @@ def validate_metadata(metadata_json):
     return metadata_json
 
 
-def get_metadata(slug):
-    filename = f"metadata_{slug}.json"
-    path = Path(METADATA_FOLDER, filename)
-    return validate_metadata(load_data_from_gcs(str(path)))
+def get_metadata_path(slug):
+    return str(Path(METADATA_FOLDER, f"metadata_{slug}.json"))
+
+
+def get_metadata(slug, download_sizes=None):
+    return validate_metadata(load_data_from_gcs(get_metadata_path(slug), download_sizes))
 
 
 def validate_analysis_errors(analysis_errors_json):
@@ -80,10 +227,14 @@ def validate_analysis_errors(analysis_errors_json):
     return analysis_errors_json
 
 
-def get_analysis_errors(slug):
-    filename = f"errors_{slug}.json"
-    path = Path(ERRORS_FOLDER, filename)
-    return validate_analysis_errors(load_data_from_gcs(str(path)))
+def get_analysis_errors_path(slug):
+    return str(Path(ERRORS_FOLDER, f"errors_{slug}.json"))
+
+
+def get_analysis_errors(slug, download_sizes=None):
+    return validate_analysis_errors(
+        load_data_from_gcs(get_analysis_errors_path(slug), download_sizes)
+    )
 
 
 def get_sizing_data(suffix="latest"):
@@ -92,30 +243,16 @@ def get_sizing_data(suffix="latest"):
     return load_data_from_gcs(str(path))
 
 
-def get_results_metrics_map(
-    data: JetstreamData,
-    primary_outcome_slugs: list[str],
-    secondary_outcome_slugs: list[str],
-    outcomes_metadata,
+def get_primary_metrics(
+    application: str, primary_outcome_slugs: list[str], outcomes_metadata
 ):
-    # A mapping of metric label to relevant statistic. This is
-    # used to see which statistic will be used for each metric.
-    results_metrics_map: dict[str, set[Statistic]] = {
-        Metric.RETENTION: {Statistic.BINOMIAL},
-        Metric.SEARCH: {Statistic.MEAN},
-        Metric.DAYS_OF_USE: {Statistic.MEAN},
-        Metric.USER_COUNT: {Statistic.COUNT, Statistic.PERCENT},
-    }
-    primary_metrics_set: set[str] = set()
-    primary_outcome_metrics: list[OutcomeMetric] = list(
-        chain.from_iterable(
-            [
-                outcome.metrics
-                for outcome in Outcomes.all()
-                if outcome.slug in primary_outcome_slugs
-            ]
-        )
-    )
+    # The metrics follow the order of the experiment's primary outcomes
+    primary_outcome_metrics: list[OutcomeMetric] = [
+        metric
+        for slug in dict.fromkeys(primary_outcome_slugs)
+        if (outcome := Outcomes.by_slug(application, slug)) is not None
+        for metric in outcome.metrics
+    ]
 
     bypass_jetstream_check = True
     metrics_set_from_jetstream = set()
@@ -131,12 +268,36 @@ def get_results_metrics_map(
             )
         )
 
-    for metric in primary_outcome_metrics:
-        # validate against jetstream metadata unless we couldn't get it
-        if bypass_jetstream_check or metric.slug in metrics_set_from_jetstream:
-            results_metrics_map[metric.slug] = ALL_STATISTICS
+    # validate against jetstream metadata unless we couldn't get it
+    return [
+        metric.slug
+        for metric in primary_outcome_metrics
+        if bypass_jetstream_check or metric.slug in metrics_set_from_jetstream
+    ]
+
+
+def get_results_metrics_map(
+    data: JetstreamData,
+    application: str,
+    primary_outcome_slugs: list[str],
+    secondary_outcome_slugs: list[str],
+    outcomes_metadata,
+):
+    # A mapping of metric label to relevant statistic. This is
+    # used to see which statistic will be used for each metric.
+    results_metrics_map: dict[str, set[Statistic]] = {
+        Metric.RETENTION: {Statistic.BINOMIAL},
+        Metric.SEARCH: {Statistic.MEAN},
+        Metric.DAYS_OF_USE: {Statistic.MEAN},
+        Metric.USER_COUNT: {Statistic.COUNT, Statistic.PERCENT},
+    }
+    primary_metrics_set: set[str] = set()
+    for metric_slug in get_primary_metrics(
+        application, primary_outcome_slugs, outcomes_metadata
+    ):
+        results_metrics_map[metric_slug] = ALL_STATISTICS
 
-            primary_metrics_set.add(metric.slug)
+        primary_metrics_set.add(metric_slug)
 
     for outcome_slug in secondary_outcome_slugs:
         results_metrics_map[outcome_slug] = ALL_STATISTICS
@@ -185,19 +346,66 @@ def get_other_metrics_names_and_map(
     return other_metrics_map, other_metrics_names
 
 
-def get_experiment_data(experiment: NimbusExperiment):
+def get_results_fingerprint(experiment: NimbusExperiment):
+    """Describe everything get_experiment_data() depends on.
+
+    This includes the last modified time of each file in the analysis bucket
+    (or None if it does not exist) and the experiment fields that affect the
+    transformed results. If the fingerprint has not changed since the results
+    were last fetched, they do not need to be fetched again.
+    """
+    recipe_slug = experiment.slug.replace("-", "_")
+    paths = [
+        get_metadata_path(recipe_slug),
+        get_analysis_errors_path(recipe_slug),
+        *(get_data_path(recipe_slug, window) for window in RESULTS_WINDOWS),
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        modified_times = dict(zip(paths, executor.map(get_modified_time, paths)))
+
+    return {
+        "files": modified_times,
+        "app_version": app_version(),
+        "show_analysis": settings.FEATURE_ANALYSIS,
+        "primary_outcomes": experiment.primary_outcomes,
+        "secondary_outcomes": experiment.secondary_outcomes,
+        "reference_branch": (
+            experiment.reference_branch.slug if experiment.reference_branch else None
+        ),
+        "overall_expected": bool(
+            experiment.end_date and experiment.end_date < date.today()
+        ),
+    }
+
+
+def get_experiment_data(experiment: NimbusExperiment, download_sizes=None):
+    """Fetch and transform the Jetstream results for an experiment.
+
+    If download_sizes is a list, the number of bytes read from the analysis
+    bucket is appended to it as the files are downloaded.
+    """
     recipe_slug = experiment.slug.replace("-", "_")
-    # we don't use DAILY results in Experimenter, so only get WEEKLY/OVERALL
-    windows = [AnalysisWindow.WEEKLY, AnalysisWindow.OVERALL]
+    windows = RESULTS_WINDOWS
     raw_data = {
         AnalysisWindow.WEEKLY: {},
         AnalysisWindow.OVERALL: {},
     }
 
+    # Fetch the metadata, errors, and statistics for every window concurrently
+    # so that we only wait on a single round trip to the analysis bucket.
+    with ThreadPoolExecutor(max_workers=2 + len(windows)) as executor:
+        metadata_future = executor.submit(get_metadata, recipe_slug, download_sizes)
+        errors_future = executor.submit(get_analysis_errors, recipe_slug, download_sizes)
+        data_futures = {
+            window: executor.submit(get_data, recipe_slug, window, download_sizes)
+            for window in windows
+        }
+
     runtime_errors = []
     experiment_metadata = None
     try:
-        experiment_metadata = get_metadata(recipe_slug)
+        experiment_metadata = metadata_future.result()
     except RuntimeError as e:
         runtime_errors.append(str(e))
 
@@ -207,7 +415,7 @@ def get_experiment_data(experiment: NimbusExperiment):
 
     experiment_errors = None
     try:
-        experiment_errors = get_analysis_errors(recipe_slug)
+        experiment_errors = errors_future.result()
     except RuntimeError as e:
         runtime_errors.append(str(e))
 
@@ -218,29 +426,26 @@ def get_experiment_data(experiment: NimbusExperiment):
 
     for window in windows:
         experiment_data[window] = {}
-        data_from_jetstream = []
+        data_from_jetstream = {}
         try:
-            data_from_jetstream = get_data(recipe_slug, window)
+            data_from_jetstream = data_futures[window].result()
         except RuntimeError as e:
             runtime_errors.append(str(e))
 
-        segment_points_enrollments = defaultdict(list)
-        segment_points_exposures = defaultdict(list)
+        for analysis_basis in data_from_jetstream:
+            experiment_data[window][analysis_basis] = {}
+            raw_data[window][analysis_basis] = {}
 
-        for point in data_from_jetstream:
-            segment_key = point["segment"]
-            if point["analysis_basis"] == AnalysisBasis.ENROLLMENTS:
-                segment_points_enrollments[segment_key].append(point)
-                experiment_data[window][AnalysisBasis.ENROLLMENTS] = {}
-                raw_data[window][AnalysisBasis.ENROLLMENTS] = {}
-            elif point["analysis_basis"] == AnalysisBasis.EXPOSURES:
-                segment_points_exposures[segment_key].append(point)
-                experiment_data[window][AnalysisBasis.EXPOSURES] = {}
-                raw_data[window][AnalysisBasis.EXPOSURES] = {}
+        segment_points_enrollments = data_from_jetstream.get(
+            AnalysisBasis.ENROLLMENTS, {}
+        )
+        segment_points_exposures = data_from_jetstream.get(AnalysisBasis.EXPOSURES, {})
 
+        # The points were already validated by get_data(), so build the
+        # JetstreamData without validating them again
         for segment, segment_data in segment_points_enrollments.items():
-            data = raw_data[window][AnalysisBasis.ENROLLMENTS][segment] = JetstreamData(
-                __root__=(segment_data)
+            data = raw_data[window][AnalysisBasis.ENROLLMENTS][segment] = (
+                JetstreamData.construct(__root__=segment_data)
             )
             (
                 result_metrics,
@@ -248,6 +453,7 @@ def get_experiment_data(experiment: NimbusExperiment):
                 other_metrics,
             ) = get_results_metrics_map(
                 data,
+                experiment.application,
                 experiment.primary_outcomes,
                 experiment.secondary_outcomes,
                 outcomes_metadata,
@@ -259,26 +465,27 @@ def get_experiment_data(experiment: NimbusExperiment):
                     raw_data[AnalysisWindow.WEEKLY][AnalysisBasis.ENROLLMENTS][segment]
                 )
                 # Create the output object (overall data)
-                ResultsObjectModel = create_results_object_model(data)
-
-                data = ResultsObjectModel(result_metrics, data, experiment)
-                data.append_conversion_count(primary_metrics_set)
+                transformed_data = transform_results(result_metrics, data, experiment)
+                append_conversion_count(transformed_data, primary_metrics_set)
 
                 if segment == Segment.ALL:
                     experiment_data["other_metrics"] = other_metrics
             elif data and window == AnalysisWindow.WEEKLY:
                 # Create the output object (weekly data)
-                ResultsObjectModel = create_results_object_model(data)
-
-                data = ResultsObjectModel(result_metrics, data, experiment, window)
+                transformed_data = transform_results(
+                    result_metrics, data, experiment, window
+                )
+            else:
+                transformed_data = None
 
-            # Convert output object to dict and put into the final object
-            transformed_data = data.dict(exclude_none=True) or None
-            experiment_data[window][AnalysisBasis.ENROLLMENTS][segment] = transformed_data
+            # Put the output object into the final object
+            experiment_data[window][AnalysisBasis.ENROLLMENTS][segment] = (
+                transformed_data or None
+            )
 
         for segment, segment_data in segment_points_exposures.items():
-            data = raw_data[window][AnalysisBasis.EXPOSURES][segment] = JetstreamData(
-                __root__=(segment_data)
+            data = raw_data[window][AnalysisBasis.EXPOSURES][segment] = (
+                JetstreamData.construct(__root__=segment_data)
             )
             (
                 result_metrics,
@@ -286,6 +493,7 @@ def get_experiment_data(experiment: NimbusExperiment):
                 other_metrics,
             ) = get_results_metrics_map(
                 data,
+                experiment.application,
                 experiment.primary_outcomes,
                 experiment.secondary_outcomes,
                 outcomes_metadata,
@@ -297,18 +505,19 @@ def get_experiment_data(experiment: NimbusExperiment):
                     raw_data[AnalysisWindow.WEEKLY][AnalysisBasis.EXPOSURES][segment]
                 )
 
-                ResultsObjectModel = create_results_object_model(data)
-
-                data = ResultsObjectModel(result_metrics, data, experiment)
-                data.append_conversion_count(primary_metrics_set)
+                transformed_data = transform_results(result_metrics, data, experiment)
+                append_conversion_count(transformed_data, primary_metrics_set)
 
             elif data and window == AnalysisWindow.WEEKLY:
-                ResultsObjectModel = create_results_object_model(data)
-
-                data = ResultsObjectModel(result_metrics, data, experiment, window)
+                transformed_data = transform_results(
+                    result_metrics, data, experiment, window
+                )
+            else:
+                transformed_data = None
 
-            transformed_data = data.dict(exclude_none=True) or None
-            experiment_data[window][AnalysisBasis.EXPOSURES][segment] = transformed_data
+            experiment_data[window][AnalysisBasis.EXPOSURES][segment] = (
+                transformed_data or None
+            )
 
     errors_by_metric = {}
     errors_experiment_overall = []
@@ -364,3 +573,66 @@ def get_population_sizing_data():
     sizing_data = get_sizing_data(suffix="latest")
     sizing = SampleSizes.parse_obj(sizing_data) if sizing_data is not None else {}
     return {"v1": sizing}
+
+
+def index_population_sizing_data(sizing):
+    """Group pre-serialized sizing targets by app id and then by
+    (channel, country, locale or language, new_or_existing)."""
+    index = defaultdict(lambda: defaultdict(list))
+    for sizing_key, sizing_by_user_type in sizing.__root__.items():
+        for target in sizing_by_user_type.__root__.values():
+            recipe = target.target_recipe
+            target_data = json.loads(target.json())
+            index[recipe.app_id][
+                (
+                    recipe.channel.value,
+                    recipe.country,
+                    recipe.locale or recipe.language,
+                    recipe.new_or_existing.value,
+                )
+            ].append(json.dumps({"key": sizing_key, **target_data}))
+    return {app_id: dict(targets) for app_id, targets in index.items()}
+
+
+def cache_population_sizing_data(sizing_json, sizing_index):
+    """Store the serialized sizing data and its index, along with a version
+    that tells each process when its memoized index is out of date."""
+    cache.set(settings.SIZING_DATA_KEY, sizing_json)
+    cache.set(settings.SIZING_DATA_INDEX_KEY, sizing_index)
+    cache.set(
+        settings.SIZING_DATA_VERSION_KEY,
+        hashlib.sha256(sizing_json.encode()).hexdigest(),
+    )
+
+
+# The (version, index) of the population sizing index last read by this process.
+_population_sizing_index = {}
+
+
+def get_population_sizing_index():
+    """Return the population sizing index, only reading it from the cache
+    again after a new version has been stored."""
+    version = cache.get(settings.SIZING_DATA_VERSION_KEY)
+    if version is None or _population_sizing_index.get("version") != version:
+        _population_sizing_index["index"] = (
+            cache.get(settings.SIZING_DATA_INDEX_KEY) or {}
+        )
+        _population_sizing_index["version"] = version
+    return _population_sizing_index["index"]
+
+
+def lookup_population_sizing_targets(
+    index, app_id, channel=None, country=None, locale=None, new_or_existing=None
+):
+    app_targets = index.get(app_id, {})
+    query = (channel, country, locale, new_or_existing)
+    if None not in query:
+        targets = app_targets.get(query, [])
+    else:
+        targets = [
+            target
+            for key, key_targets in app_targets.items()
+            if all(value is None or value == part for value, part in zip(query, key))
+            for target in key_targets
+        ]
+    return f"[{','.join(targets)}]"
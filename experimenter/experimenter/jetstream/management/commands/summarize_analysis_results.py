@@ -0,0 +1,57 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef
+
+from experimenter.experiments.models import (
+    NimbusAnalysisResult,
+    NimbusAnalysisSummary,
+    NimbusExperiment,
+)
+from experimenter.jetstream.client import get_primary_metrics
+
+logger = logging.getLogger()
+
+
+class Command(BaseCommand):
+    help = "Summarize the stored analysis results of experiments without a summary"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Also re-summarize experiments that already have a summary",
+        )
+
+    def handle(self, *args, **options):
+        experiments = NimbusExperiment.objects.filter(
+            Exists(NimbusAnalysisResult.objects.filter(experiment=OuterRef("pk")))
+        )
+        if not options["all"]:
+            experiments = experiments.filter(analysis_summary__isnull=True)
+
+        summarized = 0
+        for experiment in (
+            experiments.only("id", "slug", "application", "primary_outcomes")
+            .order_by("id")
+            .iterator(chunk_size=100)
+        ):
+            # Summaries only use the results for all enrollments
+            results_data = NimbusAnalysisResult.objects.get_results_data(
+                experiment, segment="all"
+            )
+            if results_data is None:
+                continue
+
+            NimbusAnalysisSummary.objects.summarize(
+                experiment,
+                results_data,
+                get_primary_metrics(
+                    experiment.application,
+                    experiment.primary_outcomes,
+                    (results_data.get("metadata") or {}).get("outcomes"),
+                ),
+            )
+            summarized += 1
+
+        logger.info(f"Summarized analysis results for {summarized} experiments")
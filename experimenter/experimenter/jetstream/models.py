@@ -1,9 +1,9 @@
 from enum import StrEnum
-from typing import Any
+from typing import Any, Optional
 
 from mozilla_nimbus_schemas.jetstream import AnalysisBasis
 from mozilla_nimbus_schemas.jetstream import Statistic as JetstreamStatisticResult
-from pydantic import BaseModel, create_model
+from pydantic import BaseModel
 
 from experimenter.experiments.models import NimbusExperiment
 
@@ -84,7 +84,7 @@ for group, metrics in GROUPED_METRICS.items():
 class JetstreamDataPoint(JetstreamStatisticResult):
     """Same as mozilla-nimbus-schemas `Statistic` but sets a default analysis_basis."""
 
-    analysis_basis: AnalysisBasis = AnalysisBasis.ENROLLMENTS
+    analysis_basis: Optional[AnalysisBasis] = AnalysisBasis.ENROLLMENTS
 
     class Config:
         use_enum_values = True
@@ -190,210 +190,159 @@ class MetricData(BaseModel):
     percent: float = None
 
 
-def compute_significance(data_point: DataPoint) -> Significance:
-    if max(data_point.lower, data_point.upper, 0) == 0:
+def compute_significance(lower: float, upper: float) -> Significance:
+    if max(lower, upper, 0) == 0:
         return Significance.NEGATIVE
 
-    if min(data_point.lower, data_point.upper, 0) == 0:
+    if min(lower, upper, 0) == 0:
         return Significance.POSITIVE
 
     return Significance.NEUTRAL
 
 
-class ResultsObjectModelBase(BaseModel):
-    def __init__(
-        self,
-        result_metrics: dict[str, set[Statistic]],
-        data: JetstreamData,
-        experiment: NimbusExperiment,
-        window: AnalysisWindow = AnalysisWindow.OVERALL,
-    ):
-        super().__init__()
+def empty_comparison_data():
+    return {"all": [], "first": {}}
 
-        assert experiment.reference_branch
 
-        for jetstream_data_point in data:
-            metric = jetstream_data_point.metric
-            statistic = jetstream_data_point.statistic
+def empty_metric_data(branches):
+    return {
+        BranchComparison.ABSOLUTE: empty_comparison_data(),
+        BranchComparison.DIFFERENCE: {b: empty_comparison_data() for b in branches},
+        BranchComparison.UPLIFT: {b: empty_comparison_data() for b in branches},
+        "significance": {
+            b: {AnalysisWindow.OVERALL: {}, AnalysisWindow.WEEKLY: {}} for b in branches
+        },
+    }
 
-            if metric in result_metrics and statistic in result_metrics[metric]:
-                comparison_to_branch = jetstream_data_point.comparison_to_branch
 
-                branch_comparison = (
-                    BranchComparison.ABSOLUTE
-                    if jetstream_data_point.comparison is None
-                    else jetstream_data_point.comparison
-                )
-                data_point = DataPoint(
-                    lower=jetstream_data_point.lower,
-                    upper=jetstream_data_point.upper,
-                    point=jetstream_data_point.point,
-                )
+def transform_results(
+    result_metrics: dict[str, set[Statistic]],
+    data: JetstreamData,
+    experiment: NimbusExperiment,
+    window: AnalysisWindow = AnalysisWindow.OVERALL,
+):
+    """
+    Transform the Jetstream data for a single window, analysis basis and
+    segment into the results shape used by the frontend:
 
-                # Need window index for weekly DataPoint objects and for storing
-                # significance for each window. Overall should always be 1 because
-                # there is only ever one overall window.
-                window_index = (
-                    1
-                    if window == AnalysisWindow.OVERALL
-                    else jetstream_data_point.window_index
-                )
+        branch -> branch_data -> metric group -> metric -> comparison -> data
 
-                branch = jetstream_data_point.branch
-                branch_obj = getattr(self, branch)
-                branch_obj.is_control = experiment.reference_branch.slug == branch
+    Every branch has an entry for every metric in the data, and the pairwise
+    comparisons and significance of every metric have an entry for every
+    branch. Data points are plain dicts that leave out unset values.
+    """
+    assert experiment.reference_branch
 
-                group_obj = getattr(
-                    branch_obj.branch_data, METRIC_GROUP.get(metric, Group.OTHER)
-                )
+    branches = list(dict.fromkeys(point.branch for point in data))
+    metrics = list(dict.fromkeys(point.metric for point in data))
 
-                if metric == Metric.USER_COUNT and statistic == Statistic.PERCENT:
-                    user_count_data = getattr(group_obj, Metric.USER_COUNT)
-                    user_count_data.percent = data_point.point
-                    continue
-
-                metric_data = getattr(group_obj, metric)
-
-                if (
-                    branch_comparison == BranchComparison.DIFFERENCE
-                    and data_point.has_bounds()
-                ):
-                    significance = compute_significance(data_point)
-                    if comparison_to_branch is not None:
-                        significance_to_branch = getattr(
-                            metric_data.significance, comparison_to_branch
-                        )
-                        getattr(significance_to_branch, window)[
-                            window_index
-                        ] = significance
-
-                if window == AnalysisWindow.WEEKLY:
-                    data_point.set_window_index(window_index)
-
-                comparison_data = getattr(metric_data, branch_comparison)
-                if branch_comparison == BranchComparison.ABSOLUTE:
-                    if len(comparison_data.all) == 0:
-                        comparison_data.first = data_point
-
-                    comparison_data.all.append(data_point)
-
-                # this is effectively an `else`, but we'll check just in case
-                if comparison_to_branch is not None:
-                    pairwise_comparison_data = getattr(
-                        comparison_data, comparison_to_branch
-                    )
-                    if len(pairwise_comparison_data.all) == 0:
-                        pairwise_comparison_data.first = data_point
-
-                    pairwise_comparison_data.all.append(data_point)
-
-    def append_conversion_count(self, primary_metrics_set):
-        for branch_name in self.__fields__:
-            branch = getattr(self, branch_name)
-            branch_data = branch.branch_data
-            for primary_metric in primary_metrics_set:
-                user_count_data = getattr(
-                    getattr(branch_data, Group.OTHER), Metric.USER_COUNT
-                )
-                absolute_user_counts = getattr(user_count_data, BranchComparison.ABSOLUTE)
-                primary_metric_data = getattr(
-                    getattr(branch_data, METRIC_GROUP.get(primary_metric, Group.OTHER)),
-                    primary_metric,
-                    None,
-                )
-                if primary_metric_data is None:
-                    continue
+    results = {}
+    for branch in branches:
+        branch_data = {Group.SEARCH: {}, Group.USAGE: {}, Group.OTHER: {}}
+        for metric in metrics:
+            branch_data[METRIC_GROUP.get(metric, Group.OTHER)][metric] = (
+                empty_metric_data(branches)
+            )
+        results[branch] = {"is_control": False, "branch_data": branch_data}
 
-                absolute_primary_metric_vals = getattr(
-                    primary_metric_data, BranchComparison.ABSOLUTE
-                )
+    for jetstream_data_point in data:
+        metric = jetstream_data_point.metric
+        statistic = jetstream_data_point.statistic
 
-                if not absolute_primary_metric_vals.all:
-                    continue
+        if metric not in result_metrics or statistic not in result_metrics[metric]:
+            continue
 
-                population_count = absolute_user_counts.first.point
-                conversion_percent = absolute_primary_metric_vals.first.point
+        comparison_to_branch = jetstream_data_point.comparison_to_branch
+        branch_comparison = (
+            BranchComparison.ABSOLUTE
+            if jetstream_data_point.comparison is None
+            else jetstream_data_point.comparison
+        )
+        lower = jetstream_data_point.lower
+        upper = jetstream_data_point.upper
+        point = jetstream_data_point.point
+
+        branch = jetstream_data_point.branch
+        branch_results = results[branch]
+        branch_results["is_control"] = experiment.reference_branch.slug == branch
+
+        metric_data = branch_results["branch_data"][
+            METRIC_GROUP.get(metric, Group.OTHER)
+        ][metric]
+
+        if metric == Metric.USER_COUNT and statistic == Statistic.PERCENT:
+            if point is None:
+                metric_data.pop("percent", None)
+            else:
+                metric_data["percent"] = point
+            continue
+
+        # Need window index for weekly data points and for storing significance
+        # for each window. Overall should always be 1 because there is only ever
+        # one overall window.
+        window_index = (
+            1 if window == AnalysisWindow.OVERALL else jetstream_data_point.window_index
+        )
 
-                conversion_count = 0.0
-                if None not in (population_count, conversion_percent):
-                    conversion_count = population_count * conversion_percent
+        if (
+            branch_comparison == BranchComparison.DIFFERENCE
+            and lower
+            and upper
+            and comparison_to_branch is not None
+        ):
+            metric_data["significance"][comparison_to_branch][window][window_index] = (
+                compute_significance(lower, upper)
+            )
 
-                absolute_primary_metric_vals.first.count = conversion_count
-                absolute_primary_metric_vals.all[0].count = conversion_count
+        data_point = {
+            key: value
+            for key, value in (("lower", lower), ("upper", upper), ("point", point))
+            if value is not None
+        }
+        if window == AnalysisWindow.WEEKLY and window_index is not None:
+            data_point["window_index"] = window_index
 
+        comparison_data = metric_data[branch_comparison]
+        if branch_comparison == BranchComparison.ABSOLUTE:
+            if not comparison_data["all"]:
+                comparison_data["first"] = data_point
 
-"""
-    Dynamically create BranchData and ResultsObjectModel objects.
-    These need to be dynamically created because their keys are
-    variable.
-"""
+            comparison_data["all"].append(data_point)
 
+        # this is effectively an `else`, but we'll check just in case
+        if comparison_to_branch is not None:
+            pairwise_comparison_data = comparison_data[comparison_to_branch]
+            if not pairwise_comparison_data["all"]:
+                pairwise_comparison_data["first"] = data_point
 
-def create_results_object_model(data: JetstreamData):
-    branches = {}
-    metrics = {}
+            pairwise_comparison_data["all"].append(data_point)
 
-    for jetstream_data_point in data:
-        branches[jetstream_data_point.branch] = {}
-
-    # create a dynamic model with all branches, leveraging BranchComparisonData
-    branches_data = {b: BranchComparisonData() for b in branches}
-    PairwiseBranchComparisonData = create_model(
-        "PairwiseBranchComparisonData",
-        **branches_data,
-    )
-
-    # create a dynamic model with all branches, leveraging SignificanceData
-    branches_significance_data = {b: SignificanceData() for b in branches}
-    PairwiseSignificanceData = create_model(
-        "PairwiseSignificanceData",
-        **branches_significance_data,
-    )
-
-    class PairwiseMetricData(MetricData):
-        difference: PairwiseBranchComparisonData
-        relative_uplift: PairwiseBranchComparisonData
-        significance: PairwiseSignificanceData
+    return results
 
-    for jetstream_data_point in data:
-        metrics[jetstream_data_point.metric] = PairwiseMetricData(
-            absolute=BranchComparisonData(),
-            difference=PairwiseBranchComparisonData(),
-            relative_uplift=PairwiseBranchComparisonData(),
-            significance=PairwiseSignificanceData(),
-        )
 
-    search_data = {k: v for k, v in metrics.items() if k in SEARCH_METRICS}
-    usage_data = {k: v for k, v in metrics.items() if k in USAGE_METRICS}
-    other_data = {
-        k: v for k, v in metrics.items() if k not in SEARCH_METRICS + USAGE_METRICS
-    }
+def append_conversion_count(results, primary_metrics_set):
+    for branch_results in results.values():
+        branch_data = branch_results["branch_data"]
+        for primary_metric in primary_metrics_set:
+            user_count_data = branch_data[Group.OTHER][Metric.USER_COUNT]
+            absolute_user_counts = user_count_data[BranchComparison.ABSOLUTE]
+            primary_metric_data = branch_data[
+                METRIC_GROUP.get(primary_metric, Group.OTHER)
+            ].get(primary_metric)
+            if primary_metric_data is None:
+                continue
 
-    # Dynamically create our grouped models which are dependent on metrics
-    # available for a given experiment
-    SearchData = create_model("SearchData", **search_data)
-    UsageData = create_model("UsageData", **usage_data)
-    OtherData = create_model("OtherData", **other_data)
+            absolute_primary_metric_vals = primary_metric_data[BranchComparison.ABSOLUTE]
 
-    class BranchData(BaseModel):
-        search_metrics: SearchData
-        usage_metrics: UsageData
-        other_metrics: OtherData
+            if not absolute_primary_metric_vals["all"]:
+                continue
 
-    class Branch(BaseModel):
-        is_control: bool = False
-        branch_data: BranchData
+            population_count = absolute_user_counts["first"].get("point")
+            conversion_percent = absolute_primary_metric_vals["first"].get("point")
 
-    for branch in branches:
-        branches[branch] = Branch(
-            is_control=False,
-            branch_data=BranchData(
-                search_metrics=SearchData(),
-                usage_metrics=UsageData(),
-                other_metrics=OtherData(),
-            ),
-        )
+            conversion_count = 0.0
+            if None not in (population_count, conversion_percent):
+                conversion_count = population_count * conversion_percent
 
-    # Create ResultsObjectModel model which is dependent on
-    # branches available for a given experiment
-    return create_model("ResultsObjectModel", **branches, __base__=ResultsObjectModelBase)
+            absolute_primary_metric_vals["first"]["count"] = conversion_count
+            absolute_primary_metric_vals["all"][0]["count"] = conversion_count
@@ -1,14 +1,28 @@
 import datetime as dt
+import time
 
 import markus
+from celery import chord
 from celery.utils.log import get_task_logger
-from django.core.cache import cache
+from django.conf import settings
+from django.db.models import DateField, Exists, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 
 from experimenter.celery import app
 from experimenter.experiments.constants import NimbusConstants
-from experimenter.experiments.models import NimbusExperiment
-from experimenter.jetstream.client import get_experiment_data, get_population_sizing_data
-from experimenter.settings import SIZING_DATA_KEY
+from experimenter.experiments.models import (
+    NimbusAnalysisResult,
+    NimbusChangeLog,
+    NimbusExperiment,
+)
+from experimenter.jetstream.client import (
+    cache_population_sizing_data,
+    get_experiment_data,
+    get_population_sizing_data,
+    get_primary_metrics,
+    get_results_fingerprint,
+    index_population_sizing_data,
+)
 
 logger = get_task_logger(__name__)
 metrics = markus.get_metrics("jetstream.tasks")
@@ -16,14 +30,47 @@ metrics = markus.get_metrics("jetstream.tasks")
 
 @app.task
 @metrics.timer_decorator("fetch_experiment_data")
-def fetch_experiment_data(experiment_id):
+def fetch_experiment_data(experiment_id, force=False):
+    """Fetch and store an experiment's Jetstream results.
+
+    Returns the number of bytes downloaded, or None if the results have not
+    changed since they were last stored and were skipped.
+    """
     metrics.incr("fetch_experiment_data.started")
     experiment = None
     try:
         experiment = NimbusExperiment.objects.get(id=experiment_id)
-        experiment.results_data = get_experiment_data(experiment)
-        experiment.save()
+        fingerprint = get_results_fingerprint(experiment)
+
+        if (
+            not force
+            and experiment.results_data_fingerprint == fingerprint
+            and experiment.analysis_results.exists()
+        ):
+            metrics.incr("fetch_experiment_data.skipped")
+            logger.info(
+                f"Skipping unchanged Jetstream data for {experiment.name} "
+                f"({experiment.slug})"
+            )
+            return None
+
+        download_sizes = []
+        results_data = get_experiment_data(experiment, download_sizes)["v3"]
+        metadata = results_data["metadata"] or {}
+        NimbusAnalysisResult.objects.store(
+            experiment,
+            results_data,
+            get_primary_metrics(
+                experiment.application,
+                experiment.primary_outcomes,
+                metadata.get("outcomes"),
+            ),
+        )
+        experiment.results_data_fingerprint = fingerprint
+        experiment.save(update_fields=["results_data_fingerprint"])
+        metrics.incr("fetch_experiment_data.refreshed")
         metrics.incr("fetch_experiment_data.completed")
+        return sum(download_sizes)
     except Exception as e:
         metrics.incr("fetch_experiment_data.failed")
         failure_message = f"Fetching experiment data for {experiment_id} "
@@ -34,37 +81,153 @@ def fetch_experiment_data(experiment_id):
         raise e
 
 
+def get_experiments_to_fetch():
+    """Return the experiments whose Jetstream data should be fetched.
+
+    Live experiments and experiments without results are always fetched,
+    complete experiments only until DAYS_ANALYSIS_BUFFER days after they end.
+    """
+    cutoff = dt.date.today() - dt.timedelta(days=NimbusConstants.DAYS_ANALYSIS_BUFFER)
+    end_changelogs = NimbusChangeLog.objects.filter(
+        experiment=OuterRef("pk"),
+        old_status=NimbusExperiment.Status.LIVE,
+        new_status=NimbusExperiment.Status.COMPLETE,
+    ).order_by("-changed_on")
+    experiments = (
+        NimbusExperiment.objects.filter(
+            status__in=[NimbusExperiment.Status.COMPLETE, NimbusExperiment.Status.LIVE]
+        )
+        .annotate(
+            has_results=Exists(
+                NimbusAnalysisResult.objects.filter(experiment=OuterRef("pk"))
+            ),
+            analysis_end_date=Coalesce(
+                "_end_date",
+                Subquery(end_changelogs.values("changed_on__date")[:1]),
+                output_field=DateField(),
+            ),
+        )
+        .filter(
+            Q(status=NimbusExperiment.Status.LIVE)
+            | Q(has_results=False)
+            | Q(analysis_end_date__gte=cutoff)
+            | Q(analysis_end_date=None)
+        )
+        .only("id", "name", "slug", "status")
+        .order_by("id")
+    )
+
+    for experiment in experiments:
+        if (
+            experiment.status == NimbusExperiment.Status.COMPLETE
+            and experiment.has_results
+            and experiment.analysis_end_date is None
+        ):
+            # Fall back to the proposed end date, which can't be computed in SQL
+            end_date = NimbusExperiment.objects.get(id=experiment.id).computed_end_date
+            if not end_date or end_date < cutoff:
+                continue
+
+        yield experiment
+
+
+@app.task(ignore_result=False)
+def fetch_experiment_data_batch(experiment_ids):
+    """Fetch the Jetstream data for each experiment in turn and report how it
+    went to summarize_jetstream_data."""
+    refreshed = 0
+    skipped = 0
+    bytes_downloaded = 0
+    failed = []
+    for experiment_id in experiment_ids:
+        try:
+            downloaded = fetch_experiment_data(experiment_id)
+        except Exception:
+            failed.append(experiment_id)
+            continue
+
+        if downloaded is None:
+            skipped += 1
+        else:
+            refreshed += 1
+            bytes_downloaded += downloaded
+
+    return {
+        "refreshed": refreshed,
+        "skipped": skipped,
+        "bytes_downloaded": bytes_downloaded,
+        "failed": failed,
+    }
+
+
+@app.task
+def summarize_jetstream_data(results, started_at):
+    summary = {
+        "duration": time.time() - started_at,
+        "refreshed": sum(result["refreshed"] for result in results),
+        "skipped": sum(result["skipped"] for result in results),
+        "bytes_downloaded": sum(result["bytes_downloaded"] for result in results),
+        "failed": [
+            experiment_id for result in results for experiment_id in result["failed"]
+        ],
+    }
+
+    metrics.timing("fetch_jetstream_data.duration", summary["duration"] * 1000)
+    metrics.gauge("fetch_jetstream_data.bytes_downloaded", summary["bytes_downloaded"])
+    metrics.gauge("fetch_jetstream_data.refreshed_experiments", summary["refreshed"])
+    metrics.gauge("fetch_jetstream_data.skipped_experiments", summary["skipped"])
+    metrics.gauge("fetch_jetstream_data.failed_experiments", len(summary["failed"]))
+    metrics.incr("fetch_jetstream_data.completed")
+    logger.info(
+        f"Refreshed Jetstream data for {summary['refreshed']} experiments "
+        f"({summary['bytes_downloaded']} bytes) and skipped {summary['skipped']} "
+        f"unchanged experiments in {summary['duration']:.1f}s, "
+        f"failed: {summary['failed']}"
+    )
+    return summary
+
+
 @app.task
 @metrics.timer_decorator("fetch_jetstream_data")
 def fetch_jetstream_data():
     metrics.incr("fetch_jetstream_data.started")
     try:
-        for experiment in NimbusExperiment.objects.filter(
-            status__in=[NimbusExperiment.Status.COMPLETE, NimbusExperiment.Status.LIVE]
+        started_at = time.time()
+        experiment_ids = []
+        for experiment in get_experiments_to_fetch():
+            logger.info(
+                f"Fetching Jetstream data for {experiment.name} ({experiment.slug})"
+            )
+            experiment_ids.append(experiment.id)
+
+        for experiment in (
+            NimbusExperiment.objects.filter(
+                status__in=[
+                    NimbusExperiment.Status.COMPLETE,
+                    NimbusExperiment.Status.LIVE,
+                ]
+            )
+            .exclude(id__in=experiment_ids)
+            .only("id", "name", "slug")
         ):
-            if (
-                experiment.status == NimbusExperiment.Status.LIVE
-                or experiment.results_data is None
-                or (
-                    experiment.computed_end_date
-                    and (
-                        experiment.computed_end_date
-                        + dt.timedelta(days=NimbusConstants.DAYS_ANALYSIS_BUFFER)
-                    )
-                    >= dt.date.today()
-                )
-            ):
-                logger.info(
-                    f"Fetching Jetstream data for {experiment.name} ({experiment.slug})"
-                )
-                fetch_experiment_data.delay(experiment.id)
-                metrics.incr("fetch_jetstream_data.completed")
-            else:
-                metrics.incr("fetch_jetstream_data.skipped")
-                logger.info(
-                    f"Skipping cache refresh for old experiment {experiment.name}"
-                    f" ({experiment.slug})"
-                )
+            metrics.incr("fetch_jetstream_data.skipped")
+            logger.info(
+                f"Skipping cache refresh for old experiment {experiment.name}"
+                f" ({experiment.slug})"
+            )
+
+        if experiment_ids:
+            # Spread the experiments over at most JETSTREAM_FETCH_CONCURRENCY
+            # tasks so that only that many fetches run at once
+            concurrency = settings.JETSTREAM_FETCH_CONCURRENCY
+            chord(
+                [
+                    fetch_experiment_data_batch.s(experiment_ids[i::concurrency])
+                    for i in range(min(concurrency, len(experiment_ids)))
+                ]
+            )(summarize_jetstream_data.s(started_at))
+        else:
+            metrics.incr("fetch_jetstream_data.completed")
 
     except Exception as e:
         metrics.incr("fetch_jetstream_data.failed")
@@ -80,7 +243,13 @@ def fetch_population_sizing_data():
         sizing_data = get_population_sizing_data()
         sizing = sizing_data.get("v1")
 
-        cache.set(SIZING_DATA_KEY, sizing)
+        # Serialize once here rather than on every nimbusConfig query
+        if sizing:
+            cache_population_sizing_data(
+                sizing.json(), index_population_sizing_data(sizing)
+            )
+        else:
+            cache_population_sizing_data("{}", {})
         metrics.incr("fetch_population_sizing_data.completed")
     except Exception as e:
         metrics.incr("fetch_population_sizing_data.failed")
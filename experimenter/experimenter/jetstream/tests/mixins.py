@@ -2,7 +2,10 @@ from django.core.cache import cache
 from django.test import TestCase, override_settings
 from mozilla_nimbus_schemas.jetstream import SampleSizesFactory
 
-from experimenter.settings import SIZING_DATA_KEY
+from experimenter.jetstream.client import (
+    cache_population_sizing_data,
+    index_population_sizing_data,
+)
 
 
 @override_settings(
@@ -21,7 +24,10 @@ class MockSizingDataMixin(TestCase):
 
     def setup_cached_sizing_data(self):
         self.sizing_test_data = SampleSizesFactory.build()
-        cache.set(SIZING_DATA_KEY, self.sizing_test_data)
+        cache_population_sizing_data(
+            self.sizing_test_data.json(),
+            index_population_sizing_data(self.sizing_test_data),
+        )
 
     def get_cached_sizing_data(self):
         return self.sizing_test_data
@@ -0,0 +1,76 @@
+import json
+
+from django.test import TestCase
+from parameterized import parameterized
+
+from experimenter.experiments.tests.factories import NimbusExperimentFactory
+from experimenter.jetstream.client import get_results_metrics_map
+from experimenter.jetstream.models import (
+    AnalysisWindow,
+    JetstreamData,
+    append_conversion_count,
+    transform_results,
+)
+from experimenter.jetstream.tests import mock_valid_outcomes
+from experimenter.jetstream.tests.constants import (
+    JetstreamTestData,
+    ZeroJetstreamTestData,
+)
+from experimenter.outcomes import Outcomes
+
+
+@mock_valid_outcomes
+class TestTransformResults(TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        super().setUp()
+        Outcomes.clear_cache()
+
+        self.primary_outcomes = ["default-browser"]
+        self.experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE,
+            primary_outcomes=self.primary_outcomes,
+        )
+        self.experiment.reference_branch.slug = "control"
+        self.experiment.reference_branch.save()
+
+    def assertResultsEqual(self, results, expected):
+        # Compare the results as they are stored in the analysis results JSONField
+        self.assertEqual(
+            json.loads(json.dumps(results)), json.loads(json.dumps(expected))
+        )
+
+    @parameterized.expand([(JetstreamTestData,), (ZeroJetstreamTestData,)])
+    def test_weekly_results_match_golden_output(self, test_data):
+        daily_data, weekly_data, *_ = test_data.get_test_data(self.primary_outcomes)
+        data = JetstreamData(__root__=daily_data)
+        result_metrics, _, _ = get_results_metrics_map(
+            data, self.experiment.application, self.primary_outcomes, [], None
+        )
+
+        results = transform_results(
+            result_metrics, data, self.experiment, AnalysisWindow.WEEKLY
+        )
+
+        self.assertResultsEqual(results, weekly_data)
+
+    @parameterized.expand([(JetstreamTestData,), (ZeroJetstreamTestData,)])
+    def test_overall_results_match_golden_output(self, test_data):
+        daily_data, _, overall_data, *_ = test_data.get_test_data(self.primary_outcomes)
+        data = JetstreamData(__root__=daily_data)
+        data.append_population_percentages()
+        data.append_retention_data(JetstreamData(__root__=daily_data))
+        result_metrics, primary_metrics_set, _ = get_results_metrics_map(
+            data, self.experiment.application, self.primary_outcomes, [], None
+        )
+
+        results = transform_results(result_metrics, data, self.experiment)
+        append_conversion_count(results, primary_metrics_set)
+
+        self.assertResultsEqual(results, overall_data)
+
+    def test_results_for_empty_data(self):
+        self.assertEqual(
+            transform_results({}, JetstreamData(__root__=[]), self.experiment), {}
+        )
@@ -0,0 +1,97 @@
+from django.core.management import call_command
+from django.test import TestCase
+
+from experimenter.experiments.models import (
+    NimbusAnalysisResult,
+    NimbusAnalysisSummary,
+    NimbusExperiment,
+)
+from experimenter.experiments.tests.factories import NimbusExperimentFactory
+from experimenter.jetstream.tests import mock_valid_outcomes
+from experimenter.outcomes import Outcomes
+
+
+@mock_valid_outcomes
+class TestSummarizeAnalysisResults(TestCase):
+    METADATA = {
+        "outcomes": {
+            "default-browser": {
+                "metrics": ["default_browser_action"],
+                "default_metrics": ["mozilla_default_browser"],
+            },
+        },
+    }
+    OVERALL = {
+        "control": {"is_control": True, "branch_data": {"other_metrics": {}}},
+        "treatment": {
+            "is_control": False,
+            "branch_data": {
+                "other_metrics": {
+                    metric: {
+                        "significance": {"control": {"overall": {"1": significance}}}
+                    }
+                    for metric, significance in (
+                        ("mozilla_default_browser", "positive"),
+                        ("default_browser_action", "negative"),
+                        ("custom_metric", "neutral"),
+                    )
+                },
+            },
+        },
+    }
+    ERRORS = {"experiment": [{"message": "error"}]}
+
+    def setUp(self):
+        super().setUp()
+        Outcomes.clear_cache()
+        self.addCleanup(Outcomes.clear_cache)
+
+        self.experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
+            application=NimbusExperiment.Application.DESKTOP,
+            primary_outcomes=["default-browser"],
+        )
+        NimbusAnalysisResult.objects.store(
+            self.experiment,
+            {
+                "metadata": self.METADATA,
+                "errors": self.ERRORS,
+                "overall": {"enrollments": {"all": self.OVERALL}},
+            },
+        )
+        NimbusAnalysisSummary.objects.all().delete()
+
+    def test_summarizes_experiments_without_summary(self):
+        call_command("summarize_analysis_results")
+
+        summary = NimbusAnalysisSummary.objects.get(experiment=self.experiment)
+        self.assertTrue(summary.has_displayable_results)
+        self.assertEqual(summary.error_count, 1)
+        self.assertEqual(
+            summary.primary_metric_significance,
+            {
+                "default_browser_action": {"treatment": "negative"},
+                "mozilla_default_browser": {"treatment": "positive"},
+            },
+        )
+
+    def test_skips_experiments_with_summary(self):
+        NimbusAnalysisSummary.objects.create(experiment=self.experiment)
+
+        call_command("summarize_analysis_results")
+        self.assertEqual(
+            NimbusAnalysisSummary.objects.get(
+                experiment=self.experiment
+            ).primary_metric_significance,
+            {},
+        )
+
+        call_command("summarize_analysis_results", "--all")
+        self.assertEqual(
+            set(
+                NimbusAnalysisSummary.objects.get(
+                    experiment=self.experiment
+                ).primary_metric_significance
+            ),
+            {"default_browser_action", "mozilla_default_browser"},
+        )
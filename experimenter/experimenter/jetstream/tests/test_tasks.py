@@ -1,17 +1,28 @@
 import datetime
+import io
 import json
 from unittest.mock import patch
 
+import markus
 from django.core.cache import cache
 from django.test import TestCase, override_settings
-from mozilla_nimbus_schemas.jetstream import SampleSizesFactory
+from django.utils import timezone
+from markus.testing import MetricsMock
+from mozilla_nimbus_schemas.jetstream import AnalysisBasis, SampleSizesFactory
 from parameterized import parameterized
+from pydantic import BaseModel
 
-from experimenter.experiments.models import NimbusExperiment
+from experimenter.base.tests.mixins import TemporaryPathSettingsMixin
+from experimenter.experiments.models import NimbusAnalysisResult, NimbusExperiment
 from experimenter.experiments.tests.factories import NimbusExperimentFactory
 from experimenter.jetstream import tasks
-from experimenter.jetstream.client import get_data
-from experimenter.jetstream.models import AnalysisWindow, Group
+from experimenter.jetstream.client import (
+    get_data,
+    get_primary_metrics,
+    get_results_fingerprint,
+    iter_json_array,
+)
+from experimenter.jetstream.models import AnalysisWindow, Group, JetstreamDataPoint
 from experimenter.jetstream.tests import mock_valid_outcomes
 from experimenter.jetstream.tests.constants import (
     JetstreamTestData,
@@ -20,7 +31,7 @@ from experimenter.jetstream.tests.constants import (
 )
 from experimenter.jetstream.tests.mixins import MockSizingDataMixin
 from experimenter.outcomes import Outcomes
-from experimenter.settings import SIZING_DATA_KEY
+from experimenter.settings import SIZING_DATA_INDEX_KEY, SIZING_DATA_KEY
 
 
 @mock_valid_outcomes
@@ -32,6 +43,19 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         super().setUp()
         Outcomes.clear_cache()
 
+        mock_get_modified_time_patcher = patch(
+            "experimenter.jetstream.client.analysis_storage.get_modified_time"
+        )
+        self.mock_get_modified_time = mock_get_modified_time_patcher.start()
+        self.mock_get_modified_time.return_value = datetime.datetime(2024, 1, 1)
+        self.addCleanup(mock_get_modified_time_patcher.stop)
+
+    def get_fetched_experiment_ids(self, mock_chord):
+        header = mock_chord.call_args.args[0]
+        return sorted(
+            experiment_id for signature in header for experiment_id in signature.args[0]
+        )
+
     @parameterized.expand(
         [
             (NimbusExperimentFactory.Lifecycles.CREATED,),
@@ -592,18 +616,19 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 )
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
         with (
             patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
         ):
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             tasks.fetch_experiment_data(experiment.id)
             experiment = NimbusExperiment.objects.get(id=experiment.id)
-            self.assertEqual(experiment.results_data, FULL_DATA)
+            self.assertEqual(
+                NimbusAnalysisResult.objects.get_results_data(experiment),
+                FULL_DATA["v3"],
+            )
 
     @parameterized.expand(
         [
@@ -719,14 +744,12 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 return json.dumps(ret_json)
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
         with (
             patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
         ):
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             if not error_timestamp:
                 with self.assertRaises(Exception):
@@ -734,7 +757,10 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
             else:
                 tasks.fetch_experiment_data(experiment.id)
                 experiment = NimbusExperiment.objects.get(id=experiment.id)
-                self.assertEqual(experiment.results_data, FULL_DATA)
+                self.assertEqual(
+                    NimbusAnalysisResult.objects.get_results_data(experiment),
+                    FULL_DATA["v3"],
+                )
 
     @parameterized.expand(
         [
@@ -803,18 +829,19 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 )
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
         with (
             patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
         ):
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             tasks.fetch_experiment_data(experiment.id)
             experiment = NimbusExperiment.objects.get(id=experiment.id)
-            self.assertEqual(experiment.results_data, FULL_DATA)
+            self.assertEqual(
+                NimbusAnalysisResult.objects.get_results_data(experiment),
+                FULL_DATA["v3"],
+            )
             self.assertTrue(experiment.has_displayable_results)
 
     @parameterized.expand(
@@ -1070,18 +1097,19 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 )
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
         with (
             patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
         ):
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             tasks.fetch_experiment_data(experiment.id)
             experiment = NimbusExperiment.objects.get(id=experiment.id)
-            self.assertEqual(experiment.results_data, FULL_DATA)
+            self.assertEqual(
+                NimbusAnalysisResult.objects.get_results_data(experiment),
+                FULL_DATA["v3"],
+            )
             self.assertTrue(experiment.has_displayable_results)
 
     @parameterized.expand(
@@ -1127,17 +1155,15 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 return "[]" if "errors" in self.name else json.dumps(DAILY_DATA)
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
         with (
             patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
         ):
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             experiment = NimbusExperiment.objects.get(id=experiment.id)
-            self.assertIsNone(experiment.results_data)
+            self.assertFalse(experiment.analysis_results.exists())
 
             mock_get_metadata.return_value = {
                 "outcomes": {
@@ -1147,7 +1173,7 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
 
             tasks.fetch_experiment_data(experiment.id)
             experiment = NimbusExperiment.objects.get(id=experiment.id)
-            self.assertIsNotNone(experiment.results_data)
+            self.assertTrue(experiment.analysis_results.exists())
 
     @parameterized.expand(
         [
@@ -2086,17 +2112,15 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 return "[]" if "errors" in self.name else json.dumps(RESULTS_DATA)
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
         with (
             patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
         ):
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             experiment = NimbusExperiment.objects.get(id=experiment.id)
-            self.assertIsNone(experiment.results_data)
+            self.assertFalse(experiment.analysis_results.exists())
 
             mock_get_metadata.return_value = {
                 "outcomes": {
@@ -2106,7 +2130,10 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
 
             tasks.fetch_experiment_data(experiment.id)
             experiment = NimbusExperiment.objects.get(id=experiment.id)
-            self.assertEqual(experiment.results_data, FULL_DATA)
+            self.assertEqual(
+                NimbusAnalysisResult.objects.get_results_data(experiment),
+                FULL_DATA["v3"],
+            )
 
     @parameterized.expand(
         [
@@ -2123,10 +2150,10 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         now = datetime.datetime.now()
 
         with (
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
+            patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
             patch("experimenter.jetstream.client.datetime") as mock_datetime,
         ):
-            mock_exists.return_value = False
+            mock_open.side_effect = FileNotFoundError
             mock_datetime.now.return_value = now
 
             experiment_errors = [
@@ -2198,84 +2225,92 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
             tasks.fetch_experiment_data(experiment.id)
             experiment = NimbusExperiment.objects.get(id=experiment.id)
             self.assertEqual(
-                experiment.results_data,
+                NimbusAnalysisResult.objects.get_results_data(experiment),
                 {
-                    "v3": {
-                        "metadata": None,
-                        "overall": {},
-                        "show_analysis": False,
-                        "weekly": {},
-                        "errors": {
-                            "experiment": experiment_errors,
-                        },
+                    "metadata": None,
+                    "overall": {},
+                    "show_analysis": False,
+                    "weekly": {},
+                    "errors": {
+                        "experiment": experiment_errors,
                     },
                 },
             )
             self.assertFalse(experiment.has_displayable_results)
 
-    @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_data_fetch_in_loop(self, mock_delay):
+    @patch("experimenter.jetstream.tasks.chord")
+    def test_data_fetch_in_loop(self, mock_chord):
         lifecycle = NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE
         experiment = NimbusExperimentFactory.create_with_lifecycle(lifecycle)
         tasks.fetch_jetstream_data()
-        mock_delay.assert_called_once_with(experiment.id)
+        self.assertEqual(self.get_fetched_experiment_ids(mock_chord), [experiment.id])
 
-    @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_data_fetch_live_continue_fetching_after_proposed_end(self, mock_delay):
+    @patch("experimenter.jetstream.tasks.chord")
+    def test_data_fetch_live_continue_fetching_after_proposed_end(self, mock_chord):
         lifecycle = NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             lifecycle, start_date=datetime.date(2020, 1, 1), proposed_enrollment=12
         )
-        experiment.results_data = {}
-        experiment.save()
+        NimbusAnalysisResult.objects.store(experiment, {})
 
         tasks.fetch_jetstream_data()
-        mock_delay.assert_called_once_with(experiment.id)
+        self.assertEqual(self.get_fetched_experiment_ids(mock_chord), [experiment.id])
 
-    @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_data_fetch_skip_old_complete(self, mock_delay):
+    @patch("experimenter.jetstream.tasks.chord")
+    def test_data_fetch_skip_old_complete(self, mock_chord):
         lifecycle = NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             lifecycle, start_date=datetime.date(2020, 1, 1), proposed_enrollment=12
         )
-        experiment.results_data = {}
-        experiment.save()
+        NimbusAnalysisResult.objects.store(experiment, {})
 
-        tasks.fetch_jetstream_data()
-        mock_delay.assert_not_called()
+        with MetricsMock() as mm:
+            tasks.fetch_jetstream_data()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "jetstream.tasks.fetch_jetstream_data.skipped", value=1
+                )
+            )
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "jetstream.tasks.fetch_jetstream_data.completed"
+                )
+            )
+        mock_chord.assert_not_called()
 
-    @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_data_fetch_skip_preview(self, mock_delay):
+    @patch("experimenter.jetstream.tasks.chord")
+    def test_data_fetch_skip_preview(self, mock_chord):
         lifecycle = NimbusExperimentFactory.Lifecycles.PREVIEW
         offset = NimbusExperiment.DAYS_ANALYSIS_BUFFER + 1
         _ = NimbusExperimentFactory.create_with_lifecycle(
             lifecycle, end_date=datetime.date.today() - datetime.timedelta(days=offset)
         )
         tasks.fetch_jetstream_data()
-        mock_delay.assert_not_called()
+        mock_chord.assert_not_called()
 
-    @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_data_expired_in_loop(self, mock_delay):
+    @patch("experimenter.jetstream.tasks.chord")
+    def test_data_expired_in_loop(self, mock_chord):
         lifecycle = NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE
         offset = NimbusExperiment.DAYS_ANALYSIS_BUFFER + 1
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             lifecycle, end_date=datetime.date.today() - datetime.timedelta(days=offset)
         )
-        experiment.results_data = {
-            "v3": {
+        NimbusAnalysisResult.objects.store(
+            experiment,
+            {
                 "metadata": None,
                 "overall": None,
                 "show_analysis": False,
                 "weekly": None,
             },
-        }
-        experiment.save()
+        )
 
         tasks.fetch_jetstream_data()
-        mock_delay.assert_not_called()
+        mock_chord.assert_not_called()
 
-    @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_data_null_fetches(self, mock_delay):
+    @patch("experimenter.jetstream.tasks.chord")
+    def test_data_null_fetches(self, mock_chord):
         lifecycle = NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE
         offset = NimbusExperiment.DAYS_ANALYSIS_BUFFER + 1
         experiment = NimbusExperimentFactory.create_with_lifecycle(
@@ -2283,24 +2318,142 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         )
 
         tasks.fetch_jetstream_data()
-        mock_delay.assert_called_once_with(experiment.id)
+        self.assertEqual(self.get_fetched_experiment_ids(mock_chord), [experiment.id])
 
-    @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_no_data_fetch_in_loop(self, mock_delay):
+    @patch("experimenter.jetstream.tasks.chord")
+    def test_no_data_fetch_in_loop(self, mock_chord):
         lifecycle = NimbusExperimentFactory.Lifecycles.CREATED
         NimbusExperimentFactory.create_with_lifecycle(lifecycle)
         tasks.fetch_jetstream_data()
-        mock_delay.assert_not_called()
+        mock_chord.assert_not_called()
 
-    @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_exception_for_fetch_jetstream_data(self, mock_delay):
+    @patch("experimenter.jetstream.tasks.chord")
+    def test_exception_for_fetch_jetstream_data(self, mock_chord):
         NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
         )
-        mock_delay.side_effect = Exception
+        mock_chord.side_effect = Exception
         with self.assertRaises(Exception):
             tasks.fetch_jetstream_data()
 
+    @patch("experimenter.jetstream.tasks.chord")
+    def test_data_fetch_end_date_from_changelog(self, mock_chord):
+        lifecycle = NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE
+        experiment = NimbusExperimentFactory.create_with_lifecycle(lifecycle)
+        NimbusAnalysisResult.objects.store(experiment, {})
+        experiment.changes.filter(
+            old_status=NimbusExperiment.Status.LIVE,
+            new_status=NimbusExperiment.Status.COMPLETE,
+        ).update(changed_on=timezone.now() - datetime.timedelta(days=1))
+
+        tasks.fetch_jetstream_data()
+        self.assertEqual(self.get_fetched_experiment_ids(mock_chord), [experiment.id])
+
+    @override_settings(JETSTREAM_FETCH_CONCURRENCY=2)
+    @patch("experimenter.jetstream.tasks.chord")
+    def test_data_fetch_limits_concurrency(self, mock_chord):
+        experiments = [
+            NimbusExperimentFactory.create_with_lifecycle(
+                NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE
+            )
+            for _ in range(5)
+        ]
+
+        tasks.fetch_jetstream_data()
+
+        header = mock_chord.call_args.args[0]
+        self.assertEqual(len(header), 2)
+        self.assertEqual(
+            [signature.task for signature in header],
+            [tasks.fetch_experiment_data_batch.name] * 2,
+        )
+        self.assertEqual(
+            self.get_fetched_experiment_ids(mock_chord),
+            sorted(experiment.id for experiment in experiments),
+        )
+        body = mock_chord.return_value.call_args.args[0]
+        self.assertEqual(body.task, tasks.summarize_jetstream_data.name)
+
+    @patch("experimenter.jetstream.tasks.fetch_experiment_data")
+    def test_fetch_experiment_data_batch(self, mock_fetch_experiment_data):
+        mock_fetch_experiment_data.side_effect = [100, Exception, None, 50]
+
+        result = tasks.fetch_experiment_data_batch([1, 2, 3, 4])
+
+        self.assertEqual(
+            [c.args for c in mock_fetch_experiment_data.call_args_list],
+            [(1,), (2,), (3,), (4,)],
+        )
+        self.assertEqual(
+            result,
+            {"refreshed": 2, "skipped": 1, "bytes_downloaded": 150, "failed": [2]},
+        )
+
+    @patch("experimenter.jetstream.tasks.time.time")
+    def test_summarize_jetstream_data(self, mock_time):
+        mock_time.return_value = 1060.0
+
+        with MetricsMock() as mm:
+            summary = tasks.summarize_jetstream_data(
+                [
+                    {
+                        "refreshed": 2,
+                        "skipped": 1,
+                        "bytes_downloaded": 150,
+                        "failed": [2],
+                    },
+                    {
+                        "refreshed": 2,
+                        "skipped": 0,
+                        "bytes_downloaded": 20,
+                        "failed": [5, 7],
+                    },
+                ],
+                1000.0,
+            )
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.GAUGE,
+                    "jetstream.tasks.fetch_jetstream_data.skipped_experiments",
+                    value=1,
+                )
+            )
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "jetstream.tasks.fetch_jetstream_data.completed"
+                )
+            )
+
+        self.assertEqual(
+            summary,
+            {
+                "duration": 60.0,
+                "refreshed": 4,
+                "skipped": 1,
+                "bytes_downloaded": 170,
+                "failed": [2, 5, 7],
+            },
+        )
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_fetch_experiment_data_returns_bytes_downloaded(self, mock_open):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE,
+        )
+
+        def open_file(filename):
+            if "metadata" in filename:
+                return io.StringIO("{}")
+            if "errors" in filename:
+                return io.StringIO("[]")
+            raise FileNotFoundError
+
+        mock_open.side_effect = open_file
+
+        self.assertEqual(tasks.fetch_experiment_data(experiment.id), 4)
+        self.assertIsNone(tasks.fetch_experiment_data(experiment.id))
+
     @patch("experimenter.jetstream.tasks.get_experiment_data")
     def test_exception_for_fetch_experiment_data(self, mock_get_experiment_data):
         experiment = NimbusExperimentFactory.create_with_lifecycle(
@@ -2310,31 +2463,299 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         with self.assertRaises(Exception):
             tasks.fetch_experiment_data(experiment.id)
 
-    @patch("experimenter.jetstream.client.validate_data")
-    @patch("experimenter.jetstream.client.load_data_from_gcs")
-    def test_builds_statistics_filename(
-        self, mock_load_data_from_gcs, mock_validate_data
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_fetch_experiment_data_does_not_create_model_classes(self, mock_open):
+        primary_outcomes = ["default-browser"]
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
+            primary_outcomes=primary_outcomes,
+        )
+        (
+            DAILY_DATA,
+            _,
+            _,
+            _,
+            SEGMENT_DATA,
+            DAILY_EXPOSURES_DATA,
+            SEGMENT_EXPOSURES_DATA,
+        ) = JetstreamTestData.get_test_data(primary_outcomes)
+        statistics = json.dumps(
+            DAILY_DATA + SEGMENT_DATA + DAILY_EXPOSURES_DATA + SEGMENT_EXPOSURES_DATA
+        )
+
+        def open_file(filename):
+            if "metadata" in filename:
+                return io.StringIO("{}")
+            return io.StringIO("[]" if "errors" in filename else statistics)
+
+        def model_classes():
+            classes = set()
+            subclasses = [BaseModel]
+            while subclasses:
+                for subclass in subclasses.pop().__subclasses__():
+                    if subclass not in classes:
+                        classes.add(subclass)
+                        subclasses.append(subclass)
+            return classes
+
+        mock_open.side_effect = open_file
+
+        # Results are transformed into plain dicts, so repeated fetches in a
+        # long-lived worker must not define any new pydantic models
+        classes = model_classes()
+        for _ in range(3):
+            tasks.fetch_experiment_data(experiment.id, force=True)
+        self.assertEqual(model_classes(), classes)
+
+        self.assertIn("weekly", NimbusAnalysisResult.objects.get_results_data(experiment))
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_fetch_experiment_data_reads_each_file_once(self, mock_open):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE,
+        )
+        mock_open.side_effect = FileNotFoundError
+
+        tasks.fetch_experiment_data(experiment.id)
+
+        recipe_slug = experiment.slug.replace("-", "_")
+        self.assertEqual(
+            sorted(c.args[0] for c in mock_open.call_args_list),
+            [
+                f"errors/errors_{recipe_slug}.json",
+                f"metadata/metadata_{recipe_slug}.json",
+                f"statistics/statistics_{recipe_slug}_overall.json",
+                f"statistics/statistics_{recipe_slug}_weekly.json",
+            ],
+        )
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_fetch_experiment_data_skips_unchanged_results(self, mock_open):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE,
+        )
+        mock_open.side_effect = FileNotFoundError
+
+        tasks.fetch_experiment_data(experiment.id)
+        experiment.refresh_from_db()
+        results_data = NimbusAnalysisResult.objects.get_results_data(experiment)
+        self.assertIsNotNone(results_data)
+        self.assertEqual(
+            set(experiment.results_data_fingerprint["files"].values()),
+            {"2024-01-01T00:00:00"},
+        )
+        self.assertEqual(mock_open.call_count, 4)
+
+        mock_open.reset_mock()
+        tasks.fetch_experiment_data(experiment.id)
+        experiment.refresh_from_db()
+
+        mock_open.assert_not_called()
+        self.assertEqual(
+            NimbusAnalysisResult.objects.get_results_data(experiment), results_data
+        )
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_fetch_experiment_data_keeps_concurrent_edits(self, mock_open):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE,
+        )
+
+        def edit_experiment(path):
+            NimbusExperiment.objects.filter(id=experiment.id).update(
+                public_description="Edited while fetching"
+            )
+            raise FileNotFoundError
+
+        mock_open.side_effect = edit_experiment
+
+        tasks.fetch_experiment_data(experiment.id)
+        experiment.refresh_from_db()
+
+        self.assertEqual(experiment.public_description, "Edited while fetching")
+        self.assertIsNotNone(experiment.results_data_fingerprint)
+
+    @parameterized.expand(
+        [
+            (False, True),
+            (True, False),
+        ]
+    )
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_fetch_experiment_data_refreshes_results(
+        self, force, file_changed, mock_open
     ):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE,
+        )
+        mock_open.side_effect = FileNotFoundError
+
+        tasks.fetch_experiment_data(experiment.id)
+
+        if file_changed:
+            self.mock_get_modified_time.return_value = datetime.datetime(2024, 1, 2)
+
+        mock_open.reset_mock()
+        tasks.fetch_experiment_data(experiment.id, force=force)
+        experiment.refresh_from_db()
+
+        self.assertEqual(mock_open.call_count, 4)
+        self.assertEqual(
+            set(experiment.results_data_fingerprint["files"].values()),
+            {"2024-01-02T00:00:00" if file_changed else "2024-01-01T00:00:00"},
+        )
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_fetch_experiment_data_refreshes_when_outcomes_change(self, mock_open):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE,
+            primary_outcomes=[],
+        )
+        mock_open.side_effect = FileNotFoundError
+
+        tasks.fetch_experiment_data(experiment.id)
+
+        experiment.primary_outcomes = ["default-browser"]
+        experiment.save()
+
+        mock_open.reset_mock()
+        tasks.fetch_experiment_data(experiment.id)
+        experiment.refresh_from_db()
+
+        self.assertEqual(mock_open.call_count, 4)
+        self.assertEqual(
+            experiment.results_data_fingerprint["primary_outcomes"],
+            ["default-browser"],
+        )
+
+    def test_get_modified_time_returns_none_for_missing_file(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE,
+        )
+        self.mock_get_modified_time.side_effect = FileNotFoundError
+
+        fingerprint = get_results_fingerprint(experiment)
+
+        self.assertEqual(set(fingerprint["files"].values()), {None})
+
+    @patch("experimenter.jetstream.client.load_data_stream_from_gcs")
+    def test_builds_statistics_filename(self, mock_load_data_stream_from_gcs):
         lifecycle = NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE
         offset = NimbusExperiment.DAYS_ANALYSIS_BUFFER + 1
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             lifecycle, end_date=datetime.date.today() - datetime.timedelta(days=offset)
         )
 
-        mock_validate_data.return_value = True
+        mock_load_data_stream_from_gcs.return_value = iter([])
 
         recipe_slug = experiment.slug.replace("-", "_")
         window = AnalysisWindow.OVERALL
         get_data(recipe_slug, AnalysisWindow.OVERALL)
         filename = f"statistics/statistics_{recipe_slug}_{window}.json"
-        mock_load_data_from_gcs.assert_called_with(filename)
+        mock_load_data_stream_from_gcs.assert_called_with(filename, None)
 
         assert "AnalysisWindow" not in filename
         assert "overall" in filename
 
+    @parameterized.expand(
+        [
+            (1,),
+            (7,),
+            (1024 * 1024,),
+        ]
+    )
+    def test_iter_json_array_reads_in_chunks(self, chunk_size):
+        items = [
+            {"metric": "retained", "point": -0.25, "lower": 1e-05, "upper": None},
+            123456,
+            'a string with ], and "quotes"',
+            [],
+            True,
+        ]
+        text = json.dumps(items, indent=2)
+
+        self.assertEqual(list(iter_json_array(io.StringIO(text), chunk_size)), items)
+        self.assertEqual(
+            list(iter_json_array(io.BytesIO(text.encode()), chunk_size)), items
+        )
+
+    @parameterized.expand(
+        [
+            ("",),
+            ("{}",),
+            ("[1, 2",),
+            ('[{"metric": ',),
+        ]
+    )
+    def test_iter_json_array_invalid_json(self, text):
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array(io.StringIO(text), 2))
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_get_data_groups_points_by_analysis_basis_and_segment(self, mock_open):
+        (
+            DAILY_DATA,
+            _,
+            _,
+            _,
+            SEGMENT_DATA,
+            DAILY_EXPOSURES_DATA,
+            _,
+        ) = JetstreamTestData.get_test_data(["default-browser"])
+        points = DAILY_DATA + SEGMENT_DATA + DAILY_EXPOSURES_DATA
+        mock_open.return_value = io.StringIO(json.dumps(points))
+
+        data = get_data("slug", AnalysisWindow.DAILY)
+
+        def parse(points):
+            return [JetstreamDataPoint.parse_obj(point) for point in points]
+
+        self.assertEqual(
+            {analysis_basis: dict(segments) for analysis_basis, segments in data.items()},
+            {
+                AnalysisBasis.ENROLLMENTS: {
+                    "all": parse(DAILY_DATA),
+                    "some_segment": parse(SEGMENT_DATA),
+                },
+                AnalysisBasis.EXPOSURES: {
+                    "all": parse(DAILY_EXPOSURES_DATA),
+                },
+            },
+        )
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_get_data_ignores_points_without_analysis_basis(self, mock_open):
+        DAILY_DATA = JetstreamTestData.get_test_data(["default-browser"])[0]
+        null_basis_point = {
+            **DAILY_DATA[0],
+            "metric": "null_basis_metric",
+            "analysis_basis": None,
+        }
+        mock_open.return_value = io.StringIO(json.dumps([*DAILY_DATA, null_basis_point]))
+
+        data = get_data("slug", AnalysisWindow.DAILY)
+
+        self.assertEqual(
+            {analysis_basis: dict(segments) for analysis_basis, segments in data.items()},
+            {
+                AnalysisBasis.ENROLLMENTS: {
+                    "all": [JetstreamDataPoint.parse_obj(point) for point in DAILY_DATA],
+                },
+            },
+        )
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_get_data_rejects_duplicate_points(self, mock_open):
+        DAILY_DATA = JetstreamTestData.get_test_data(["default-browser"])[0]
+        mock_open.return_value = io.StringIO(json.dumps(DAILY_DATA + DAILY_DATA[:1]))
+
+        with self.assertRaisesMessage(
+            ValueError, "List of Statistic objects has duplicate(s)."
+        ):
+            get_data("slug", AnalysisWindow.DAILY)
+
     @patch("experimenter.jetstream.client.analysis_storage.open")
-    @patch("experimenter.jetstream.client.analysis_storage.exists")
-    def test_sizing_data_parsed_and_stored(self, mock_exists, mock_open):
+    def test_sizing_data_parsed_and_stored(self, mock_open):
         sizing_test_data = SampleSizesFactory.build().json()
 
         class File:
@@ -2345,10 +2766,9 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 return "" if "sample_sizes" not in self.name else sizing_test_data
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
         mock_open.side_effect = open_file
-        mock_exists.return_value = True
 
         sizing_results = cache.get(SIZING_DATA_KEY)
         self.assertIsNone(sizing_results)
@@ -2356,14 +2776,24 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         tasks.fetch_population_sizing_data()
         sizing_results = cache.get(SIZING_DATA_KEY)
 
-        self.assertEqual(
-            json.dumps(json.loads(sizing_test_data)),
-            sizing_results.json(exclude_unset=True),
-        )
+        self.assertEqual(json.dumps(json.loads(sizing_test_data)), sizing_results)
+
+        sizing_index = cache.get(SIZING_DATA_INDEX_KEY)
+        indexed_targets = [
+            json.loads(target)
+            for app_targets in sizing_index.values()
+            for targets in app_targets.values()
+            for target in targets
+        ]
+        expected_targets = [
+            {"key": sizing_key, **target}
+            for sizing_key, by_user_type in json.loads(sizing_test_data).items()
+            for target in by_user_type.values()
+        ]
+        self.assertCountEqual(indexed_targets, expected_targets)
 
     @patch("experimenter.jetstream.client.analysis_storage.open")
-    @patch("experimenter.jetstream.client.analysis_storage.exists")
-    def test_empty_fetch_population_sizing_data(self, mock_exists, mock_open):
+    def test_empty_fetch_population_sizing_data(self, mock_open):
         class File:
             def __init__(self, filename):
                 self.name = filename
@@ -2372,21 +2802,19 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 return "" if "sample_sizes" not in self.name else "{}"
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
         mock_open.side_effect = open_file
-        mock_exists.return_value = True
 
         sizing_results = cache.get(SIZING_DATA_KEY)
         self.assertIsNone(sizing_results)
 
         tasks.fetch_population_sizing_data()
-        sizing_results = cache.get(SIZING_DATA_KEY)
-        self.assertEqual(sizing_results.json(), "{}")
+        self.assertEqual(cache.get(SIZING_DATA_KEY), "{}")
+        self.assertEqual(cache.get(SIZING_DATA_INDEX_KEY), {})
 
     @patch("experimenter.jetstream.client.analysis_storage.open")
-    @patch("experimenter.jetstream.client.analysis_storage.exists")
-    def test_fetch_population_sizing_data_invalid(self, mock_exists, mock_open):
+    def test_fetch_population_sizing_data_invalid(self, mock_open):
         class File:
             def __init__(self, filename):
                 self.name = filename
@@ -2399,9 +2827,64 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 """
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
         mock_open.side_effect = open_file
-        mock_exists.return_value = True
         with self.assertRaises(Exception):
             tasks.fetch_population_sizing_data()
+
+
+class TestGetPrimaryMetrics(TemporaryPathSettingsMixin, TestCase):
+    OUTCOMES = {
+        ("firefox_desktop", "search"): ["searches", "ad_clicks"],
+        ("firefox_desktop", "shared"): ["desktop_shared_metric"],
+        ("fenix", "shared"): ["fenix_shared_metric"],
+    }
+
+    def setUp(self):
+        super().setUp()
+        outcomes_dir = self.override_temporary_path("METRIC_HUB_OUTCOMES_PATH")
+
+        for (app_name, slug), metrics in self.OUTCOMES.items():
+            outcome_path = outcomes_dir / app_name / f"{slug}.toml"
+            outcome_path.parent.mkdir(exist_ok=True)
+            outcome_path.write_text(
+                f"friendly_name = '{slug}'\ndescription = '{slug}'\n\n"
+                + "".join(f"[metrics.{metric}]\n" for metric in metrics)
+            )
+
+        Outcomes.clear_cache()
+        self.addCleanup(Outcomes.clear_cache)
+
+    def test_metrics_follow_primary_outcome_order(self):
+        self.assertEqual(
+            get_primary_metrics(
+                NimbusExperiment.Application.DESKTOP, ["shared", "search"], None
+            ),
+            ["desktop_shared_metric", "searches", "ad_clicks"],
+        )
+
+    def test_metrics_only_come_from_the_experiment_application(self):
+        self.assertEqual(
+            get_primary_metrics(NimbusExperiment.Application.FENIX, ["shared"], None),
+            ["fenix_shared_metric"],
+        )
+        self.assertEqual(
+            get_primary_metrics(NimbusExperiment.Application.IOS, ["shared"], None),
+            [],
+        )
+
+    def test_metrics_are_filtered_by_jetstream_metadata(self):
+        outcomes_metadata = {
+            "search": {"metrics": ["ad_clicks"], "default_metrics": []},
+            "other": {"metrics": [], "default_metrics": ["desktop_shared_metric"]},
+        }
+
+        self.assertEqual(
+            get_primary_metrics(
+                NimbusExperiment.Application.DESKTOP,
+                ["shared", "search"],
+                outcomes_metadata,
+            ),
+            ["desktop_shared_metric", "ad_clicks"],
+        )
@@ -11,7 +11,7 @@ from experimenter.base.tests.factories import (
     LanguageFactory,
     LocaleFactory,
 )
-from experimenter.experiments.models import NimbusExperiment
+from experimenter.experiments.models import NimbusAnalysisResult, NimbusExperiment
 from experimenter.experiments.tests.factories import (
     NimbusExperimentFactory,
     NimbusFeatureConfigFactory,
@@ -889,6 +889,31 @@ class NimbusExperimentsListTableViewTest(AuthTestCase):
         )
         self.assertEqual(response.headers["HX-Push"], "?status=test")
 
+    def test_shows_results_summary(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            slug="experiment-with-results",
+        )
+        NimbusAnalysisResult.objects.store(
+            experiment,
+            {
+                "overall": {"enrollments": {"all": {}}},
+                "errors": {"experiment": [{"message": "error"}]},
+            },
+        )
+        NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            slug="experiment-without-results",
+        )
+
+        response = self.client.get(reverse("nimbus-new-table"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(
+            response, f'href="{experiment.get_absolute_url()}results"', count=1
+        )
+        self.assertContains(response, 'title="Analysis errors">1</span>', count=1)
+
 
 class NimbusExperimentDetailViewTest(AuthTestCase):
     def setUp(self):
@@ -42,6 +42,7 @@ class NimbusExperimentsListView(NimbusExperimentViewMixin, FilterView):
     queryset = (
         NimbusExperiment.objects.all()
         .order_by("-_updated_date_time")
+        .select_related("analysis_summary")
         .prefetch_related("feature_configs")
     )
     filterset_class = NimbusExperimentFilter
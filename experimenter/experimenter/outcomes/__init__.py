@@ -1,12 +1,21 @@
+import hashlib
 import typing
 from dataclasses import dataclass
+from pathlib import Path
 
 import toml
 from django.conf import settings
 from django.core.checks import Error, register
 
+from experimenter.base import pickle_cache
+from experimenter.base.checks import Tags
 from experimenter.experiments.constants import NimbusConstants
 
+# Part of the outcomes cache hash. Bump this whenever a change to Metric,
+# Outcome or Outcomes._parse_outcomes changes what is cached for unchanged
+# TOML files, so that stale pickles are ignored.
+OUTCOMES_LOADER_VERSION = 1
+
 
 @dataclass
 class Metric:
@@ -27,72 +36,133 @@ class Outcome:
 
 class Outcomes:
     _outcomes = None
+    _by_application: dict[str, list[Outcome]] = {}
+    _by_slug: dict[tuple[str, str], Outcome] = {}
 
     @classmethod
-    def _load_outcomes(cls):
+    def _outcome_paths(cls) -> list[Path]:
+        return sorted(
+            outcome_path
+            for app_path in settings.METRIC_HUB_OUTCOMES_PATH.iterdir()
+            for outcome_path in app_path.iterdir()
+            if outcome_path.suffix != ".example"
+        )
+
+    @classmethod
+    def _outcomes_hash(cls, outcome_paths: list[Path]) -> str:
+        digest = hashlib.sha256(f"loader {OUTCOMES_LOADER_VERSION}".encode())
+        for outcome_path in outcome_paths:
+            digest.update(
+                f"\0{outcome_path.relative_to(settings.METRIC_HUB_OUTCOMES_PATH)}\0".encode()
+            )
+            digest.update(outcome_path.read_bytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def _parse_outcomes(cls, outcome_paths: list[Path]) -> list[Outcome]:
         outcomes: list[Outcome] = []
 
         app_name_application_config = {
             a.app_name: a for a in NimbusConstants.APPLICATION_CONFIGS.values()
         }
-        for app_name in settings.METRIC_HUB_OUTCOMES_PATH.iterdir():
-            app_path = settings.METRIC_HUB_OUTCOMES_PATH / app_name
-
-            for outcome_name in app_path.iterdir():
-                if outcome_name.suffix != ".example":
-                    outcome_path = app_path / outcome_name
-
-                    with outcome_path.open() as outcome_file:
-                        outcome_toml = outcome_file.read()
-                        outcome_data = toml.loads(outcome_toml)
-
-                        metrics = []
-                        if "metrics" in outcome_data:
-                            metrics = [
-                                Metric(
-                                    slug=metric,
-                                    friendly_name=outcome_data["metrics"][metric].get(
-                                        "friendly_name"
-                                    ),
-                                    description=outcome_data["metrics"][metric].get(
-                                        "description"
-                                    ),
-                                )
-                                for metric in outcome_data["metrics"]
-                            ]
-
-                        outcomes.append(
-                            Outcome(
-                                application=app_name_application_config[
-                                    app_name.stem
-                                ].slug,
-                                description=outcome_data["description"],
-                                friendly_name=outcome_data["friendly_name"],
-                                slug=outcome_name.stem,
-                                is_default=False,
-                                metrics=metrics,
-                            )
+        for outcome_path in outcome_paths:
+            with outcome_path.open() as outcome_file:
+                outcome_toml = outcome_file.read()
+                outcome_data = toml.loads(outcome_toml)
+
+                metrics = []
+                if "metrics" in outcome_data:
+                    metrics = [
+                        Metric(
+                            slug=metric,
+                            friendly_name=outcome_data["metrics"][metric].get(
+                                "friendly_name"
+                            ),
+                            description=outcome_data["metrics"][metric].get(
+                                "description"
+                            ),
                         )
+                        for metric in outcome_data["metrics"]
+                    ]
+
+                outcomes.append(
+                    Outcome(
+                        application=app_name_application_config[
+                            outcome_path.parent.name
+                        ].slug,
+                        description=outcome_data["description"],
+                        friendly_name=outcome_data["friendly_name"],
+                        slug=outcome_path.stem,
+                        is_default=False,
+                        metrics=metrics,
+                    )
+                )
+
+        return outcomes
+
+    @classmethod
+    def _load_outcomes(cls):
+        outcome_paths = cls._outcome_paths()
+
+        outcomes = pickle_cache.load_hashed(
+            settings.METRIC_HUB_OUTCOMES_CACHE_PATH, cls._outcomes_hash(outcome_paths)
+        )
+        if outcomes is None:
+            outcomes = cls._parse_outcomes(outcome_paths)
+
+        return outcomes
+
+    @classmethod
+    def _index(cls, outcomes: list[Outcome]):
+        cls._by_application = {}
+        cls._by_slug = {}
+
+        for outcome in outcomes:
+            cls._by_application.setdefault(outcome.application, []).append(outcome)
+            cls._by_slug[(outcome.application, outcome.slug)] = outcome
+
+    @classmethod
+    def build_cache(cls) -> list[Outcome]:
+        """Parse every outcome TOML and write the outcomes to
+        METRIC_HUB_OUTCOMES_CACHE_PATH so later processes can skip the TOML."""
+        outcome_paths = cls._outcome_paths()
+        outcomes = cls._parse_outcomes(outcome_paths)
+
+        pickle_cache.dump_hashed(
+            settings.METRIC_HUB_OUTCOMES_CACHE_PATH,
+            cls._outcomes_hash(outcome_paths),
+            outcomes,
+        )
 
         return outcomes
 
     @classmethod
     def clear_cache(cls):
         cls._outcomes = None
+        cls._by_application = {}
+        cls._by_slug = {}
 
     @classmethod
     def all(cls):
         if cls._outcomes is None:
-            cls._outcomes = cls._load_outcomes()
+            outcomes = cls._load_outcomes()
+            cls._index(outcomes)
+            cls._outcomes = outcomes
 
         return cls._outcomes
 
     @classmethod
     def by_application(cls, application):
-        return [o for o in cls.all() if o.application == application]
+        cls.all()
+        return list(cls._by_application.get(application, []))
+
+    @classmethod
+    def by_slug(cls, application, slug) -> typing.Optional[Outcome]:
+        cls.all()
+        return cls._by_slug.get((application, slug))
 
 
-@register()
+@register(Tags.external_data, deploy=True)
 def check_outcome_tomls(app_configs, **kwargs):
     errors = []
 
@@ -0,0 +1,33 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from experimenter.outcomes import Outcomes
+from experimenter.segments import Segments
+
+logger = logging.getLogger()
+
+
+class Command(BaseCommand):
+    help = "Compile the metric-hub outcomes and segments into pre-parsed cache files"
+
+    def handle(self, *args, **options):
+        logger.info("Building metric-hub cache")
+
+        start = time.monotonic()
+        outcomes = Outcomes.build_cache()
+        logger.info(
+            f"Cached {len(outcomes)} outcomes to "
+            f"{settings.METRIC_HUB_OUTCOMES_CACHE_PATH} in "
+            f"{time.monotonic() - start:.2f}s"
+        )
+
+        start = time.monotonic()
+        segments = Segments.build_cache()
+        logger.info(
+            f"Cached {len(segments)} segments to "
+            f"{settings.METRIC_HUB_SEGMENTS_CACHE_PATH} in "
+            f"{time.monotonic() - start:.2f}s"
+        )
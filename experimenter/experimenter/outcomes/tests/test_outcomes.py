@@ -1,9 +1,16 @@
+from unittest.mock import patch
+
 from django.core.checks import Error
+from django.core.management import call_command
 from django.test import TestCase
 
+from experimenter.base import pickle_cache
+from experimenter.base.tests.mixins import TemporaryPathSettingsMixin
 from experimenter.experiments.models import NimbusExperiment
 from experimenter.outcomes import Metric, Outcome, Outcomes, check_outcome_tomls
 from experimenter.outcomes.tests import mock_invalid_outcomes, mock_valid_outcomes
+from experimenter.segments import Segments
+from experimenter.segments.tests import mock_valid_segments
 
 
 @mock_valid_outcomes
@@ -106,6 +113,108 @@ class TestOutcomes(TestCase):
             desktop_outcomes,
         )
 
+    def test_load_outcomes_by_unknown_application(self):
+        self.assertEqual(Outcomes.by_application("unknown"), [])
+
+    def test_load_outcome_by_slug(self):
+        outcome = Outcomes.by_slug(NimbusExperiment.Application.FENIX, "fenix_outcome")
+        self.assertEqual(outcome.friendly_name, "Fenix config")
+        self.assertIsNone(
+            Outcomes.by_slug(NimbusExperiment.Application.DESKTOP, "fenix_outcome")
+        )
+
+    def test_load_outcome_metrics_by_slug(self):
+        self.assertEqual(
+            Outcomes.by_slug(
+                NimbusExperiment.Application.DESKTOP, "desktop_outcome_1"
+            ).metrics,
+            [
+                Metric(
+                    slug="urlbar_amazon_search_count",
+                    friendly_name=None,
+                    description=None,
+                ),
+                Metric(
+                    slug="total_amazon_search_count",
+                    friendly_name=None,
+                    description=None,
+                ),
+            ],
+        )
+        self.assertEqual(
+            Outcomes.by_slug(
+                NimbusExperiment.Application.DESKTOP, "missing_metrics"
+            ).metrics,
+            [],
+        )
+
+
+@mock_valid_outcomes
+class TestOutcomesCache(TemporaryPathSettingsMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        Outcomes.clear_cache()
+        self.addCleanup(Outcomes.clear_cache)
+
+        self.cache_path = self.override_temporary_path(
+            "METRIC_HUB_OUTCOMES_CACHE_PATH", "outcomes.pickle"
+        )
+
+    def test_build_cache_writes_outcomes(self):
+        outcomes = Outcomes.build_cache()
+
+        self.assertTrue(self.cache_path.exists())
+        self.assertEqual(len(outcomes), 6)
+
+        Outcomes.clear_cache()
+        with patch.object(Outcomes, "_parse_outcomes") as mock_parse_outcomes:
+            self.assertEqual(Outcomes.all(), outcomes)
+
+        mock_parse_outcomes.assert_not_called()
+
+    def test_falls_back_to_tomls_when_loader_version_changes(self):
+        Outcomes.build_cache()
+        Outcomes.clear_cache()
+
+        with patch("experimenter.outcomes.OUTCOMES_LOADER_VERSION", 2), patch.object(
+            Outcomes, "_parse_outcomes", wraps=Outcomes._parse_outcomes
+        ) as mock_parse_outcomes:
+            self.assertEqual(len(Outcomes.all()), 6)
+
+        mock_parse_outcomes.assert_called_once()
+
+    def test_falls_back_to_tomls_when_hash_does_not_match(self):
+        pickle_cache.dump_hashed(self.cache_path, "stale", [])
+
+        self.assertEqual(len(Outcomes.all()), 6)
+
+    def test_falls_back_to_tomls_when_cache_is_invalid(self):
+        self.cache_path.write_bytes(b"not a pickle")
+
+        self.assertEqual(len(Outcomes.all()), 6)
+
+    def test_falls_back_to_tomls_without_cache(self):
+        self.assertEqual(len(Outcomes.all()), 6)
+
+    @mock_valid_segments
+    def test_build_metric_hub_cache_command(self):
+        segments_cache_path = self.override_temporary_path(
+            "METRIC_HUB_SEGMENTS_CACHE_PATH", "segments.pickle"
+        )
+        Segments.clear_cache()
+        self.addCleanup(Segments.clear_cache)
+
+        call_command("build_metric_hub_cache")
+
+        self.assertTrue(self.cache_path.exists())
+        self.assertTrue(segments_cache_path.exists())
+
+        with patch.object(Segments, "_parse_segments") as mock_parse_segments:
+            self.assertEqual(len(Segments.all()), 4)
+
+        mock_parse_segments.assert_not_called()
+        self.assertEqual(len(Outcomes.all()), 6)
+
 
 class TestCheckOutcomeTOMLs(TestCase):
     def setUp(self):
@@ -1,11 +1,21 @@
+import hashlib
+import typing
 from dataclasses import dataclass
+from pathlib import Path
 
 import toml
 from django.conf import settings
 from django.core.checks import Error, register
 
+from experimenter.base import pickle_cache
+from experimenter.base.checks import Tags
 from experimenter.experiments.constants import NimbusConstants
 
+# Part of the segments cache hash. Bump this whenever a change to Segment or
+# Segments._parse_segments changes what is cached for unchanged TOML files, so
+# that stale pickles are ignored.
+SEGMENTS_LOADER_VERSION = 1
+
 
 @dataclass
 class Segment:
@@ -18,67 +28,127 @@ class Segment:
 
 class Segments:
     _segments = None
+    _by_application: dict[str, list[Segment]] = {}
+    _by_slug: dict[tuple[str, str], Segment] = {}
 
     @classmethod
-    def _load_segments(cls):
+    def _segment_paths(cls) -> list[Path]:
+        paths = [
+            settings.METRIC_HUB_SEGMENTS_PATH_JETSTREAM,
+            settings.METRIC_HUB_SEGMENTS_PATH_DEFAULT,
+        ]
+
+        return [
+            segment_file
+            for path in paths
+            for segment_file in sorted(path.iterdir())
+            if segment_file.is_file() and segment_file.suffix == ".toml"
+        ]
+
+    @classmethod
+    def _segments_hash(cls, segment_paths: list[Path]) -> str:
+        digest = hashlib.sha256(f"loader {SEGMENTS_LOADER_VERSION}".encode())
+        for segment_file in segment_paths:
+            digest.update(f"\0{segment_file.name}\0".encode())
+            digest.update(segment_file.read_bytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def _parse_segments(cls, segment_paths: list[Path]) -> list[Segment]:
         segments: list[Segment] = []
 
         app_name_application_config = {
             a.app_name: a for a in NimbusConstants.APPLICATION_CONFIGS.values()
         }
-        paths = [
-            settings.METRIC_HUB_SEGMENTS_PATH_JETSTREAM,
-            settings.METRIC_HUB_SEGMENTS_PATH_DEFAULT,
-        ]
 
-        for path in paths:
-            for segment_file in path.iterdir():
-                if segment_file.is_file() and segment_file.suffix == ".toml":
+        for segment_file in segment_paths:
+            app_name = segment_file.stem
+
+            with segment_file.open() as f:
+                segment_toml = f.read()
+                segment_data = toml.loads(segment_toml)
+
+                if "segments" in segment_data:
+                    for slug, segment_info in segment_data["segments"].items():
+                        if not slug or slug == "data_sources":
+                            continue
+
+                        segments.append(
+                            Segment(
+                                slug=slug,
+                                friendly_name=segment_info["friendly_name"],
+                                application=app_name_application_config[app_name].slug,
+                                description=segment_info.get("description", ""),
+                                select_expression=segment_info.get(
+                                    "select_expression", ""
+                                ),
+                            )
+                        )
 
-                    app_name = segment_file.stem
+        return segments
 
-                    with segment_file.open() as f:
-                        segment_toml = f.read()
-                        segment_data = toml.loads(segment_toml)
+    @classmethod
+    def _load_segments(cls):
+        segment_paths = cls._segment_paths()
 
-                        if "segments" in segment_data:
-                            for slug, segment_info in segment_data["segments"].items():
+        segments = pickle_cache.load_hashed(
+            settings.METRIC_HUB_SEGMENTS_CACHE_PATH, cls._segments_hash(segment_paths)
+        )
+        if segments is None:
+            segments = cls._parse_segments(segment_paths)
 
-                                if not slug or slug == "data_sources":
-                                    continue
+        return segments
 
-                                segments.append(
-                                    Segment(
-                                        slug=slug,
-                                        friendly_name=segment_info["friendly_name"],
-                                        application=app_name_application_config[
-                                            app_name
-                                        ].slug,
-                                        description=segment_info.get("description", ""),
-                                        select_expression=segment_info.get(
-                                            "select_expression", ""
-                                        ),
-                                    )
-                                )
+    @classmethod
+    def _index(cls, segments: list[Segment]):
+        cls._by_application = {}
+        cls._by_slug = {}
+
+        for segment in segments:
+            cls._by_application.setdefault(segment.application, []).append(segment)
+            cls._by_slug[(segment.application, segment.slug)] = segment
+
+    @classmethod
+    def build_cache(cls) -> list[Segment]:
+        """Parse every segment TOML and write the segments to
+        METRIC_HUB_SEGMENTS_CACHE_PATH so later processes can skip the TOML."""
+        segment_paths = cls._segment_paths()
+        segments = cls._parse_segments(segment_paths)
+
+        pickle_cache.dump_hashed(
+            settings.METRIC_HUB_SEGMENTS_CACHE_PATH,
+            cls._segments_hash(segment_paths),
+            segments,
+        )
 
         return segments
 
     @classmethod
     def clear_cache(cls):
         cls._segments = None
+        cls._by_application = {}
+        cls._by_slug = {}
 
     @classmethod
     def all(cls):
         if cls._segments is None:
-            cls._segments = cls._load_segments()
+            segments = cls._load_segments()
+            cls._index(segments)
+            cls._segments = segments
         return cls._segments
 
     @classmethod
     def by_application(cls, application):
-        return [o for o in cls.all() if o.application == application]
+        cls.all()
+        return list(cls._by_application.get(application, []))
+
+    @classmethod
+    def by_slug(cls, application, slug) -> typing.Optional[Segment]:
+        cls.all()
+        return cls._by_slug.get((application, slug))
 
 
-@register()
+@register(Tags.external_data, deploy=True)
 def check_segment_tomls(app_configs, **kwargs):
     errors = []
 
@@ -1,6 +1,10 @@
+from unittest.mock import patch
+
 from django.core.checks import Error
 from django.test import TestCase
 
+from experimenter.base import pickle_cache
+from experimenter.base.tests.mixins import TemporaryPathSettingsMixin
 from experimenter.experiments.models import NimbusExperiment
 from experimenter.segments import Segment, Segments, check_segment_tomls
 from experimenter.segments.tests import mock_invalid_segments, mock_valid_segments
@@ -108,6 +112,72 @@ class TestSegments(TestCase):
             desktop_segments,
         )
 
+    def test_load_segments_by_unknown_application(self):
+        self.assertEqual(Segments.by_application("unknown"), [])
+
+    def test_load_segment_by_slug(self):
+        self.assertEqual(
+            Segments.by_slug(NimbusExperiment.Application.FENIX, "fenix_segment"),
+            Segment(
+                slug="fenix_segment",
+                friendly_name="Fenix Segment",
+                application=NimbusExperiment.Application.FENIX,
+                description="Fenix segment for testing",
+                select_expression="{{agg_sum('ad_click')}}",
+            ),
+        )
+        self.assertIsNone(
+            Segments.by_slug(NimbusExperiment.Application.DESKTOP, "fenix_segment")
+        )
+
+
+@mock_valid_segments
+class TestSegmentsCache(TemporaryPathSettingsMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        Segments.clear_cache()
+        self.addCleanup(Segments.clear_cache)
+
+        self.cache_path = self.override_temporary_path(
+            "METRIC_HUB_SEGMENTS_CACHE_PATH", "segments.pickle"
+        )
+
+    def test_build_cache_writes_segments(self):
+        segments = Segments.build_cache()
+
+        self.assertTrue(self.cache_path.exists())
+        self.assertEqual(len(segments), 4)
+
+        Segments.clear_cache()
+        with patch.object(Segments, "_parse_segments") as mock_parse_segments:
+            self.assertEqual(Segments.all(), segments)
+
+        mock_parse_segments.assert_not_called()
+
+    def test_falls_back_to_tomls_when_loader_version_changes(self):
+        Segments.build_cache()
+        Segments.clear_cache()
+
+        with patch("experimenter.segments.SEGMENTS_LOADER_VERSION", 2), patch.object(
+            Segments, "_parse_segments", wraps=Segments._parse_segments
+        ) as mock_parse_segments:
+            self.assertEqual(len(Segments.all()), 4)
+
+        mock_parse_segments.assert_called_once()
+
+    def test_falls_back_to_tomls_when_hash_does_not_match(self):
+        pickle_cache.dump_hashed(self.cache_path, "stale", [])
+
+        self.assertEqual(len(Segments.all()), 4)
+
+    def test_falls_back_to_tomls_when_cache_is_invalid(self):
+        self.cache_path.write_bytes(b"not a pickle")
+
+        self.assertEqual(len(Segments.all()), 4)
+
+    def test_falls_back_to_tomls_without_cache(self):
+        self.assertEqual(len(Segments.all()), 4)
+
 
 class TestCheckSegmentTOMLs(TestCase):
     def setUp(self):
@@ -372,10 +372,16 @@ CACHES = {
     },
 }
 API_CACHE_DURATION = 60 * 60
-SIZING_DATA_KEY = "population_sizing"
+SIZING_DATA_KEY = "population_sizing_json"
+SIZING_DATA_INDEX_KEY = "population_sizing_index"
+SIZING_DATA_VERSION_KEY = "population_sizing_version"
 
 # Celery
 CELERY_BROKER_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+# Only tasks that opt in with ignore_result=False (e.g. chord headers) store
+# their results in the backend
+CELERY_RESULT_BACKEND = CELERY_BROKER_URL
+CELERY_TASK_IGNORE_RESULT = True
 CELERY_BEAT_SCHEDULE = {
     "experiment_status_ready_to_ship_task": {
         "task": "experimenter.legacy.normandy.tasks.update_recipe_ids_to_experiments",
@@ -494,6 +500,11 @@ KINTO_REVIEW_TIMEOUT = config("KINTO_REVIEW_TIMEOUT", cast=int)
 ANALYSIS_FILE_STORAGE = "storages.backends.gcloud.GoogleCloudStorage"
 ANALYSIS_GS_PROJECT_ID = "experiments-analysis"
 ANALYSIS_GS_BUCKET_NAME = "mozanalysis"
+# Analysis files larger than this are downloaded to a temporary file on disk
+# instead of being held in memory while they are parsed
+ANALYSIS_GS_MAX_MEMORY_SIZE = 10 * 1024 * 1024
+# Maximum number of experiments whose Jetstream data is fetched at once
+JETSTREAM_FETCH_CONCURRENCY = config("JETSTREAM_FETCH_CONCURRENCY", default=4, cast=int)
 
 # GCS bucket for user uploads, e.g. branch screenshots
 UPLOADS_GS_BUCKET_NAME = config("UPLOADS_GS_BUCKET_NAME", default=None)
@@ -519,6 +530,7 @@ STORAGES = {
         "BACKEND": ANALYSIS_FILE_STORAGE,
         "OPTIONS": {
             "bucket_name": ANALYSIS_GS_BUCKET_NAME,
+            "max_memory_size": ANALYSIS_GS_MAX_MEMORY_SIZE,
         },
     },
 }
@@ -541,10 +553,49 @@ METRIC_HUB_SEGMENTS_PATH_DEFAULT = (
     BASE_DIR / "segments" / "metric-hub-main" / "definitions"
 )
 
+# Pre-parsed outcomes and segments written by `manage.py build_metric_hub_cache`.
+# Each cache is ignored whenever it does not match the TOML files on disk.
+METRIC_HUB_OUTCOMES_CACHE_PATH = Path(
+    config(
+        "METRIC_HUB_OUTCOMES_CACHE_PATH",
+        default=str(BASE_DIR / "outcomes" / ".outcomes-cache.pickle"),
+    )
+)
+
+METRIC_HUB_SEGMENTS_CACHE_PATH = Path(
+    config(
+        "METRIC_HUB_SEGMENTS_CACHE_PATH",
+        default=str(BASE_DIR / "segments" / ".segments-cache.pickle"),
+    )
+)
+
 
 # Feature Manifest path
 FEATURE_MANIFESTS_PATH = BASE_DIR / "features" / "manifests"
 
+# Pre-parsed feature manifests written by `manage.py build_features_cache`.
+# The cache is ignored whenever it does not match the manifests on disk.
+FEATURE_MANIFESTS_CACHE_PATH = Path(
+    config(
+        "FEATURE_MANIFESTS_CACHE_PATH",
+        default=str(FEATURE_MANIFESTS_PATH / ".features-cache.pickle"),
+    )
+)
+
+# Number of threads used to validate mobile feature values against each
+# versioned FML manifest. Validation is serial when this is 1.
+FML_VALIDATION_MAX_WORKERS = config("FML_VALIDATION_MAX_WORKERS", default=1, cast=int)
+
+# Maximum number of parsed FML clients kept in each process. The least recently
+# used client is evicted once there are more.
+FML_CLIENT_CACHE_SIZE = config("FML_CLIENT_CACHE_SIZE", default=128, cast=int)
+
+# Load the FML clients for the unversioned manifests and the most recent
+# versions of each mobile application when a web or Celery worker process boots.
+# Setting FML_PRELOAD_RECENT_VERSIONS to 0 loads every version.
+FML_PRELOAD_CLIENTS = config("FML_PRELOAD_CLIENTS", default=False, cast=bool)
+FML_PRELOAD_RECENT_VERSIONS = config("FML_PRELOAD_RECENT_VERSIONS", default=3, cast=int)
+
 SKIP_REVIEW_ACCESS_CONTROL_FOR_DEV_USER = config(
     "SKIP_REVIEW_ACCESS_CONTROL_FOR_DEV_USER", default=False, cast=bool
 )
@@ -2,13 +2,16 @@ from django.shortcuts import get_object_or_404
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
-from experimenter.experiments.models import NimbusExperiment
+from experimenter.experiments.models import NimbusAnalysisResult, NimbusExperiment
 
 
 @api_view()
 def analysis_results_view(request, slug):
-    experiment = get_object_or_404(NimbusExperiment.objects.filter(slug=slug))
-    if experiment.results_data is not None and "v3" in experiment.results_data:
-        return Response(experiment.results_data["v3"])
-
-    return Response(None)
+    experiment = get_object_or_404(NimbusExperiment.objects.filter(slug=slug).only("id"))
+    return Response(
+        NimbusAnalysisResult.objects.get_results_data(
+            experiment,
+            window=request.query_params.get("window"),
+            segment=request.query_params.get("segment"),
+        )
+    )
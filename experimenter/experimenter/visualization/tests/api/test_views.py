@@ -6,7 +6,7 @@ from django.test import TestCase, override_settings
 from django.urls import reverse
 from parameterized import parameterized
 
-from experimenter.experiments.models import NimbusExperiment
+from experimenter.experiments.models import NimbusAnalysisResult, NimbusExperiment
 from experimenter.experiments.tests.factories import NimbusExperimentFactory
 
 
@@ -38,9 +38,8 @@ class TestVisualizationView(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.content, b"")
 
-        # test with results_data object
-        experiment.results_data = {"v3": {}}
-        experiment.save()
+        # test with stored results
+        NimbusAnalysisResult.objects.store(experiment, {})
 
         response = self.client.get(
             reverse("visualization-analysis-data", kwargs={"slug": experiment.slug}),
@@ -61,3 +60,36 @@ class TestVisualizationView(TestCase):
 
         json_data = json.loads(response.content)
         self.assertEqual({"detail": "Not found."}, json_data)
+
+    def test_analysis_results_view_filters_window_and_segment(self):
+        user_email = "user@example.com"
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE
+        )
+        NimbusAnalysisResult.objects.store(
+            experiment,
+            {
+                "show_analysis": True,
+                "weekly": {"enrollments": {"all": {"control": {}}}},
+                "overall": {
+                    "enrollments": {
+                        "all": {"control": {}},
+                        "mobile": {"control": {}},
+                    },
+                },
+            },
+        )
+
+        response = self.client.get(
+            reverse("visualization-analysis-data", kwargs={"slug": experiment.slug}),
+            {"window": "overall", "segment": "mobile"},
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "show_analysis": True,
+                "overall": {"enrollments": {"mobile": {"control": {}}}},
+            },
+        )
@@ -5,3 +5,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "experimenter.settings")
 
 application = get_wsgi_application()
+
+# Runs once in the gunicorn master when the app is loaded with --preload, and in
+# each worker otherwise.
+from experimenter.features.manifests.nimbus_fml_loader import NimbusFmlLoader
+
+NimbusFmlLoader.preload_clients()
@@ -82,6 +82,11 @@ class TaggedDiscoveryStrategy(BaseModel):
     ignored_versions: Optional[list[Version]]
     minimum_version: Optional[Version]
 
+    # Whether or not the GitHub API lists this repository's tags newest first.
+    # If so, we can stop paging through tags once they fall below the minimum
+    # version.
+    tags_newest_first: bool = False
+
 
 class BranchedDiscoveryStrategy(BaseModel):
     type: Literal[DiscoveryStrategyType.BRANCHED]
@@ -103,6 +108,7 @@ class DiscoveryStrategy(BaseModel):
         ignored_tags: Optional[list[str]] = None,
         ignored_versions: Optional[list[Version]] = None,
         minimum_version: Optional[Version] = None,
+        tags_newest_first: bool = False,
     ):  # pragma: no cover
         return cls(
             __root__=TaggedDiscoveryStrategy(
@@ -113,6 +119,7 @@ class DiscoveryStrategy(BaseModel):
                 ignored_tags=ignored_tags,
                 ignored_versions=ignored_versions,
                 minimum_version=minimum_version,
+                tags_newest_first=tags_newest_first,
             )
         )
 
@@ -1,12 +1,15 @@
 import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 import click
 
+from manifesttool import github_api, http_cache
 from manifesttool.appconfig import AppConfigs
 from manifesttool.fetch import (
+    FetchResult,
     fetch_fml_app,
     fetch_legacy_app,
     fetch_releases,
@@ -15,6 +18,7 @@ from manifesttool.fetch import (
 from manifesttool.repository import RefCache
 
 MANIFEST_DIR = Path(__file__).parent.parent / "experimenter" / "features" / "manifests"
+HTTP_CACHE_DIRNAME = ".http-cache"
 
 
 @dataclass
@@ -40,6 +44,43 @@ def main(ctx: click.Context, *, manifest_dir: Path):
     )
 
 
+def _fetch_app(context: Context, app_name: str, executor: Executor) -> list[FetchResult]:
+    """Fetch the manifests for an app and all of its releases.
+
+    Releases are fetched concurrently on the given executor.
+    """
+    results = []
+    app_config = context.app_configs.__root__[app_name]
+
+    app_dir = context.manifest_dir.joinpath(app_config.slug)
+    app_dir.mkdir(exist_ok=True)
+
+    if app_config.fml_path is not None:
+        results.append(fetch_fml_app(context.manifest_dir, app_name, app_config))
+    elif app_config.experimenter_yaml_path is not None:
+        results.append(fetch_legacy_app(context.manifest_dir, app_name, app_config))
+    else:  # pragma: no cover
+        assert False, "unreachable"
+
+    if app_config.release_discovery:
+        ref_cache_path = app_dir / ".ref-cache.yaml"
+        ref_cache = RefCache.load_or_create(ref_cache_path)
+
+        results.extend(
+            fetch_releases(
+                context.manifest_dir,
+                app_name,
+                app_config,
+                ref_cache,
+                executor=executor,
+            )
+        )
+
+        ref_cache.write_to_file(ref_cache_path)
+
+    return results
+
+
 @main.command("fetch")
 @click.pass_context
 @click.option(
@@ -52,7 +93,27 @@ def main(ctx: click.Context, *, manifest_dir: Path):
     multiple=True,
     help="Only fetch updates for the specified app(s).",
 )
-def fetch(ctx: click.Context, *, summary_filename: Optional[Path], app_names: list[str]):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="The number of apps and releases to fetch concurrently.",
+)
+@click.option(
+    "--http-cache/--no-http-cache",
+    "use_http_cache",
+    default=True,
+    help="Cache HTTP responses in the manifest directory between runs.",
+)
+def fetch(
+    ctx: click.Context,
+    *,
+    summary_filename: Optional[Path],
+    app_names: list[str],
+    jobs: int,
+    use_http_cache: bool,
+):
     """Fetch the FML manifests and generate experimenter.yaml files."""
     context = ctx.find_object(Context)
 
@@ -66,34 +127,39 @@ def fetch(ctx: click.Context, *, summary_filename: Optional[Path], app_names: li
     else:
         app_names = context.app_configs.__root__.keys()
 
-    for app_name in app_names:
-        app_config = context.app_configs.__root__[app_name]
+    github_api.reset()
 
-        app_dir = context.manifest_dir.joinpath(app_config.slug)
-        app_dir.mkdir(exist_ok=True)
+    cache = None
+    if use_http_cache:
+        cache = http_cache.enable(context.manifest_dir / HTTP_CACHE_DIRNAME)
 
-        if app_config.fml_path is not None:
-            results.append(fetch_fml_app(context.manifest_dir, app_name, app_config))
-        elif app_config.experimenter_yaml_path is not None:
-            results.append(fetch_legacy_app(context.manifest_dir, app_name, app_config))
-        else:  # pragma: no cover
-            assert False, "unreachable"
+    # Apps and releases are fetched on separate pools so that an app waiting on
+    # its releases can never starve them of workers.
+    try:
+        with (
+            ThreadPoolExecutor(max_workers=jobs) as app_executor,
+            ThreadPoolExecutor(max_workers=jobs) as release_executor,
+        ):
+            for app_results in app_executor.map(
+                lambda app_name: _fetch_app(context, app_name, release_executor),
+                app_names,
+            ):
+                results.extend(app_results)
+    finally:
+        http_cache.disable()
 
-        if app_config.release_discovery:
-            ref_cache_path = app_dir / ".ref-cache.yaml"
-            ref_cache = RefCache.load_or_create(ref_cache_path)
+    if cache is not None:
+        print(f"fetch: http cache: {cache.hits} not modified, {cache.misses} fetched")
 
-            results.extend(
-                fetch_releases(context.manifest_dir, app_name, app_config, ref_cache)
-            )
-
-            ref_cache.write_to_file(ref_cache_path)
+    print(f"fetch: github api: {github_api.stats}")
 
     summary_file = sys.stdout
     if summary_filename:
         summary_file = summary_filename.open("w")
 
-    success_count, cache_count, fail_count = summarize_results(results, summary_file)
+    success_count, cache_count, unchanged_count, fail_count = summarize_results(
+        results, summary_file
+    )
 
     if summary_filename:
         summary_file.close()
@@ -1,7 +1,8 @@
 import sys
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import Optional, TextIO, Union
 
 import yaml
 from mozilla_nimbus_schemas import FeatureManifest
@@ -9,6 +10,7 @@ from mozilla_nimbus_schemas import FeatureManifest
 from manifesttool import github_api, hgmo_api, nimbus_cli
 from manifesttool.appconfig import AppConfig, DiscoveryStrategyType, RepositoryType
 from manifesttool.exception_utils import format_exception
+from manifesttool.fml_inputs import FML_INPUTS_FILENAME, FmlInputs, hash_fml_inputs
 from manifesttool.releases import discover_branched_releases, discover_tagged_releases
 from manifesttool.repository import Ref, RefCache
 from manifesttool.version import Version
@@ -22,6 +24,10 @@ class FetchResult:
     exc: Optional[Exception] = None
     cached: bool = False
 
+    # Whether or not generation was skipped because the FML inputs were
+    # unchanged, even though the ref was not cached.
+    content_cached: bool = False
+
     def __str__(self):  # pragma: no cover
         as_str = f"{self.app_name} at {self.ref} version {self.version}"
 
@@ -29,6 +35,8 @@ class FetchResult:
             as_str += f"\n{format_exception(self.exc)}"
         elif self.cached:
             as_str += " (cached)"
+        elif self.content_cached:
+            as_str += " (unchanged)"
 
         return as_str
 
@@ -77,6 +85,36 @@ def fetch_fml_app(
                     f"Could not find a feature manifest for {app_name} at {ref}"
                 )
 
+        # If the FML inputs are the same as the last time we generated
+        # manifests for this version, the output would be identical and we can
+        # skip running nimbus-cli altogether.
+        fml_inputs_path = nimbus_cli._get_experimenter_yaml_path(
+            manifest_dir, app_config, version
+        ).with_name(FML_INPUTS_FILENAME)
+
+        try:
+            inputs_hash = hash_fml_inputs(app_config.repo.name, fml_path, ref.target)
+        except Exception as e:
+            print(
+                f"WARNING: Could not hash FML inputs for {app_name}:\n"
+                f"{format_exception(e)}",
+                file=sys.stderr,
+            )
+            inputs_hash = None
+
+        previous_inputs = FmlInputs.load_or_none(fml_inputs_path)
+        if (
+            inputs_hash is not None
+            and previous_inputs is not None
+            and previous_inputs.hash == inputs_hash
+            and _fml_outputs_exist(
+                manifest_dir, app_config, previous_inputs.channels, version
+            )
+        ):
+            print(f"fetch: {app_name}: FML inputs have not changed")
+            result.content_cached = True
+            return result
+
         channels = nimbus_cli.get_channels(app_config, fml_path, ref.target)
         print(f"fetch: {app_name}: channels are {', '.join(channels)}")
 
@@ -107,6 +145,9 @@ def fetch_fml_app(
             channels[0],
             version,
         )
+
+        if inputs_hash is not None:
+            FmlInputs(hash=inputs_hash, channels=channels).write_to_file(fml_inputs_path)
     except Exception as e:
         print(format_exception(e), file=sys.stderr)
         result.exc = e
@@ -114,6 +155,24 @@ def fetch_fml_app(
     return result
 
 
+def _fml_outputs_exist(
+    manifest_dir: Path,
+    app_config: AppConfig,
+    channels: list[str],
+    version: Optional[Version],
+) -> bool:
+    """Return whether or not all manifests generated by fetch_fml_app exist."""
+    paths = [
+        nimbus_cli._get_fml_path(manifest_dir, app_config, channel, version)
+        for channel in channels
+    ]
+    paths.append(
+        nimbus_cli._get_experimenter_yaml_path(manifest_dir, app_config, version)
+    )
+
+    return all(path.exists() for path in paths)
+
+
 def fetch_legacy_app(
     manifest_dir: Path,
     app_name: str,
@@ -213,9 +272,14 @@ def fetch_releases(
     app_name: str,
     app_config: AppConfig,
     ref_cache: RefCache,
+    executor: Optional[Executor] = None,
 ) -> list[FetchResult]:
-    """Fetch all releases for the app."""
-    results = []
+    """Fetch all releases for the app.
+
+    If an ``executor`` is provided, each release will be fetched concurrently
+    on it. Otherwise releases are fetched one at a time.
+    """
+    results: list[Union[FetchResult, Future[FetchResult]]] = []
 
     if app_config.release_discovery is None:
         raise Exception(f"App {app_name} does not support releases.")
@@ -241,32 +305,46 @@ def fetch_releases(
             results.append(FetchResult(app_name, ref, version, cached=True))
             continue
 
-        result = fetch_app(manifest_dir, app_name, app_config, ref, version)
+        if executor is None:
+            results.append(fetch_app(manifest_dir, app_name, app_config, ref, version))
+        else:
+            results.append(
+                executor.submit(
+                    fetch_app, manifest_dir, app_name, app_config, ref, version
+                )
+            )
 
-        if result.exc is None:
-            ref_cache.add(ref)
+    results = [
+        result.result() if isinstance(result, Future) else result for result in results
+    ]
 
-        results.append(result)
+    for result in results:
+        if not result.cached and result.exc is None:
+            ref_cache.add(result.ref)
 
     return results
 
 
-def summarize_results(results: list[FetchResult], file: TextIO) -> (int, int, int):
+def summarize_results(results: list[FetchResult], file: TextIO) -> (int, int, int, int):
     """Print out a summary of the results to the given file.
 
     Returns:
-        A 3-tuple of the number of successes, the number of cache hits, and the
-        number of failures.
+        A 4-tuple of the number of successes, the number of cache hits, the
+        number of results skipped because their FML inputs were unchanged, and
+        the number of failures.
     """
     successes = []
     failures = []
     cached = []
+    content_cached = []
 
     for result in results:
         if result.exc:
             failures.append(result)
         elif result.cached:
             cached.append(result)
+        elif result.content_cached:
+            content_cached.append(result)
         else:
             successes.append(result)
 
@@ -292,4 +370,12 @@ def summarize_results(results: list[FetchResult], file: TextIO) -> (int, int, in
         for result in cached:
             print(result, file=file)
 
-    return (len(successes), len(cached), len(failures))
+    if content_cached:
+        if cached:
+            print(file=file)
+
+        print("UNCHANGED:\n", file=file)
+        for result in content_cached:
+            print(result, file=file)
+
+    return (len(successes), len(cached), len(content_cached), len(failures))
@@ -0,0 +1,104 @@
+import hashlib
+import posixpath
+from pathlib import Path
+from typing import Optional
+
+import yaml
+from pydantic import BaseModel, ValidationError
+
+from manifesttool import github_api, nimbus_cli
+
+FML_INPUTS_FILENAME = ".fml-inputs.yaml"
+
+# The branch that nimbus-cli resolves files in other repositories against.
+EXTERNAL_REPO_BRANCH = "main"
+
+
+class FmlInputs(BaseModel):
+    """A record of the inputs used to generate an app's manifests."""
+
+    # The hash of the FML inputs. See ``hash_fml_inputs``.
+    hash: str
+
+    # The channels that single-file manifests were generated for.
+    channels: list[str]
+
+    @classmethod
+    def load_or_none(cls, path: Path) -> Optional["FmlInputs"]:
+        """Load the inputs from a file.
+
+        Returns None if the file does not exist, or is corrupt or in an old
+        format, so that the manifests are regenerated.
+        """
+        try:
+            with path.open("r") as f:
+                return cls.parse_obj(yaml.safe_load(f))
+        except (FileNotFoundError, yaml.YAMLError, ValidationError):
+            return None
+
+    def write_to_file(self, path: Path):
+        with path.open("w") as f:
+            yaml.safe_dump(self.dict(), f)
+
+
+def hash_fml_inputs(repo: str, fml_path: str, rev: str) -> str:
+    """Hash an FML file and every file that it includes or imports.
+
+    The hash covers the contents and paths of each file, but not the revision
+    they were fetched at, so a ref that moves without changing any FML files
+    produces the same hash. The nimbus-cli version is also included because it
+    determines the generated output.
+
+    Args:
+        repo:
+            The name of the repository, including the owner.
+
+        fml_path:
+            The path to the root FML file in the repository.
+
+        rev:
+            The resolved revision at which to fetch the FML files.
+
+    Returns:
+        The hex digest of the inputs.
+    """
+    h = hashlib.sha256()
+    h.update(nimbus_cli.get_version().encode())
+
+    revs = {repo: rev}
+    visited = set()
+    to_visit = [(repo, fml_path)]
+
+    while to_visit:
+        file_repo, path = to_visit.pop(0)
+        if (file_repo, path) in visited:
+            continue
+
+        visited.add((file_repo, path))
+
+        contents = github_api.fetch_file(file_repo, path, revs[file_repo])
+        h.update(f"\0{file_repo}/{path}\0".encode())
+        h.update(contents.encode())
+
+        fml = yaml.safe_load(contents) or {}
+        for include in [*fml.get("includes", []), *fml.get("imports", [])]:
+            if isinstance(include, dict):
+                include = include["path"]
+
+            if include.startswith("@"):
+                owner, name, include_path = include[1:].split("/", 2)
+                include_repo = f"{owner}/{name}"
+
+                if include_repo not in revs:
+                    revs[include_repo] = github_api.resolve_branch(
+                        include_repo, EXTERNAL_REPO_BRANCH
+                    ).target
+            else:
+                include_repo = file_repo
+                include_path = posixpath.normpath(
+                    posixpath.join(posixpath.dirname(path), include)
+                )
+
+            to_visit.append((include_repo, include_path))
+
+    return h.hexdigest()
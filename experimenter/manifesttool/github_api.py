@@ -1,10 +1,12 @@
 import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Generator, Optional, overload
+from typing import Any, Callable, Generator, Optional, overload
 
 import requests
 
-from manifesttool import download
+from manifesttool import download, http_cache
 from manifesttool.repository import Ref
 
 GITHUB_API_URL = "https://api.github.com"
@@ -17,12 +19,65 @@ if bearer_token := os.getenv("GITHUB_BEARER_TOKEN"):  # pragma: no cover
     GITHUB_API_HEADERS["Authorization"] = f"Bearer {bearer_token}"
 
 
+@dataclass
+class ApiStats:
+    # The number of requests made to the GitHub API.
+    requests: int = 0
+
+    # The number of requests answered with 304 Not Modified. GitHub does not
+    # count these against the rate limit.
+    not_modified: int = 0
+
+    # The number of lookups answered from the in-run memo without a request.
+    memoized: int = 0
+
+    # The remaining rate limit, as of the last response.
+    rate_limit_remaining: Optional[int] = None
+
+    def __str__(self):
+        s = (
+            f"{self.requests} requests ({self.not_modified} not modified), "
+            f"{self.memoized} memoized"
+        )
+
+        if self.rate_limit_remaining is not None:
+            s += f", {self.rate_limit_remaining} remaining"
+
+        return s
+
+
+stats = ApiStats()
+_stats_lock = threading.Lock()
+
+# Responses for file lookups, keyed by (repo, file path, rev).
+_contents_memo: dict[tuple[str, str, str], requests.Response] = {}
+
+# Contents of fetched files, keyed by (repo, file path, rev).
+_file_memo: dict[tuple[str, str, str], str] = {}
+
+
+def reset():
+    """Clear the in-run memo and the API stats."""
+    global stats
+    stats = ApiStats()
+
+    _contents_memo.clear()
+    _file_memo.clear()
+
+
 def api_request(
     path: str, *, raise_for_status: bool = True, **kwargs: dict[str, Any]
 ) -> requests.Response:
     """Make a request to the GitHub API."""
     url = f"{GITHUB_API_URL}/{path}"
-    rsp = requests.get(url, headers=GITHUB_API_HEADERS, **kwargs)
+    rsp = http_cache.get(url, headers=GITHUB_API_HEADERS, **kwargs)
+
+    with _stats_lock:
+        stats.requests += 1
+        if getattr(rsp, "from_cache", False):
+            stats.not_modified += 1
+        elif remaining := rsp.headers.get("X-RateLimit-Remaining"):
+            stats.rate_limit_remaining = int(remaining)
 
     if rsp.status_code == 403:
         if rsp.headers.get("X-RateLimit-Remaining") == "0":
@@ -69,26 +124,67 @@ def get_branches(repo: str) -> list[Ref]:
     return _get_refs(repo, "branches")
 
 
-def get_tags(repo: str) -> list[Ref]:
-    """Return all the tags in a repository."""
-    return _get_refs(repo, "tags")
+def get_tags(
+    repo: str, *, stop: Optional[Callable[[list[Ref]], bool]] = None
+) -> list[Ref]:
+    """Return all the tags in a repository.
+
+    If ``stop`` is provided, it will be called with each page of tags and no
+    more pages will be requested once it returns ``True``.
+    """
+    return _get_refs(repo, "tags", stop=stop)
 
 
-def _get_refs(repo: str, kind: str) -> list[Ref]:
+def _get_refs(
+    repo: str, kind: str, *, stop: Optional[Callable[[list[Ref]], bool]] = None
+) -> list[Ref]:
     """Return all the refs of a given kind.
 
     Args:
         repo: The name of the repository, including the owner.
         kind: Either ``"branches"`` or ``"tags"``.
+        stop: An optional callback that returns whether or not to stop paging
+              after the given page of refs.
 
     Returns:
         The list of refs.
     """
-    return [
-        Ref(ref["name"], ref["commit"]["sha"])
-        for page in paginated_api_request(f"repos/{repo}/{kind}")
-        for ref in page
-    ]
+    refs = []
+
+    for page in paginated_api_request(f"repos/{repo}/{kind}"):
+        page_refs = [Ref(ref["name"], ref["commit"]["sha"]) for ref in page]
+        refs.extend(page_refs)
+
+        if stop is not None and stop(page_refs):
+            break
+
+    return refs
+
+
+def _get_contents(repo: str, file_path: str, rev: str) -> requests.Response:
+    """Look up a file in the repository at the given revision.
+
+    Revisions are resolved commit hashes, so successful lookups and missing
+    files are memoized for the rest of the run.
+    """
+    key = (repo, file_path, rev)
+
+    if (rsp := _contents_memo.get(key)) is not None:
+        with _stats_lock:
+            stats.memoized += 1
+
+        return rsp
+
+    rsp = api_request(
+        f"repos/{repo}/contents/{file_path}",
+        raise_for_status=False,
+        params={"ref": rev},
+    )
+
+    if rsp.status_code in (200, 404):
+        _contents_memo[key] = rsp
+
+    return rsp
 
 
 @overload
@@ -126,18 +222,22 @@ def fetch_file(
         If ``download_path`` is ``None``, the file contents are returned as a
         ``str``. Otherwise, ``None`` is returned.
     """
-    rsp = api_request(
-        f"repos/{repo}/contents/{file_path}",
-        raise_for_status=False,
-        params={"ref": rev},
-    )
+    key = (repo, file_path, rev)
+
+    if download_path is None and (contents := _file_memo.get(key)) is not None:
+        with _stats_lock:
+            stats.memoized += 1
 
+        return contents
+
+    rsp = _get_contents(repo, file_path, rev)
     rsp.raise_for_status()
 
     url = rsp.json()["download_url"]
 
     if download_path is None:
-        return download.as_text(url)
+        contents = _file_memo[key] = download.as_text(url)
+        return contents
 
     download.to_path(url, download_path)
     return None
@@ -147,11 +247,7 @@ def file_exists(repo: str, file_path: str, rev: str) -> bool:
     """Return whether or not a file with the given path exists in the repo at
     the given revision.
     """
-    rsp = api_request(
-        f"repos/{repo}/contents/{file_path}",
-        raise_for_status=False,
-        params={"ref": rev},
-    )
+    rsp = _get_contents(repo, file_path, rev)
 
     if rsp.status_code == 404:
         return False
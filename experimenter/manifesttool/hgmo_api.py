@@ -2,9 +2,7 @@ from pathlib import Path
 from typing import Any, Optional, overload
 from urllib.parse import urlencode
 
-import requests
-
-from manifesttool import download
+from manifesttool import download, http_cache
 from manifesttool.repository import Ref
 
 HGMO_URL = "https://hg.mozilla.org"
@@ -12,7 +10,7 @@ HGMO_URL = "https://hg.mozilla.org"
 
 def api_request(path: str, **kwargs) -> dict[str, Any]:
     """Make a request to hg.mozilla.org."""
-    return requests.get(f"{HGMO_URL}/{path}", **kwargs).json()
+    return http_cache.get(f"{HGMO_URL}/{path}", **kwargs).json()
 
 
 def resolve_branch(repo: str, bookmark: str) -> Ref:
@@ -0,0 +1,167 @@
+import base64
+import hashlib
+import json
+import threading
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class HttpCache:
+    """A persistent on-disk cache for HTTP GET requests.
+
+    Responses that carry an ``ETag`` or ``Last-Modified`` header are written to
+    disk. Subsequent requests for the same URL are made conditionally and, if
+    the server responds with ``304 Not Modified``, the stored response is
+    returned instead.
+
+    GitHub does not count ``304`` responses against the API rate limit, so
+    revalidating unchanged resources is effectively free.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        *,
+        headers: Optional[dict[str, str]] = None,
+        params: Optional[dict[str, Any]] = None,
+        **kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Make a conditional GET request, using the cached response if valid.
+
+        The entire response body is always read, so ``stream`` is ignored.
+        Responses that were revalidated will have ``from_cache`` set to
+        ``True``.
+        """
+        kwargs.pop("stream", None)
+
+        entry_path = self._entry_path(url, params)
+        entry = self._load(entry_path)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if etag := entry.get("etag"):
+                request_headers["If-None-Match"] = etag
+            if last_modified := entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = last_modified
+
+        rsp = session().get(url, headers=request_headers, params=params, **kwargs)
+
+        if rsp.status_code == 304 and entry is not None:
+            rsp.close()
+            self._count(hit=True)
+            return self._response_from_entry(rsp, entry)
+
+        self._count(hit=False)
+
+        if rsp.status_code == 200 and (
+            "ETag" in rsp.headers or "Last-Modified" in rsp.headers
+        ):
+            self._store(entry_path, rsp)
+
+        return rsp
+
+    def _count(self, *, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _entry_path(self, url: str, params: Optional[dict[str, Any]]) -> Path:
+        prepared_url = requests.Request("GET", url, params=params).prepare().url
+        key = hashlib.sha256(prepared_url.encode()).hexdigest()
+
+        return self.path / key[:2] / f"{key}.json"
+
+    def _load(self, entry_path: Path) -> Optional[dict[str, Any]]:
+        try:
+            with entry_path.open() as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _store(self, entry_path: Path, rsp: requests.Response):
+        entry = {
+            "etag": rsp.headers.get("ETag"),
+            "last_modified": rsp.headers.get("Last-Modified"),
+            "encoding": rsp.encoding,
+            "headers": dict(rsp.headers),
+            "content": base64.b64encode(rsp.content).decode(),
+        }
+
+        # Write to a temporary file and rename it into place so that concurrent
+        # fetches never observe a partially written entry.
+        entry_path.parent.mkdir(exist_ok=True)
+        with NamedTemporaryFile(
+            "w", dir=entry_path.parent, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(entry, f)
+
+        Path(f.name).replace(entry_path)
+
+    def _response_from_entry(
+        self, rsp: requests.Response, entry: dict[str, Any]
+    ) -> requests.Response:
+        cached = requests.Response()
+        cached.status_code = 200
+        cached.reason = "OK"
+        cached.url = rsp.url
+        cached.request = rsp.request
+        cached.encoding = entry["encoding"]
+        cached.headers = CaseInsensitiveDict(entry["headers"])
+        cached._content = base64.b64decode(entry["content"])
+        cached._content_consumed = True
+        cached.from_cache = True
+
+        return cached
+
+
+_http_cache: Optional[HttpCache] = None
+_sessions = threading.local()
+
+
+def session() -> requests.Session:
+    """Return the session for the current thread.
+
+    Sessions keep connections alive between requests, so reusing one avoids a
+    new TLS handshake per request. Sessions are not safe to share between
+    threads, so each thread gets its own.
+    """
+    if (thread_session := getattr(_sessions, "session", None)) is None:
+        thread_session = _sessions.session = requests.Session()
+
+    return thread_session
+
+
+def enable(path: Path) -> HttpCache:
+    """Route all requests made with ``get`` through an HttpCache at the given path."""
+    global _http_cache
+    _http_cache = HttpCache(path)
+
+    return _http_cache
+
+
+def disable():
+    """Stop caching requests made with ``get``."""
+    global _http_cache
+    _http_cache = None
+
+
+def get(url: str, **kwargs: dict[str, Any]) -> requests.Response:
+    """Make a GET request, using the HTTP cache if it is enabled."""
+    if _http_cache is None:
+        return session().get(url, **kwargs)
+
+    return _http_cache.get(url, **kwargs)
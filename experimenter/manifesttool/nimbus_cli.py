@@ -1,6 +1,7 @@
 import json
 import subprocess
 import sys
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
@@ -23,6 +24,12 @@ def nimbus_cli(args: list[str]) -> bytes:
     )
 
 
+@cache
+def get_version() -> str:
+    """Return the version of nimbus-cli."""
+    return nimbus_cli(["--version"]).decode().strip()
+
+
 def get_channels(app_config: AppConfig, fml_path: str, ref: str) -> list[str]:
     """Get the list of channels supported by the application."""
     assert app_config.repo.type == RepositoryType.GITHUB
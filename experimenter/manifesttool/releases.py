@@ -71,7 +71,17 @@ def discover_tagged_releases(
     versions = resolve_ref_versions(app_config, versions.values())
 
     if strategy.tag_re:
-        tags = github_api.get_tags(app_config.repo.name)
+        stop = None
+        if strategy.tags_newest_first:
+            # Stop paging once a page contains versioned tags and all of them
+            # are older than we care about.
+            def stop(page: list[Ref]) -> bool:
+                page_versions = find_versioned_refs(
+                    page, strategy.tag_re, strategy.ignored_tags
+                )
+                return bool(page_versions) and all(v < min_version for v in page_versions)
+
+        tags = github_api.get_tags(app_config.repo.name, stop=stop)
         tag_versions = find_versioned_refs(tags, strategy.tag_re, strategy.ignored_tags)
         tag_versions = filter_versioned_refs(tag_versions, min_version)
 
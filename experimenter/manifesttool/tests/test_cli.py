@@ -2,12 +2,13 @@ import json
 from contextlib import contextmanager
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import yaml
 from click.testing import CliRunner
 
 import manifesttool
+from manifesttool import http_cache
 from manifesttool.appconfig import (
     AppConfig,
     AppConfigs,
@@ -17,7 +18,7 @@ from manifesttool.appconfig import (
     RepositoryType,
     VersionFile,
 )
-from manifesttool.cli import main
+from manifesttool.cli import HTTP_CACHE_DIRNAME, main
 from manifesttool.fetch import FetchResult
 from manifesttool.repository import Ref, RefCache
 from manifesttool.tests.test_fetch import FML_APP_CONFIG, LEGACY_APP_CONFIG, mock_fetch
@@ -209,6 +210,7 @@ class CliTests(TestCase):
             "fml_app",
             app_config,
             cache,
+            executor=ANY,
         )
 
     @patch.object(
@@ -302,3 +304,86 @@ class CliTests(TestCase):
 
         self.assertIn("fetch: unknown app does_not_exist", result.stdout)
         self.assertNotIn("SUMMARY", result.stdout)
+
+    @patch.object(
+        manifesttool.cli,
+        "fetch_fml_app",
+        side_effect=lambda *args: mock_fetch(*args, ref=Ref("main", "resolved")),
+    )
+    @patch.object(
+        manifesttool.fetch,
+        "discover_tagged_releases",
+        lambda *args: {
+            Version(1): Ref("v1", "foo"),
+            Version(2): Ref("v2", "bar"),
+        },
+    )
+    @patch.object(manifesttool.fetch, "fetch_fml_app", mock_fetch)
+    def test_fetch_jobs(self, fetch_fml_app):
+        """Testing the fetch command with concurrent jobs."""
+        app_configs = [
+            AppConfig(
+                slug=slug,
+                repo=Repository(
+                    type=RepositoryType.GITHUB,
+                    name="fml-repo",
+                ),
+                fml_path="nimbus.fml.yaml",
+                release_discovery=ReleaseDiscovery(
+                    version_file=VersionFile.create_plain_text("version.txt"),
+                    strategies=[DiscoveryStrategy.create_tagged(branch_re="", tag_re="")],
+                ),
+            )
+            for slug in ("fml-app", "other-fml-app")
+        ]
+
+        with cli_runner(app_configs=app_configs) as runner:
+            result = runner.invoke(main, ["--manifest-dir", ".", "fetch", "--jobs", "4"])
+            self.assertEqual(result.exit_code, 0, result.exception or result.stdout)
+
+            for slug in ("fml-app", "other-fml-app"):
+                cache = RefCache.load_from_file(Path(slug, ".ref-cache.yaml"))
+                self.assertEqual(cache, RefCache(__root__={"v1": "foo", "v2": "bar"}))
+
+        self.assertEqual(fetch_fml_app.call_count, 2)
+
+        # Results are reported in app and version order regardless of which
+        # fetch finished first.
+        self.assertIn(
+            "SUMMARY:\n\n"
+            "SUCCESS:\n\n"
+            "fml_app at main (resolved) version None\n"
+            "fml_app at v1 (foo) version 1.0.0\n"
+            "fml_app at v2 (bar) version 2.0.0\n"
+            "other_fml_app at main (resolved) version None\n"
+            "other_fml_app at v1 (foo) version 1.0.0\n"
+            "other_fml_app at v2 (bar) version 2.0.0\n",
+            result.stdout,
+        )
+
+    @patch.object(
+        manifesttool.cli,
+        "fetch_fml_app",
+        side_effect=lambda *args: mock_fetch(*args, ref=Ref("main", "resolved")),
+    )
+    def test_fetch_http_cache(self, fetch_fml_app):
+        """Testing the fetch command enables the HTTP cache by default."""
+        with cli_runner(app_configs=[FML_APP_CONFIG]) as runner:
+            result = runner.invoke(main, ["--manifest-dir", ".", "fetch"])
+            self.assertEqual(result.exit_code, 0, result.exception or result.stdout)
+            self.assertTrue(Path(HTTP_CACHE_DIRNAME).is_dir())
+
+        self.assertIn("fetch: http cache: 0 not modified, 0 fetched", result.stdout)
+        self.assertIn(
+            "fetch: github api: 0 requests (0 not modified), 0 memoized", result.stdout
+        )
+        self.assertIsNone(http_cache._http_cache)
+
+        with cli_runner(app_configs=[FML_APP_CONFIG]) as runner:
+            result = runner.invoke(
+                main, ["--manifest-dir", ".", "fetch", "--no-http-cache"]
+            )
+            self.assertEqual(result.exit_code, 0, result.exception or result.stdout)
+            self.assertFalse(Path(HTTP_CACHE_DIRNAME).exists())
+
+        self.assertNotIn("fetch: http cache", result.stdout)
@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -26,6 +27,7 @@ from manifesttool.fetch import (
     fetch_releases,
     summarize_results,
 )
+from manifesttool.fml_inputs import FmlInputs
 from manifesttool.nimbus_cli import _get_experimenter_yaml_path, _get_fml_path
 from manifesttool.repository import Ref, RefCache
 from manifesttool.version import Version
@@ -317,6 +319,94 @@ class FetchTests(TestCase):
                 None,
             )
 
+    @patch.object(manifesttool.fetch, "hash_fml_inputs", return_value="inputs")
+    @patch.object(
+        manifesttool.fetch.nimbus_cli,
+        "get_channels",
+        side_effect=lambda *args: ["release", "beta"],
+    )
+    @patch.object(
+        manifesttool.fetch.nimbus_cli,
+        "download_single_file",
+        side_effect=mock_download_single_file,
+    )
+    @patch.object(
+        manifesttool.fetch.nimbus_cli,
+        "generate_experimenter_yaml",
+        side_effect=lambda manifest_dir, app_config, channel, version: (
+            _get_experimenter_yaml_path(manifest_dir, app_config, version).touch()
+        ),
+    )
+    def test_fetch_fml_inputs_unchanged(
+        self,
+        generate_experimenter_yaml,
+        download_single_file,
+        get_channels,
+        hash_fml_inputs,
+    ):
+        """Testing fetch_fml_app skips generation when the FML inputs are unchanged."""
+        with TemporaryDirectory() as tmp:
+            manifest_dir = Path(tmp)
+            manifest_dir.joinpath("fml-app").mkdir()
+
+            result = fetch_fml_app(
+                manifest_dir, "app", FML_APP_CONFIG, Ref("v1", "foo"), Version(1)
+            )
+            self.assertIsNone(result.exc)
+            self.assertFalse(result.content_cached)
+
+            hash_fml_inputs.assert_called_with(
+                FML_APP_CONFIG.repo.name, FML_APP_CONFIG.fml_path, "foo"
+            )
+
+            inputs_path = manifest_dir / "fml-app" / "v1.0.0" / ".fml-inputs.yaml"
+            self.assertEqual(
+                FmlInputs.load_or_none(inputs_path),
+                FmlInputs(hash="inputs", channels=["release", "beta"]),
+            )
+
+            # The ref has moved, but the inputs are the same.
+            result = fetch_fml_app(
+                manifest_dir, "app", FML_APP_CONFIG, Ref("v1", "bar"), Version(1)
+            )
+            self.assertIsNone(result.exc)
+            self.assertTrue(result.content_cached)
+
+            self.assertEqual(get_channels.call_count, 1)
+            self.assertEqual(download_single_file.call_count, 2)
+            self.assertEqual(generate_experimenter_yaml.call_count, 1)
+
+            # If an output is missing, it is regenerated.
+            _get_fml_path(manifest_dir, FML_APP_CONFIG, "beta", Version(1)).unlink()
+            result = fetch_fml_app(
+                manifest_dir, "app", FML_APP_CONFIG, Ref("v1", "bar"), Version(1)
+            )
+            self.assertFalse(result.content_cached)
+            self.assertEqual(get_channels.call_count, 2)
+
+            # If the inputs change, manifests are regenerated.
+            hash_fml_inputs.return_value = "new-inputs"
+            result = fetch_fml_app(
+                manifest_dir, "app", FML_APP_CONFIG, Ref("v1", "baz"), Version(1)
+            )
+            self.assertFalse(result.content_cached)
+            self.assertEqual(get_channels.call_count, 3)
+            self.assertEqual(
+                FmlInputs.load_or_none(inputs_path).hash,
+                "new-inputs",
+            )
+
+            # If the inputs cannot be hashed, manifests are always regenerated
+            # and the previous record is kept.
+            hash_fml_inputs.side_effect = Exception("Connection error")
+            result = fetch_fml_app(
+                manifest_dir, "app", FML_APP_CONFIG, Ref("v1", "baz"), Version(1)
+            )
+            self.assertIsNone(result.exc)
+            self.assertFalse(result.content_cached)
+            self.assertEqual(get_channels.call_count, 4)
+            self.assertEqual(FmlInputs.load_or_none(inputs_path).hash, "new-inputs")
+
     def test_fetch_fml_version_no_ref(self):
         """Testing fetch_fml_app with a version but no ref results in an error."""
         with TemporaryDirectory() as tmp:
@@ -1000,10 +1090,63 @@ class FetchTests(TestCase):
             ),
         )
 
+    @patch.object(
+        manifesttool.fetch,
+        "discover_tagged_releases",
+        lambda *args: {
+            Version(1): Ref("v1", "foo"),
+            Version(2): Ref("v2", "bar"),
+            Version(3): Ref("v3", "baz"),
+        },
+    )
+    @patch.object(
+        manifesttool.fetch,
+        "fetch_fml_app",
+        lambda *args: (
+            FetchResult(args[1], args[3], args[4], exc=Exception("oh no"))
+            if args[3].name == "v2"
+            else mock_fetch(*args)
+        ),
+    )
+    def test_fetch_releases_executor(self):
+        """Testing fetch_releases fetches releases on the given executor."""
+        app_config = AppConfig(
+            slug="fml-app",
+            repo=Repository(
+                type=RepositoryType.GITHUB,
+                name="fml-repo",
+            ),
+            fml_path="nimbus.fml.yaml",
+            release_discovery=ReleaseDiscovery(
+                version_file=VersionFile.create_plain_text("version.txt"),
+                strategies=[DiscoveryStrategy.create_tagged(branch_re="", tag_re="")],
+            ),
+        )
+
+        cache = RefCache(__root__={"v3": "baz"})
+
+        with TemporaryDirectory() as tmp, ThreadPoolExecutor(max_workers=2) as executor:
+            manifest_dir = Path(tmp)
+            results = fetch_releases(
+                manifest_dir, "fml_app", app_config, cache, executor=executor
+            )
+
+        self.assertEqual(
+            [(result.ref, result.exc is None, result.cached) for result in results],
+            [
+                (Ref("v1", "foo"), True, False),
+                (Ref("v2", "bar"), False, False),
+                (Ref("v3", "baz"), True, True),
+            ],
+        )
+
+        # Failed fetches are not added to the cache.
+        self.assertEqual(cache, RefCache(__root__={"v1": "foo", "v3": "baz"}))
+
     def test_summarize_results(self):
         buffer = StringIO()
 
-        summarize_results(
+        counts = summarize_results(
             [
                 FetchResult(
                     "app-1",
@@ -1019,6 +1162,9 @@ class FetchTests(TestCase):
                     Version(7, 8, 9),
                     exc=Exception("rats!"),
                 ),
+                FetchResult(
+                    "app-6", Ref("f", "corge"), Version(1, 0, 0), content_cached=True
+                ),
             ],
             buffer,
         )
@@ -1043,6 +1189,11 @@ app-2 at b (bar) version 1.2.3
 CACHED:
 
 app-4 at d (qux) version 4.5.6 (cached)
+
+UNCHANGED:
+
+app-6 at f (corge) version 1.0.0 (unchanged)
 """
 
         self.assertEqual(summary, expected)
+        self.assertEqual(counts, (2, 1, 1, 2))
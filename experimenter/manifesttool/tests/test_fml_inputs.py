@@ -0,0 +1,147 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+import yaml
+
+from manifesttool import fml_inputs
+from manifesttool.fml_inputs import FmlInputs, hash_fml_inputs
+from manifesttool.repository import Ref
+
+ROOT_FML = {
+    "channels": ["release", "beta"],
+    "includes": ["features/onboarding.fml.yaml"],
+    "imports": [
+        {
+            "path": "@mozilla/application-services/components/messaging.fml.yaml",
+            "channel": "release",
+        },
+    ],
+}
+
+ONBOARDING_FML = {
+    "includes": ["../nimbus.fml.yaml", "shared.fml.yaml"],
+    "features": {"onboarding": {"description": "Onboarding"}},
+}
+
+SHARED_FML = {"features": {"shared": {"description": "Shared"}}}
+
+MESSAGING_FML = {"features": {"messaging": {"description": "Messaging"}}}
+
+
+def make_repo_files(
+    overrides: Optional[dict[tuple[str, str], dict]] = None,
+) -> dict[tuple[str, str], str]:
+    """Return the files in the mock repositories, keyed by (repo, path)."""
+    files = {
+        ("owner/repo", "nimbus.fml.yaml"): ROOT_FML,
+        ("owner/repo", "features/onboarding.fml.yaml"): ONBOARDING_FML,
+        ("owner/repo", "features/shared.fml.yaml"): SHARED_FML,
+        (
+            "mozilla/application-services",
+            "components/messaging.fml.yaml",
+        ): MESSAGING_FML,
+    }
+    files.update(overrides or {})
+
+    return {key: yaml.safe_dump(contents) for key, contents in files.items()}
+
+
+class FmlInputsTests(TestCase):
+    """Tests for hashing FML inputs."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.files = make_repo_files()
+        self.fetched = []
+
+        def fetch_file(repo: str, path: str, rev: str) -> str:
+            self.fetched.append((repo, path, rev))
+            return self.files[(repo, path)]
+
+        for target, attr, kwargs in (
+            (fml_inputs.github_api, "fetch_file", {"side_effect": fetch_file}),
+            (
+                fml_inputs.github_api,
+                "resolve_branch",
+                {"side_effect": lambda repo, branch: Ref(branch, "external-rev")},
+            ),
+            (fml_inputs.nimbus_cli, "get_version", {"return_value": "nimbus-cli 1"}),
+        ):
+            patcher = patch.object(target, attr, **kwargs)
+            setattr(self, attr, patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def test_hash_fml_inputs(self):
+        """Testing hash_fml_inputs fetches every included and imported file once."""
+        hash_fml_inputs("owner/repo", "nimbus.fml.yaml", "rev")
+
+        self.assertEqual(
+            self.fetched,
+            [
+                ("owner/repo", "nimbus.fml.yaml", "rev"),
+                ("owner/repo", "features/onboarding.fml.yaml", "rev"),
+                (
+                    "mozilla/application-services",
+                    "components/messaging.fml.yaml",
+                    "external-rev",
+                ),
+                ("owner/repo", "features/shared.fml.yaml", "rev"),
+            ],
+        )
+        self.resolve_branch.assert_called_once_with(
+            "mozilla/application-services", "main"
+        )
+
+    def test_hash_fml_inputs_rev_independent(self):
+        """Testing hash_fml_inputs only depends on the contents of the files."""
+        self.assertEqual(
+            hash_fml_inputs("owner/repo", "nimbus.fml.yaml", "rev"),
+            hash_fml_inputs("owner/repo", "nimbus.fml.yaml", "other-rev"),
+        )
+
+    def test_hash_fml_inputs_changes(self):
+        """Testing hash_fml_inputs changes when any input changes."""
+        original = hash_fml_inputs("owner/repo", "nimbus.fml.yaml", "rev")
+
+        self.files = make_repo_files(
+            {
+                (
+                    "mozilla/application-services",
+                    "components/messaging.fml.yaml",
+                ): {"features": {}},
+            }
+        )
+        self.assertNotEqual(
+            hash_fml_inputs("owner/repo", "nimbus.fml.yaml", "rev"), original
+        )
+
+        self.files = make_repo_files()
+        self.get_version.return_value = "nimbus-cli 2"
+        self.assertNotEqual(
+            hash_fml_inputs("owner/repo", "nimbus.fml.yaml", "rev"), original
+        )
+
+    def test_fml_inputs_file(self):
+        """Testing FmlInputs round-trips through a file."""
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp, ".fml-inputs.yaml")
+
+            self.assertIsNone(FmlInputs.load_or_none(path))
+
+            inputs = FmlInputs(hash="abc", channels=["release", "beta"])
+            inputs.write_to_file(path)
+
+            self.assertEqual(FmlInputs.load_or_none(path), inputs)
+
+    def test_fml_inputs_file_invalid(self):
+        """Testing FmlInputs.load_or_none ignores corrupt and old-format files."""
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp, ".fml-inputs.yaml")
+
+            for contents in ("", "hash: [", "hash: abc\n", "- abc\n"):
+                path.write_text(contents)
+                self.assertIsNone(FmlInputs.load_or_none(path), contents)
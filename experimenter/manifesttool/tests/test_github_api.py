@@ -4,6 +4,7 @@ from typing import Any
 from unittest import TestCase
 
 import responses
+from requests import HTTPError
 from responses import matchers
 
 from manifesttool import github_api
@@ -49,6 +50,10 @@ def make_responses_for_fetch(
 class GitHubApiTests(TestCase):
     """Tests for GitHub API wrappers."""
 
+    def setUp(self):
+        super().setUp()
+        github_api.reset()
+
     @responses.activate
     def test_resolve_branch(self):
         """Testing resolve_branch."""
@@ -223,3 +228,104 @@ class GitHubApiTests(TestCase):
 
         self.assertFalse(github_api.file_exists("repo", "file.txt", "foo"))
         self.assertTrue(github_api.file_exists("repo", "file.txt", "bar"))
+
+    @responses.activate
+    def test_get_tags_stop(self):
+        """Testing get_tags stops paging when requested."""
+        rsps = _add_paginated_responses(
+            f"{GITHUB_API_URL}/repos/owner/repo/tags",
+            {
+                "1": {
+                    "json": [
+                        {
+                            "name": "tag-3",
+                            "commit": {"sha": "2" * 40},
+                        }
+                    ]
+                },
+                "2": {
+                    "json": [
+                        {
+                            "name": "tag-2",
+                            "commit": {"sha": "1" * 40},
+                        }
+                    ]
+                },
+                "3": {
+                    "body": Exception("should not be requested"),
+                    "status": 400,
+                },
+            },
+        )
+
+        result = github_api.get_tags(
+            "owner/repo", stop=lambda page: Ref("tag-2", "1" * 40) in page
+        )
+        self.assertEqual(
+            result,
+            [
+                Ref("tag-3", "2" * 40),
+                Ref("tag-2", "1" * 40),
+            ],
+        )
+
+        self.assertEqual(rsps["1"].call_count, 1)
+        self.assertEqual(rsps["2"].call_count, 1)
+        self.assertEqual(rsps["3"].call_count, 0)
+
+    @responses.activate
+    def test_fetch_file_memoized(self):
+        """Testing repeated lookups of the same file at the same revision are
+        memoized.
+        """
+        api_rsp, file_rsp = make_responses_for_fetch(
+            "repo", "ref", "file/path.txt", b"hello, world\n"
+        )
+        missing_rsp = responses.get(
+            f"{GITHUB_API_URL}/repos/repo/contents/missing.txt",
+            status=404,
+            body="404",
+            match=[matchers.query_param_matcher({"ref": "ref"})],
+        )
+
+        for _ in range(2):
+            self.assertTrue(github_api.file_exists("repo", "file/path.txt", "ref"))
+            self.assertEqual(
+                github_api.fetch_file("repo", "file/path.txt", "ref"),
+                "hello, world\n",
+            )
+
+            self.assertFalse(github_api.file_exists("repo", "missing.txt", "ref"))
+            with self.assertRaises(HTTPError):
+                github_api.fetch_file("repo", "missing.txt", "ref")
+
+        self.assertEqual(api_rsp.call_count, 1)
+        self.assertEqual(file_rsp.call_count, 1)
+        self.assertEqual(missing_rsp.call_count, 1)
+        self.assertEqual(github_api.stats.requests, 2)
+        self.assertEqual(github_api.stats.memoized, 6)
+
+        github_api.reset()
+        github_api.file_exists("repo", "file/path.txt", "ref")
+
+        self.assertEqual(api_rsp.call_count, 2)
+
+    @responses.activate
+    def test_api_stats(self):
+        """Testing api_request tracks the remaining rate limit."""
+        responses.get(
+            f"{GITHUB_API_URL}/repos/owner/repo/branches/main",
+            json={"commit": {"sha": "0" * 40}},
+            headers={"X-RateLimit-Remaining": "4999"},
+        )
+
+        github_api.resolve_branch("owner/repo", "main")
+
+        self.assertEqual(
+            github_api.stats,
+            github_api.ApiStats(requests=1, rate_limit_remaining=4999),
+        )
+        self.assertEqual(
+            str(github_api.stats),
+            "1 requests (0 not modified), 0 memoized, 4999 remaining",
+        )
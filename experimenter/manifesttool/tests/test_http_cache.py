@@ -0,0 +1,233 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from manifesttool import download, github_api, hgmo_api, http_cache
+
+
+class LocalServer:
+    """A local HTTP server that supports conditional requests.
+
+    Every path in ``files`` is served with an ``ETag`` derived from its
+    contents. Paths in ``uncacheable`` are served without one.
+    """
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.uncacheable: set[str] = set()
+        self.requests: list[tuple[str, Optional[str], int]] = []
+        self.client_ports: set[int] = set()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections alive between requests.
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if_none_match = self.headers.get("If-None-Match")
+
+                if path not in server.files:
+                    self._respond(path, if_none_match, 404)
+                    return
+
+                content = server.files[path]
+                etag = f'"{hashlib.sha256(content).hexdigest()}"'
+
+                headers = {"Content-Type": "application/json; charset=utf-8"}
+                if path not in server.uncacheable:
+                    headers["ETag"] = etag
+
+                if if_none_match == etag:
+                    self._respond(path, if_none_match, 304, headers)
+                else:
+                    self._respond(path, if_none_match, 200, headers, content)
+
+            def _respond(
+                self,
+                path: str,
+                if_none_match: Optional[str],
+                status: int,
+                headers: Optional[dict[str, str]] = None,
+                content: bytes = b"",
+            ):
+                server.requests.append((self.path, if_none_match, status))
+                server.client_ports.add(self.client_address[1])
+
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self) -> "LocalServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+    def statuses(self) -> list[int]:
+        return [status for _, _, status in self.requests]
+
+
+class HttpCacheTests(TestCase):
+    """Tests for the on-disk HTTP cache."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.server = self.enterContext(LocalServer())
+        self.cache_dir = Path(self.enterContext(TemporaryDirectory()))
+        self.cache = http_cache.enable(self.cache_dir)
+        self.addCleanup(http_cache.disable)
+
+        github_api.reset()
+
+    def test_get_not_modified(self):
+        """Testing get revalidates stored responses with If-None-Match."""
+        self.server.files["/file.json"] = b'{"hello": "world"}'
+
+        for _ in range(2):
+            rsp = http_cache.get(f"{self.server.url}/file.json")
+            rsp.raise_for_status()
+            self.assertEqual(rsp.status_code, 200)
+            self.assertEqual(rsp.json(), {"hello": "world"})
+
+        self.assertEqual(self.server.statuses(), [200, 304])
+        self.assertIsNone(self.server.requests[0][1])
+        self.assertIsNotNone(self.server.requests[1][1])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_get_persists_between_runs(self):
+        """Testing the cache is re-used by a new HttpCache at the same path."""
+        self.server.files["/file.json"] = b"[1, 2, 3]"
+
+        http_cache.get(f"{self.server.url}/file.json")
+
+        cache = http_cache.enable(self.cache_dir)
+        rsp = http_cache.get(f"{self.server.url}/file.json")
+
+        self.assertEqual(rsp.json(), [1, 2, 3])
+        self.assertEqual(self.server.statuses(), [200, 304])
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_get_modified(self):
+        """Testing get returns the new response when the resource changes."""
+        self.server.files["/file.json"] = b'"old"'
+        self.assertEqual(http_cache.get(f"{self.server.url}/file.json").json(), "old")
+
+        self.server.files["/file.json"] = b'"new"'
+        self.assertEqual(http_cache.get(f"{self.server.url}/file.json").json(), "new")
+        self.assertEqual(http_cache.get(f"{self.server.url}/file.json").json(), "new")
+
+        self.assertEqual(self.server.statuses(), [200, 200, 304])
+
+    def test_get_params(self):
+        """Testing responses are cached separately for each set of params."""
+        self.server.files["/file.json"] = b"{}"
+
+        for ref in ("a", "b", "a"):
+            http_cache.get(f"{self.server.url}/file.json", params={"ref": ref})
+
+        self.assertEqual(self.server.statuses(), [200, 200, 304])
+
+    def test_get_not_stored(self):
+        """Testing responses without validators or errors are not stored."""
+        self.server.files["/file.json"] = b"{}"
+        self.server.uncacheable.add("/file.json")
+
+        for _ in range(2):
+            http_cache.get(f"{self.server.url}/file.json")
+            rsp = http_cache.get(f"{self.server.url}/missing.json")
+            self.assertEqual(rsp.status_code, 404)
+
+        self.assertEqual(self.server.statuses(), [200, 404, 200, 404])
+        self.assertTrue(
+            all(if_none_match is None for _, if_none_match, _ in self.server.requests)
+        )
+        self.assertEqual(list(self.cache_dir.rglob("*.json")), [])
+
+    def test_session_reused(self):
+        """Testing requests on the same thread share a connection."""
+        self.server.files["/file.json"] = b"{}"
+
+        for _ in range(3):
+            http_cache.get(f"{self.server.url}/file.json")
+
+        http_cache.disable()
+        http_cache.get(f"{self.server.url}/file.json")
+
+        self.assertEqual(self.server.statuses(), [200, 304, 304, 200])
+        self.assertEqual(len(self.server.client_ports), 1)
+
+    def test_disabled(self):
+        """Testing get does not cache anything when disabled."""
+        http_cache.disable()
+        self.server.files["/file.json"] = b"{}"
+
+        for _ in range(2):
+            http_cache.get(f"{self.server.url}/file.json")
+
+        self.assertEqual(self.server.statuses(), [200, 200])
+
+    def test_download_to_path(self):
+        """Testing download.to_path writes cached responses to disk."""
+        self.server.files["/file.txt"] = b"hello, world\n"
+
+        for _ in range(2):
+            download_path = self.cache_dir / "file.txt"
+            download.to_path(f"{self.server.url}/file.txt", download_path)
+
+            self.assertEqual(download_path.read_bytes(), b"hello, world\n")
+            download_path.unlink()
+
+        self.assertEqual(self.server.statuses(), [200, 304])
+
+    def test_github_fetch_file(self):
+        """Testing github_api.fetch_file revalidates the contents and download."""
+        self.server.files["/repos/owner/repo/contents/nimbus.fml.yaml"] = (
+            f'{{"download_url": "{self.server.url}/raw/nimbus.fml.yaml"}}'
+        ).encode()
+        self.server.files["/raw/nimbus.fml.yaml"] = b"version: 1.0.0\n"
+
+        with patch.object(github_api, "GITHUB_API_URL", self.server.url):
+            for _ in range(2):
+                # Each run starts with an empty memo.
+                github_api.reset()
+
+                contents = github_api.fetch_file("owner/repo", "nimbus.fml.yaml", "rev")
+                self.assertEqual(contents, "version: 1.0.0\n")
+
+        self.assertEqual(github_api.stats.requests, 1)
+        self.assertEqual(github_api.stats.not_modified, 1)
+
+        self.assertEqual(self.server.statuses(), [200, 200, 304, 304])
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 2))
+
+    def test_hgmo_fetch_file(self):
+        """Testing hgmo_api.fetch_file revalidates downloads."""
+        self.server.files["/repo/raw-file/rev/experimenter.yaml"] = b"{}\n"
+
+        with patch.object(hgmo_api, "HGMO_URL", self.server.url):
+            for _ in range(2):
+                contents = hgmo_api.fetch_file("repo", "experimenter.yaml", "rev")
+                self.assertEqual(contents, "{}\n")
+
+        self.assertEqual(self.server.statuses(), [200, 304])
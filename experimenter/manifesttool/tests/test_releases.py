@@ -48,7 +48,8 @@ def mocks_for_discover_tagged_releases(
             The list of refs to return from ``get_branches()``.
 
         Tags:
-            The list of refs to return from ``get_tags()``.
+            The list of refs to return from ``get_tags()``. Each tag is treated
+            as a separate page.
 
             If ``None``, ``strategy.tag_re`` must also be ``None``.
 
@@ -76,8 +77,14 @@ def mocks_for_discover_tagged_releases(
     def mock_get_branches(*args):
         return branches
 
-    def mock_get_tags(*args):
+    def mock_get_tags(*args, stop=None):
         assert tags is not None
+
+        # Each tag is returned as its own page.
+        for i, tag in enumerate(tags):
+            if stop is not None and stop([tag]):
+                return tags[: i + 1]
+
         return tags
 
     def mock_fetch_file(
@@ -178,6 +185,59 @@ class ReleaseTests(TestCase):
             },
         )
 
+    def test_discover_tagged_releases_tags_newest_first(self):
+        """Testing discover_tagged_releases stops paging through tags once they
+        fall below the minimum version.
+        """
+        strategy = DiscoveryStrategy.create_tagged(
+            branch_re=r"release_v(?P<major>\d)+",
+            tag_re=r"v(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)",
+            tags_newest_first=True,
+        )
+        app_config = AppConfig(
+            slug="fml-app",
+            repo=Repository(
+                type=RepositoryType.GITHUB,
+                name="fml-repo",
+            ),
+            fml_path="nimbus.fml.yaml",
+            release_discovery=ReleaseDiscovery(
+                version_file=VersionFile.create_plain_text("version.txt"),
+                strategies=[strategy],
+            ),
+        )
+
+        branches = [Ref(f"release_v{major}", f"branch-v{major}") for major in range(1, 7)]
+        tags = [
+            Ref("unrelated", "tag-unrelated"),
+            *(Ref(f"v{major}.0.0", f"tag-v{major}") for major in range(6, 0, -1)),
+        ]
+        ref_versions = {f"branch-v{major}": Version(major, 0, 1) for major in range(1, 7)}
+
+        with mocks_for_discover_tagged_releases(
+            app_config, strategy.__root__, branches, tags, ref_versions
+        ) as (_, get_tags, _):
+            releases = discover_tagged_releases("app", app_config, strategy.__root__)
+
+        stop = get_tags.call_args.kwargs["stop"]
+        self.assertFalse(stop([Ref("unrelated", "tag-unrelated")]))
+        self.assertFalse(stop([Ref("v2.0.0", "tag-v2"), Ref("v1.0.0", "tag-v1")]))
+        self.assertTrue(stop([Ref("v1.0.0", "tag-v1")]))
+
+        self.assertEqual(
+            releases,
+            {
+                **{
+                    Version(major, 0, 1): Ref(f"release_v{major}", f"branch-v{major}")
+                    for major in range(2, 7)
+                },
+                **{
+                    Version(major): Ref(f"v{major}.0.0", f"tag-v{major}")
+                    for major in range(2, 7)
+                },
+            },
+        )
+
     def test_discover_tagged_releases_ignored_versions(self):
         """Testing discover_tagged_releases with an ignored version."""
         strategy = DiscoveryStrategy.create_tagged(
@@ -6,6 +6,7 @@ from parameterized import parameterized
 from responses import matchers
 from pydantic import BaseModel, ValidationError
 
+from manifesttool import github_api
 from manifesttool.appconfig import (
     AppConfig,
     AppConfigs,
@@ -41,6 +42,10 @@ class VersionTests(TestCase):
 
         cls.app_configs = AppConfigs.load_from_directory(MANIFEST_DIR)
 
+    def setUp(self):
+        super().setUp()
+        github_api.reset()
+
     def test_from_match(self):
         """Tesing Version.from_match."""
         self.assertEqual(Version.from_match({"major": "1"}), Version(1))